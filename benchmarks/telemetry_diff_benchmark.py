@@ -0,0 +1,99 @@
+"""
+Per-frame cost of telemetry change diffing in TelemetrySubscriptionManager.
+
+Compares the previous recursive ``vars()`` extraction against the flat
+accessor table, on the same pre-generated mock frames and, for each
+subscription set, the same subscribed fields, so only the diffing mechanism
+differs:
+
+    python benchmarks/telemetry_diff_benchmark.py
+"""
+import copy
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.domain.event.telemetry.telemetry_subscription_manager import (  # noqa: E402
+    TelemetrySubscriptionManager)
+from src.domain.model.telemetry_data import MockTelemetry  # noqa: E402
+
+FRAMES = 500
+REPEAT = 5
+
+SUBSCRIPTION_SETS = {
+    "single field": ["truck.speed"],
+    "handler mix": ["truck.speed", "truck.user_brake", "navigation.*", "job.*"],
+    "everything": ["*"],
+}
+
+
+class LegacyDiff:
+    """
+    The diffing TelemetrySubscriptionManager did before the accessor table,
+    limited to the given field paths.
+    """
+
+    def __init__(self, paths):
+        self.paths = set(paths)
+        # groups on the way to a subscribed field, the only ones descended into
+        self.groups = {
+            path.rsplit(".", 1)[0] for path in self.paths if "." in path
+        }
+        self.last_known_values = {}
+
+    def find_changed_fields(self, telemetry_data):
+        current_values = self._extract_values(telemetry_data)
+        changed_fields = []
+        for field, value in current_values.items():
+            if self.last_known_values.get(field) != value:
+                self.last_known_values[field] = value
+                changed_fields.append(field)
+        return changed_fields
+
+    def _extract_values(self, telemetry_data, prefix=""):
+        values = {}
+        for attr, val in vars(telemetry_data).items():
+            if attr.startswith("_"):
+                continue
+            full_path = f"{prefix}.{attr}".strip(".")
+            if hasattr(val, "__dict__") or isinstance(val, dict):
+                if full_path in self.groups:
+                    values.update(self._extract_values(val, prefix=full_path))
+            elif full_path in self.paths:
+                values[full_path] = val
+        return values
+
+
+def generate_frames(count):
+    mock = MockTelemetry()
+    return [copy.deepcopy(mock.get_telemetry_data()) for _ in range(count)]
+
+
+def per_frame_us(diff, frames):
+    def run():
+        for frame in frames:
+            diff(frame)
+
+    best = min(timeit.repeat(run, number=1, repeat=REPEAT))
+    return best / len(frames) * 1e6
+
+
+def main():
+    frames = generate_frames(FRAMES)
+    print(f"{'subscriptions':<16}{'fields':>8}{'before µs':>12}{'after µs':>12}{'speedup':>10}")
+    for name, patterns in SUBSCRIPTION_SETS.items():
+        manager = TelemetrySubscriptionManager()
+        manager.subscribe(patterns, object())
+        legacy = LegacyDiff(manager.accessors.paths)
+        before = per_frame_us(legacy.find_changed_fields, frames)
+        after = per_frame_us(manager._find_changed_fields, frames)
+        print(
+            f"{name:<16}{len(manager.accessors.paths):>8}"
+            f"{before:>12.2f}{after:>12.2f}{before / after:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
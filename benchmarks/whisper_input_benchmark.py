@@ -0,0 +1,106 @@
+"""
+Cost of getting a finished recording into Whisper, before transcription starts.
+
+Compares the previous path, which built an array from the captured list of
+floats, wrote ``temp_recording.wav`` and had Whisper load it back with ffmpeg,
+against resampling the float32 capture buffer to 16 kHz in memory. Both run on
+the same fixed 8 second clip at the 44.1 kHz capture rate. The model itself is
+not run; its cost is the same for both inputs:
+
+    python benchmarks/whisper_input_benchmark.py
+
+Without the ``whisper`` package the temp file is decoded with the same ffmpeg
+command ``whisper.audio.load_audio`` runs. Without ``ffmpeg`` there is nothing
+to compare against and the benchmark is skipped.
+"""
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import timeit
+
+import numpy as np
+from scipy.io import wavfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.domain.service.speech_listener_providers.capture_buffer import (  # noqa: E402
+    CaptureBuffer)
+from src.domain.service.speech_listener_providers.whisper_audio import (  # noqa: E402
+    WHISPER_SAMPLE_RATE, prepare_whisper_audio)
+
+CAPTURE_RATE = 44100
+CLIP_SECONDS = 8
+REPEAT = 5
+
+
+def fixed_clip():
+    """Deterministic speech-like clip: a few harmonics under an envelope plus noise."""
+    rng = np.random.default_rng(1234)
+    t = np.arange(CAPTURE_RATE * CLIP_SECONDS) / CAPTURE_RATE
+    voice = sum(np.sin(2 * np.pi * f * t) / (i + 1) for i, f in enumerate((140, 280, 420, 900)))
+    envelope = 0.5 + 0.5 * np.sin(2 * np.pi * 3 * t)
+    clip = 0.1 * voice * envelope + 0.01 * rng.standard_normal(t.size)
+    return clip.astype(np.float32)
+
+
+def load_with_ffmpeg(path, sr=WHISPER_SAMPLE_RATE):
+    """What ``whisper.audio.load_audio`` does: decode and resample in an ffmpeg process."""
+    cmd = [
+        "ffmpeg", "-nostdin", "-threads", "0", "-i", path,
+        "-f", "s16le", "-ac", "1", "-acodec", "pcm_s16le", "-ar", str(sr), "-",
+    ]
+    out = subprocess.run(cmd, capture_output=True, check=True).stdout
+    return np.frombuffer(out, np.int16).flatten().astype(np.float32) / 32768.0
+
+
+def previous_loader():
+    """Return ``(name, load)`` for the previous decode path, or None without ffmpeg."""
+    if not shutil.which("ffmpeg"):
+        return None
+    try:
+        from whisper.audio import load_audio
+    except ImportError:
+        return "ffmpeg", load_with_ffmpeg
+    return "whisper.load_audio", load_audio
+
+
+def main():
+    loader = previous_loader()
+    if loader is None:
+        sys.exit(
+            "ffmpeg not found: the previous path decoded the temp WAV with ffmpeg, "
+            "install it to run this benchmark."
+        )
+    variant, previous_load = loader
+    captured = CaptureBuffer(CAPTURE_RATE * CLIP_SECONDS)
+    captured.append(fixed_clip())
+    # the previous listener accumulated Python floats in a list
+    recording = captured.view().tolist()
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, "temp_recording.wav")
+
+    def before():
+        wavfile.write(path, CAPTURE_RATE, np.array(recording, dtype=np.float32))
+        return previous_load(path, sr=WHISPER_SAMPLE_RATE)
+
+    def after():
+        return prepare_whisper_audio(captured.view(), CAPTURE_RATE)
+
+    try:
+        before_ms = min(timeit.repeat(before, number=1, repeat=REPEAT)) * 1000
+        after_ms = min(timeit.repeat(after, number=1, repeat=REPEAT)) * 1000
+        expected = CLIP_SECONDS * WHISPER_SAMPLE_RATE
+        assert len(before()) == len(after()) == expected
+    finally:
+        shutil.rmtree(directory)
+
+    print(f"{CLIP_SECONDS}s clip at {CAPTURE_RATE} Hz -> {WHISPER_SAMPLE_RATE} Hz float32")
+    print(f"{'temp WAV + ' + variant:<36}{before_ms:>10.2f} ms")
+    print(f"{'in-memory resample_poly':<36}{after_ms:>10.2f} ms")
+    print(f"{'speedup':<36}{before_ms / after_ms:>10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
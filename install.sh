@@ -1,4 +1,5 @@
    #!/bin/bash
    # python3 -m spacy download en_core_web_sm
    python3 -m spacy download en_core_web_lg
-   pip install -r requirements.txt
\ No newline at end of file
+   pip install -r requirements.txt
+   python3 -m src.domain.service.city_catalogue
\ No newline at end of file
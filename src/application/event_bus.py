@@ -1,22 +1,225 @@
+import asyncio
+import contextvars
+import functools
+import inspect
 import logging
 import threading
-from collections import defaultdict, deque
-from typing import Any, Callable, Dict, List
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional
 
+from src.application.event_bus_metrics import EventBusMetrics
+from src.application.event_queue import EventQueue
+from src.application.latency_tracer import Trace, current_trace
+from src.config import (EVENT_BUS_CONCURRENCY, EVENT_BUS_DROP_POLICY,
+                        EVENT_BUS_MAX_DEPTH, EVENT_BUS_METRICS_INTERVAL,
+                        EVENT_BUS_METRICS_PATH, EVENT_BUS_MODE,
+                        EVENT_COALESCE, EVENT_NEVER_DROP, EVENT_PRIORITIES)
 from src.shared.helpers.constants import EventCategory, EventType
 
 
+class CategoryDispatcher:
+    """
+    Event queue of one category served by long-lived worker threads.
+
+    Workers are started with the first event and wait on the queue between
+    bursts instead of exiting, so emitting never pays for a thread start.
+    Events are taken by priority, then in emit order; with a concurrency of 1
+    they are also handled one at a time in that order, with more workers they
+    may finish out of order.
+    """
+
+    def __init__(self, category: EventCategory, handle: Callable[[EventCategory, EventType, Any, float, Optional[Trace]], None], concurrency: int = 1, queue: Optional[EventQueue] = None):
+        if concurrency < 1:
+            raise ValueError("Event category concurrency must be at least 1")
+        self.category = category
+        self.handle = handle
+        self.concurrency = concurrency
+        self.queue = queue if queue is not None else EventQueue()
+        self.condition = threading.Condition()
+        self.workers: List[threading.Thread] = []
+        self.busy = 0
+        self.closed = False
+
+    def put(self, event_type: EventType, data: Any, priority: int = 0, coalesce_key: Optional[Hashable] = None, trace: Optional[Trace] = None) -> bool:
+        """Queue an event. Returns False if the bus is closed or the event was dropped."""
+        with self.condition:
+            if self.closed or not self.queue.push(event_type, data, priority, coalesce_key, trace):
+                return False
+            idle = len(self.workers) - self.busy
+            if len(self.workers) < self.concurrency and len(self.queue) > idle:
+                self._start_worker()
+            self.condition.notify()
+        return True
+
+    def _start_worker(self):
+        worker = threading.Thread(
+            target=self._run,
+            name=f"EventBus-{self.category.name}-{len(self.workers)}",
+            daemon=True,
+        )
+        self.workers.append(worker)
+        worker.start()
+
+    def _run(self):
+        while True:
+            with self.condition:
+                while not self.queue and not self.closed:
+                    self.condition.wait()
+                if not self.queue:
+                    return
+                item = self.queue.pop()
+                self.busy += 1
+            try:
+                self.handle(self.category, *item)
+            finally:
+                with self.condition:
+                    self.busy -= 1
+                    self.condition.notify_all()
+
+    def pending(self) -> int:
+        """Events queued or being handled."""
+        with self.condition:
+            return len(self.queue) + self.busy
+
+    def close(self, drain: bool = True) -> int:
+        """Stop accepting events; unless draining, drop the queued ones. Returns the dropped count."""
+        with self.condition:
+            self.closed = True
+            dropped = 0 if drain else self.queue.clear()
+            self.condition.notify_all()
+        return dropped
+
+    def join(self, timeout: Optional[float] = None):
+        for worker in self.workers:
+            if worker is not threading.current_thread():
+                worker.join(timeout)
+
+
+class AsyncCategoryDispatcher:
+    """
+    Event queue of one category served by consumer tasks on the bus's event loop.
+
+    Events may be emitted from any thread; they are handed to the loop with
+    ``call_soon_threadsafe``. Events emitted before the loop is attached stay
+    in the queue until it starts.
+    """
+
+    def __init__(self, category: EventCategory, handle: Callable[[EventCategory, EventType, Any, float, Optional[Trace]], Awaitable[None]], concurrency: int = 1, queue: Optional[EventQueue] = None):
+        if concurrency < 1:
+            raise ValueError("Event category concurrency must be at least 1")
+        self.category = category
+        self.handle = handle
+        self.concurrency = concurrency
+        self.queue = queue if queue is not None else EventQueue()
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.available: Optional[asyncio.Event] = None
+        self.tasks: List[asyncio.Task] = []
+        self.lock = threading.Lock()
+        self.busy = 0
+        self.closed = False
+
+    def start(self, loop: asyncio.AbstractEventLoop):
+        """Create the consumer tasks; must run on ``loop``."""
+        with self.lock:
+            self.loop = loop
+            self.available = asyncio.Event()
+            if self.queue:
+                self.available.set()
+        self.tasks = [
+            loop.create_task(self._run(), name=f"EventBus-{self.category.name}-{index}")
+            for index in range(self.concurrency)
+        ]
+
+    def put(self, event_type: EventType, data: Any, priority: int = 0, coalesce_key: Optional[Hashable] = None, trace: Optional[Trace] = None) -> bool:
+        """
+        Queue an event. Returns False if the bus is closed, or if the loop is
+        not attached yet and the event was dropped; once attached, drops are
+        decided on the loop and only show in the queue's counters.
+        """
+        with self.lock:
+            if self.closed:
+                return False
+            if self.loop is None:
+                return self.queue.push(event_type, data, priority, coalesce_key, trace)
+        self.loop.call_soon_threadsafe(self._push, event_type, data, priority, coalesce_key, trace)
+        return True
+
+    def _push(self, event_type: EventType, data: Any, priority: int, coalesce_key: Optional[Hashable], trace: Optional[Trace]):
+        if self.queue.push(event_type, data, priority, coalesce_key, trace):
+            self.available.set()
+
+    async def _run(self):
+        while True:
+            while not self.queue:
+                if self.closed:
+                    return
+                self.available.clear()
+                await self.available.wait()
+            item = self.queue.pop()
+            self.busy += 1
+            try:
+                await self.handle(self.category, *item)
+            finally:
+                self.busy -= 1
+
+    def pending(self) -> int:
+        """Events queued or being handled."""
+        return len(self.queue) + self.busy
+
+    async def close(self, drain: bool = True) -> int:
+        """Stop accepting events, drain or drop the queue and wait for the consumers."""
+        with self.lock:
+            self.closed = True
+        dropped = 0 if drain else self.queue.clear()
+        if self.available is not None:
+            self.available.set()
+            await asyncio.gather(*self.tasks, return_exceptions=True)
+        return dropped
+
+
 class EventBus:
     """
     Manages events within the plugin with support for categorized event handling.
     Includes a mechanism to prevent event overlap by using state management.
+
+    Each category has its own ordered queue served by a small pool of
+    long-lived workers; the pool size per category comes from
+    ``EVENT_BUS_CONCURRENCY`` (default 1).
+
+    In ``"async"`` mode (``EVENT_BUS_MODE``) the queues are ``asyncio`` queues
+    consumed on the running loop once ``start`` has been awaited. Handlers may
+    then be ``async def`` and run concurrently on the loop, while blocking
+    handlers are offloaded to a shared thread pool.
+
+    Within a category, events are ordered by priority (``EVENT_PRIORITIES`` or
+    the ``priority`` passed to ``emit``). Event types listed in
+    ``EVENT_COALESCE`` are latest-only, per event type or per emitting source,
+    and ``EVENT_BUS_MAX_DEPTH`` bounds a category's queue, dropping events by
+    ``EVENT_BUS_DROP_POLICY`` when it is full; ``EVENT_NEVER_DROP`` events are
+    exempt from both.
+
+    Event counts, queue depths, wait times and handler times are recorded in
+    ``metrics`` and dumped every ``EVENT_BUS_METRICS_INTERVAL`` seconds once
+    the bus is started. The latency trace current at emit time travels with
+    the event and is current again while its handlers run.
     """
 
-    def __init__(self) -> None:
+    MODES = ("threads", "async")
+
+    def __init__(self, concurrency: Optional[Dict[str, int]] = None, mode: Optional[str] = None) -> None:
         self.handlers: Dict[EventType, List[Callable[[Any], None]]] = defaultdict(list)
-        self.queues: Dict[EventCategory, deque] = defaultdict(deque)
-        self.locks: Dict[EventCategory, threading.Lock] = defaultdict(threading.Lock)
-        self.active_threads: Dict[EventCategory, threading.Thread] = {}
+        self.concurrency = EVENT_BUS_CONCURRENCY if concurrency is None else concurrency
+        self.mode = EVENT_BUS_MODE if mode is None else mode
+        if self.mode not in self.MODES:
+            raise ValueError(f"Unknown event bus mode '{self.mode}'")
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.executor: Optional[ThreadPoolExecutor] = None
+        self.metrics = EventBusMetrics()
+        self.dispatchers: Dict[EventCategory, CategoryDispatcher] = {}
+        self.dispatchers_lock = threading.Lock()
+        self.closed = False
         self.state_flags: Dict[EventType, bool] = defaultdict(bool)
         self.telemetry_handlers_blocked: bool = False
 
@@ -37,7 +240,7 @@ class EventBus:
     def unsubscribe(self, event_type: str, handler: Callable[[Any], None]) -> None:
         """Unsubscribes a handler from a specific type of event."""
         self.handlers[event_type] = [
-            (h, c) for h, c in self.handlers[event_type] if h != handler
+            h for h in self.handlers[event_type] if h != handler
         ]
 
     def emit(
@@ -45,43 +248,129 @@ class EventBus:
         event_type: EventType,
         data: Any,
         category: EventCategory = EventCategory.GENERIC,
+        priority: Optional[int] = None,
+        source: Optional[str] = None,
     ):
-        with self.locks[category]:
-            self.queues[category].append((event_type, data))
-            if (
-                category not in self.active_threads
-                or not self.active_threads[category].is_alive()
-            ):
-                self.active_threads[category] = threading.Thread(
-                    target=self.process_queue, args=(category,)
-                )
-                self.active_threads[category].start()
-
-    def process_event(self, event_type: EventType, data: Any, category: EventCategory):
-        """Processes the event and invokes registered handlers."""
-        with self.locks[category]:
-            if (
-                category not in self.active_threads
-                or not self.active_threads[category].is_alive()
-            ):
-                thread = threading.Thread(
-                    target=self._handle_event, args=(event_type, data)
-                )
-                thread.start()
-                self.active_threads[category] = thread
+        """
+        Queue an event on its category; handlers run on the category's workers.
+        ``source`` names the emitter, e.g. a telemetry handler, for coalescing.
+        """
+        dispatcher = self.get_dispatcher(category)
+        if dispatcher.closed:
+            logging.warning(f"[EventBus] Dropped {event_type} emitted after shutdown.")
+            return
+        self.metrics.record_emit(category, event_type)
+        if priority is None:
+            priority = EVENT_PRIORITIES.get(event_type.name, 0)
+        coalesce_key = self.coalesce_key(event_type, source)
+        if not dispatcher.put(event_type, data, priority, coalesce_key, current_trace.get()):
+            logging.info(f"[EventBus] {category.name} queue full, dropped {event_type}.")
+
+    @staticmethod
+    def coalesce_key(event_type: EventType, source: Optional[str]) -> Optional[Hashable]:
+        """Key under which queued events replace each other, None when they do not."""
+        policy = EVENT_COALESCE.get(event_type.name)
+        if policy == "type":
+            return event_type
+        if policy == "source" and source is not None:
+            return (event_type, source)
+        return None
+
+    def get_dispatcher(self, category: EventCategory):
+        dispatcher = self.dispatchers.get(category)
+        if dispatcher is None:
+            with self.dispatchers_lock:
+                dispatcher = self.dispatchers.get(category)
+                if dispatcher is None:
+                    concurrency = self.concurrency.get(category.name, 1)
+                    queue = EventQueue(
+                        EVENT_BUS_MAX_DEPTH.get(category.name),
+                        EVENT_BUS_DROP_POLICY,
+                        category,
+                        self.metrics,
+                        [EventType[name] for name in EVENT_NEVER_DROP],
+                    )
+                    if self.mode == "async":
+                        dispatcher = AsyncCategoryDispatcher(
+                            category, self._handle_event_async, concurrency, queue
+                        )
+                        dispatcher.closed = self.closed
+                        if self.loop is not None and not self.closed:
+                            self.loop.call_soon_threadsafe(dispatcher.start, self.loop)
+                    else:
+                        dispatcher = CategoryDispatcher(
+                            category, self._handle_event, concurrency, queue
+                        )
+                        if self.closed:
+                            dispatcher.close()
+                    self.dispatchers[category] = dispatcher
+        return dispatcher
+
+    async def start(self) -> None:
+        """
+        Start the periodic metrics dump and, in async mode, attach the bus to the
+        running event loop; events emitted before this are queued until then.
+        """
+        self.metrics.start_periodic_dump(EVENT_BUS_METRICS_INTERVAL, EVENT_BUS_METRICS_PATH)
+        if self.mode != "async":
+            return
+        # set under the lock, so get_dispatcher either starts a new dispatcher
+        # itself or leaves it in the snapshot started here, never both
+        with self.dispatchers_lock:
+            self.executor = ThreadPoolExecutor(thread_name_prefix="EventBus")
+            self.loop = asyncio.get_running_loop()
+            dispatchers = list(self.dispatchers.values())
+        for dispatcher in dispatchers:
+            dispatcher.start(self.loop)
 
-    def process_queue(self, category: EventCategory):
-        while self.queues[category]:
-            with self.locks[category]:
-                event_type, data = self.queues[category].popleft()
-            self._handle_event(event_type, data)
+    def _handle_event(self, category: EventCategory, event_type: EventType, data: Any, enqueued_at: float, trace: Optional[Trace]):
+        self.metrics.record_wait(category, event_type, time.perf_counter() - enqueued_at)
+        token = current_trace.set(trace)
+        try:
+            self._run_handlers(event_type, data)
+        finally:
+            current_trace.reset(token)
 
-    def _handle_event(self, event_type: EventType, data: Any):
+    def _run_handlers(self, event_type: EventType, data: Any):
         for handler in self.handlers[event_type]:
+            started = time.perf_counter()
             try:
-                handler(data)
+                result = handler(data)
+                if inspect.isawaitable(result):
+                    # coroutine handler on a worker thread, run it to completion here
+                    asyncio.run(result)
             except Exception as e:
                 logging.error(f"[EventBus] Error handling event {event_type}: {e}")
+            self.metrics.record_handler(
+                event_type, _handler_name(handler), time.perf_counter() - started
+            )
+
+    async def _handle_event_async(self, category: EventCategory, event_type: EventType, data: Any, enqueued_at: float, trace: Optional[Trace]):
+        self.metrics.record_wait(category, event_type, time.perf_counter() - enqueued_at)
+        token = current_trace.set(trace)
+        try:
+            await self._run_handlers_async(event_type, data)
+        finally:
+            current_trace.reset(token)
+
+    async def _run_handlers_async(self, event_type: EventType, data: Any):
+        for handler in list(self.handlers[event_type]):
+            started = time.perf_counter()
+            try:
+                if inspect.iscoroutinefunction(handler):
+                    await handler(data)
+                else:
+                    # blocking legacy handler, keep it off the loop
+                    # the executor does not carry context variables, hand the trace over
+                    call = functools.partial(contextvars.copy_context().run, handler, data)
+                    result = await self.loop.run_in_executor(self.executor, call)
+                    if inspect.isawaitable(result):
+                        await result
+            except Exception as e:
+                logging.error(f"[EventBus] Error handling event {event_type}: {e}")
+            self.metrics.record_handler(
+                event_type, _handler_name(handler), time.perf_counter() - started
+            )
 
     def is_blocked(self) -> bool:
         """Checks if any critical event is currently active that should block other events."""
@@ -99,7 +388,59 @@ class EventBus:
         """Sets the active state for a given type of event."""
         self.state_flags[event_type] = active
 
-    def shutdown(self) -> None:
-        """Ensures all threads have completed before shutting down."""
-        for thread in self.active_threads.values():
-            thread.join()
+    def shutdown(self, drain: bool = True, timeout: Optional[float] = None) -> None:
+        """
+        Stop accepting events and wait for the workers to finish. With ``drain``
+        the queued events are handled first, otherwise they are dropped.
+        """
+        self.metrics.stop_periodic_dump()
+        if self.mode == "async" and self.loop is not None:
+            future = asyncio.run_coroutine_threadsafe(self.shutdown_async(drain), self.loop)
+            if self._on_loop_thread():
+                # cannot block the loop we are waiting on, the shutdown runs as a task
+                return
+            future.result(timeout)
+            return
+
+        with self.dispatchers_lock:
+            self.closed = True
+            dispatchers = list(self.dispatchers.values())
+        if self.mode == "async":
+            # never started, only the queued events have to go
+            for dispatcher in dispatchers:
+                dispatcher.closed = True
+                dispatcher.queue.clear()
+            return
+        for dispatcher in dispatchers:
+            dropped = dispatcher.close(drain)
+            if dropped:
+                logging.info(
+                    f"[EventBus] Dropped {dropped} queued {dispatcher.category.name} events on shutdown."
+                )
+        for dispatcher in dispatchers:
+            dispatcher.join(timeout)
+
+    async def shutdown_async(self, drain: bool = True) -> None:
+        """Async mode counterpart of ``shutdown``, awaited on the bus's loop."""
+        self.metrics.stop_periodic_dump()
+        with self.dispatchers_lock:
+            self.closed = True
+            dispatchers = list(self.dispatchers.values())
+        for dispatcher in dispatchers:
+            dropped = await dispatcher.close(drain)
+            if dropped:
+                logging.info(
+                    f"[EventBus] Dropped {dropped} queued {dispatcher.category.name} events on shutdown."
+                )
+        if self.executor is not None:
+            self.executor.shutdown(wait=False)
+
+    def _on_loop_thread(self) -> bool:
+        try:
+            return asyncio.get_running_loop() is self.loop
+        except RuntimeError:
+            return False
+
+
+def _handler_name(handler: Callable) -> str:
+    return getattr(handler, "__qualname__", None) or repr(handler)
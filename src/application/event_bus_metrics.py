@@ -0,0 +1,213 @@
+import json
+import logging
+import math
+import threading
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+from src.shared.helpers.constants import EventCategory, EventType
+
+
+class Histogram:
+    """
+    Fixed-bucket histogram with geometric bucket bounds.
+
+    Recording is a bisect and a few additions, so it is cheap enough to run on
+    every event. Percentiles are estimated as the upper bound of the bucket
+    they fall in, clamped to the observed maximum.
+    """
+
+    def __init__(self, bounds: List[float]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+
+    @classmethod
+    def geometric(cls, start: float, factor: float, buckets: int) -> "Histogram":
+        return cls([start * factor ** index for index in range(buckets)])
+
+    def record(self, value: float):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        if value < self.minimum:
+            self.minimum = value
+        if value > self.maximum:
+            self.maximum = value
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Estimate the ``q`` percentile (0-100), None when nothing was recorded."""
+        if not self.count:
+            return None
+        rank = max(1, math.ceil(self.count * q / 100))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                bound = self.bounds[index] if index < len(self.bounds) else self.maximum
+                return min(bound, self.maximum)
+        return self.maximum
+
+    def summary(self) -> Dict[str, Optional[float]]:
+        if not self.count:
+            return {"count": 0}
+        return {
+            "count": self.count,
+            "mean": self.total / self.count,
+            "min": self.minimum,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+            "max": self.maximum,
+        }
+
+
+def latency_histogram() -> Histogram:
+    # 10µs .. ~170s in factor-2 steps
+    return Histogram.geometric(1e-5, 2.0, 25)
+
+
+def depth_histogram() -> Histogram:
+    return Histogram([0, 1, 2, 4, 8, 16, 32, 64, 128, 256])
+
+
+class EventBusMetrics:
+    """
+    In-process metrics of an EventBus.
+
+    Counts emitted, dropped and coalesced events per (category, event type),
+    tracks queue depth per category, and keeps histograms of the time events
+    wait between emit and the first handler starting, and of every handler's
+    execution time. ``snapshot`` returns everything as plain data and
+    ``start_periodic_dump`` logs it, or appends it to a JSON lines file, at an
+    interval.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.started_at = time.time()
+        self.counters: Dict[Tuple[str, str], Dict[str, int]] = defaultdict(
+            lambda: {"emitted": 0, "dropped": 0, "coalesced": 0}
+        )
+        self.depth: Dict[str, Dict[str, int]] = defaultdict(lambda: {"current": 0, "max": 0})
+        self.depth_histograms: Dict[str, Histogram] = defaultdict(depth_histogram)
+        self.wait_times: Dict[Tuple[str, str], Histogram] = defaultdict(latency_histogram)
+        self.handler_times: Dict[Tuple[str, str], Histogram] = defaultdict(latency_histogram)
+        self.dump_thread: Optional[threading.Thread] = None
+        self.dump_stop = threading.Event()
+
+    def record_emit(self, category: EventCategory, event_type: EventType):
+        with self.lock:
+            self.counters[(category.name, event_type.name)]["emitted"] += 1
+
+    def record_discard(self, category: EventCategory, event_type: EventType, reason: str):
+        """Count an event that was ``"dropped"`` or ``"coalesced"`` away by the queue."""
+        with self.lock:
+            self.counters[(category.name, event_type.name)][reason] += 1
+
+    def record_depth(self, category: EventCategory, depth: int):
+        with self.lock:
+            gauge = self.depth[category.name]
+            gauge["current"] = depth
+            if depth > gauge["max"]:
+                gauge["max"] = depth
+            self.depth_histograms[category.name].record(depth)
+
+    def record_wait(self, category: EventCategory, event_type: EventType, seconds: float):
+        with self.lock:
+            self.wait_times[(category.name, event_type.name)].record(seconds)
+
+    def record_handler(self, event_type: EventType, handler_name: str, seconds: float):
+        with self.lock:
+            self.handler_times[(event_type.name, handler_name)].record(seconds)
+
+    def get_wait_time(self, category: EventCategory, event_type: EventType) -> Dict[str, Optional[float]]:
+        """Summary of the emit-to-start wait of one event type in one category."""
+        with self.lock:
+            histogram = self.wait_times.get((category.name, event_type.name))
+            return histogram.summary() if histogram else {"count": 0}
+
+    def get_handler_time(self, event_type: EventType, handler_name: Optional[str] = None) -> Dict[str, Dict]:
+        """Summaries of handler execution times for an event type, optionally one handler."""
+        with self.lock:
+            return {
+                name: histogram.summary()
+                for (event_name, name), histogram in self.handler_times.items()
+                if event_name == event_type.name and handler_name in (None, name)
+            }
+
+    def snapshot(self) -> Dict:
+        """All metrics as JSON-serializable data."""
+        with self.lock:
+            return {
+                "timestamp": time.time(),
+                "uptime": time.time() - self.started_at,
+                "events": {
+                    f"{category}.{event_type}": dict(counters)
+                    for (category, event_type), counters in self.counters.items()
+                },
+                "queue_depth": {
+                    category: dict(gauge, histogram=self.depth_histograms[category].summary())
+                    for category, gauge in self.depth.items()
+                },
+                "wait_time": {
+                    f"{category}.{event_type}": histogram.summary()
+                    for (category, event_type), histogram in self.wait_times.items()
+                },
+                "handler_time": {
+                    f"{event_type}.{handler}": histogram.summary()
+                    for (event_type, handler), histogram in self.handler_times.items()
+                },
+            }
+
+    def dump(self, path: Optional[str] = None):
+        """Log the snapshot, or append it as one JSON line to ``path``."""
+        snapshot = self.snapshot()
+        if path:
+            with open(path, "a", encoding="utf-8") as file:
+                file.write(json.dumps(snapshot) + "\n")
+            return
+        for name, summary in sorted(snapshot["wait_time"].items()):
+            logging.info(f"[EventBusMetrics] wait {name}: {_format_summary(summary)}")
+        for name, summary in sorted(snapshot["handler_time"].items()):
+            logging.info(f"[EventBusMetrics] handler {name}: {_format_summary(summary)}")
+        for name, counters in sorted(snapshot["events"].items()):
+            logging.info(f"[EventBusMetrics] events {name}: {counters}")
+
+    def start_periodic_dump(self, interval: float, path: Optional[str] = None):
+        """Dump the metrics every ``interval`` seconds on a daemon thread."""
+        if self.dump_thread is not None or interval <= 0:
+            return
+        self.dump_stop.clear()
+
+        def run():
+            while not self.dump_stop.wait(interval):
+                try:
+                    self.dump(path)
+                except Exception as e:
+                    logging.error(f"[EventBusMetrics] Failed to dump metrics: {e}")
+
+        self.dump_thread = threading.Thread(target=run, name="EventBusMetrics", daemon=True)
+        self.dump_thread.start()
+
+    def stop_periodic_dump(self):
+        if self.dump_thread is None:
+            return
+        self.dump_stop.set()
+        self.dump_thread.join()
+        self.dump_thread = None
+
+
+def _format_summary(summary: Dict[str, Optional[float]]) -> str:
+    if not summary.get("count"):
+        return "no samples"
+    return (
+        f"n={summary['count']} mean={summary['mean'] * 1000:.2f}ms "
+        f"p50={summary['p50'] * 1000:.2f}ms p95={summary['p95'] * 1000:.2f}ms "
+        f"max={summary['max'] * 1000:.2f}ms"
+    )
@@ -0,0 +1,161 @@
+import heapq
+import itertools
+import logging
+import time
+from typing import (Any, Collection, Dict, Hashable, List, Optional, Set,
+                    Tuple)
+
+from src.application.event_bus_metrics import EventBusMetrics
+from src.application.latency_tracer import Trace
+from src.shared.helpers.constants import EventCategory, EventType
+
+# what happens to an event pushed onto a full queue
+DROP_NEWEST = "drop_newest"  # the incoming event is dropped
+DROP_OLDEST = "drop_oldest"  # the oldest queued event is dropped
+DROP_LOWEST = "drop_lowest"  # the oldest event of the lowest priority is dropped
+DROP_POLICIES = (DROP_NEWEST, DROP_OLDEST, DROP_LOWEST)
+
+# entry layout: [-priority, sequence, event_type, data, coalesce_key, live, enqueued_at, trace]
+_PRIORITY, _SEQUENCE, _EVENT_TYPE, _DATA, _KEY, _LIVE, _ENQUEUED_AT, _TRACE = range(8)
+
+
+class EventQueue:
+    """
+    Priority queue of pending events for one EventBus category.
+
+    Higher priorities are handled first and events of equal priority keep
+    their emit order. Events pushed with a coalescing key are latest-only:
+    a newer event with the same key replaces the queued one, so a backlog
+    never holds stale copies of the same message. ``max_depth`` bounds the
+    queue and ``drop_policy`` decides what is dropped when it is full.
+    Event types in ``never_drop``, such as the sentences of a response that
+    is being spoken, are neither counted against ``max_depth`` nor dropped.
+
+    With ``metrics``, depth changes and dropped or coalesced events are
+    recorded under ``category``.
+
+    Not thread-safe; the dispatchers guard it with their own lock or loop.
+    """
+
+    def __init__(
+        self,
+        max_depth: Optional[int] = None,
+        drop_policy: str = DROP_LOWEST,
+        category: EventCategory = EventCategory.GENERIC,
+        metrics: Optional[EventBusMetrics] = None,
+        never_drop: Collection[EventType] = (),
+    ):
+        if drop_policy not in DROP_POLICIES:
+            raise ValueError(f"Unknown drop policy '{drop_policy}'")
+        self.category = category
+        self.metrics = metrics
+        self.max_depth = max_depth
+        self.drop_policy = drop_policy
+        self.never_drop: Set[EventType] = set(never_drop)
+        self.heap: List[list] = []
+        self.keyed: Dict[Hashable, list] = {}
+        self.sequence = itertools.count()
+        self.size = 0
+        # queued never_drop events, outside the depth limit
+        self.protected = 0
+        self.dropped = 0
+        self.coalesced = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def push(self, event_type: EventType, data: Any, priority: int = 0, coalesce_key: Optional[Hashable] = None, trace: Optional[Trace] = None) -> bool:
+        """Queue an event with the trace it was emitted under. Returns False if the event itself was dropped."""
+        if coalesce_key is not None:
+            queued = self.keyed.get(coalesce_key)
+            if queued is not None and queued[_LIVE]:
+                # latest-only: the queued copy is stale, replace it
+                self._remove(queued)
+                self.coalesced += 1
+                self._record_discard(queued[_EVENT_TYPE], "coalesced")
+
+        protected = event_type in self.never_drop
+        if (
+            not protected
+            and self.max_depth is not None
+            and self.size - self.protected >= self.max_depth
+        ):
+            victim = self._drop_candidate(priority)
+            self.dropped += 1
+            if victim is None:
+                logging.debug(f"[EventQueue] Queue full, dropped incoming {event_type}")
+                self._record_discard(event_type, "dropped")
+                return False
+            logging.debug(f"[EventQueue] Queue full, dropped queued {victim[_EVENT_TYPE]}")
+            self._remove(victim)
+            self._record_discard(victim[_EVENT_TYPE], "dropped")
+
+        entry = [
+            -priority, next(self.sequence), event_type, data, coalesce_key, True, time.perf_counter(), trace
+        ]
+        heapq.heappush(self.heap, entry)
+        if coalesce_key is not None:
+            self.keyed[coalesce_key] = entry
+        self.size += 1
+        if protected:
+            self.protected += 1
+        if self.metrics is not None:
+            self.metrics.record_depth(self.category, self.size)
+        return True
+
+    def pop(self) -> Tuple[EventType, Any, float, Optional[Trace]]:
+        """
+        Remove and return the next ``(event_type, data, enqueued_at, trace)``,
+        where ``enqueued_at`` is the ``perf_counter`` time of the push. Raises
+        IndexError when empty.
+        """
+        while self.heap:
+            entry = heapq.heappop(self.heap)
+            if not entry[_LIVE]:
+                continue
+            self._forget(entry)
+            if self.metrics is not None:
+                self.metrics.record_depth(self.category, self.size)
+            return entry[_EVENT_TYPE], entry[_DATA], entry[_ENQUEUED_AT], entry[_TRACE]
+        raise IndexError("pop from an empty EventQueue")
+
+    def _record_discard(self, event_type: EventType, reason: str):
+        if self.metrics is not None:
+            self.metrics.record_discard(self.category, event_type, reason)
+
+    def clear(self) -> int:
+        """Drop every queued event and return how many there were."""
+        size = self.size
+        self.heap.clear()
+        self.keyed.clear()
+        self.size = 0
+        self.protected = 0
+        return size
+
+    def _remove(self, entry: list):
+        # lazy deletion, the heap skips dead entries when popping
+        entry[_LIVE] = False
+        self._forget(entry)
+
+    def _forget(self, entry: list):
+        self.size -= 1
+        if entry[_EVENT_TYPE] in self.never_drop:
+            self.protected -= 1
+        if entry[_KEY] is not None and self.keyed.get(entry[_KEY]) is entry:
+            del self.keyed[entry[_KEY]]
+
+    def _drop_candidate(self, priority: int) -> Optional[list]:
+        """The queued entry to drop for an incoming event, or None to drop the incoming one."""
+        live = [
+            entry for entry in self.heap
+            if entry[_LIVE] and entry[_EVENT_TYPE] not in self.never_drop
+        ]
+        if self.drop_policy == DROP_NEWEST or not live:
+            return None
+        if self.drop_policy == DROP_OLDEST:
+            return min(live, key=lambda entry: entry[_SEQUENCE])
+        lowest = max(live, key=lambda entry: (entry[_PRIORITY], -entry[_SEQUENCE]))
+        # an incoming event below everything queued is the one to go
+        if -lowest[_PRIORITY] > priority:
+            return None
+        return lowest
@@ -0,0 +1,162 @@
+import json
+import logging
+import math
+import os
+import threading
+import time
+import uuid
+from collections import deque
+from contextvars import ContextVar
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from src.config import LATENCY_TRACE_PATH, LATENCY_TRACE_WINDOW
+
+# stage whose first mark ends the time-to-first-audio of a turn
+FIRST_AUDIO_STAGE = "audio_start"
+
+
+class Trace:
+    """
+    One conversational turn, identified by a correlation id.
+
+    Stages are marked with ``perf_counter`` timestamps as the turn moves from
+    service to service; the EventBus carries the trace along with every event
+    emitted while it is current.
+    """
+
+    def __init__(self, kind: str):
+        self.id = uuid.uuid4().hex[:12]
+        self.kind = kind
+        self.started_at = time.time()
+        self.marks: List[Tuple[str, float]] = []
+        self.finished = False
+
+    def mark(self, stage: str):
+        self.marks.append((stage, time.perf_counter()))
+
+    def elapsed(self, stage: str) -> Optional[float]:
+        """Seconds from the first mark to the first mark of ``stage``, None if not reached."""
+        for name, at in self.marks:
+            if name == stage:
+                return at - self.marks[0][1]
+        return None
+
+    def breakdown(self) -> Dict[str, Any]:
+        """The turn as plain data, with each stage's offset and delta in milliseconds."""
+        origin = self.marks[0][1]
+        previous = origin
+        stages = []
+        for name, at in self.marks:
+            stages.append(
+                {
+                    "stage": name,
+                    "at_ms": round((at - origin) * 1000, 3),
+                    "delta_ms": round((at - previous) * 1000, 3),
+                }
+            )
+            previous = at
+        first_audio = self.elapsed(FIRST_AUDIO_STAGE)
+        return {
+            "id": self.id,
+            "kind": self.kind,
+            "started_at": self.started_at,
+            "stages": stages,
+            "total_ms": round((previous - origin) * 1000, 3),
+            "time_to_first_audio_ms": None if first_audio is None else round(first_audio * 1000, 3),
+        }
+
+
+# the trace of the turn being handled in the current thread or task
+current_trace: ContextVar[Optional[Trace]] = ContextVar("current_trace", default=None)
+
+
+class LatencyTracer:
+    """
+    Traces conversational turns from the end of the user's speech to the
+    co-driver's audio playback.
+
+    ``start`` opens a trace and makes it current, ``mark`` timestamps a stage
+    of the current trace and ``finish`` closes it: the per-stage breakdown is
+    logged, appended as one JSON line to ``path`` when set, and the turn's
+    time-to-first-audio joins the rolling window behind ``get_stats``.
+    """
+
+    def __init__(self, path: Optional[str] = None, window: int = 50):
+        self.path = path
+        self.lock = threading.Lock()
+        self.first_audio: Deque[float] = deque(maxlen=window)
+        self.turns = 0
+
+    def start(self, kind: str, stage: str) -> Trace:
+        """Open a trace with its first stage and make it the current one."""
+        trace = Trace(kind)
+        trace.mark(stage)
+        current_trace.set(trace)
+        return trace
+
+    def mark(self, stage: str):
+        """Timestamp a stage of the current trace, if there is one."""
+        trace = current_trace.get()
+        if trace is not None and not trace.finished:
+            trace.mark(stage)
+
+    def finish(self, stage: str, outcome: str = "ok") -> Optional[Dict[str, Any]]:
+        """Mark the last stage of the current trace and record it; returns the breakdown."""
+        trace = current_trace.get()
+        if trace is None or trace.finished:
+            return None
+        trace.mark(stage)
+        trace.finished = True
+        record = trace.breakdown()
+        record["outcome"] = outcome
+
+        with self.lock:
+            self.turns += 1
+            if record["time_to_first_audio_ms"] is not None:
+                self.first_audio.append(record["time_to_first_audio_ms"] / 1000)
+            record["rolling"] = self._stats()
+            if self.path:
+                try:
+                    os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+                    with open(self.path, "a", encoding="utf-8") as file:
+                        file.write(json.dumps(record) + "\n")
+                except OSError as e:
+                    logging.error(f"[LatencyTracer] Failed to write trace: {e}")
+
+        logging.info(f"[LatencyTracer] {_format_record(record)}")
+        return record
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Rolling p50/p95 of time-to-first-audio, in seconds, over the last turns."""
+        with self.lock:
+            return self._stats()
+
+    def _stats(self) -> Dict[str, Any]:
+        samples = sorted(self.first_audio)
+        return {
+            "turns": self.turns,
+            "window": len(samples),
+            "p50": _percentile(samples, 50),
+            "p95": _percentile(samples, 95),
+        }
+
+
+def _percentile(samples: List[float], q: float) -> Optional[float]:
+    if not samples:
+        return None
+    return samples[max(0, math.ceil(len(samples) * q / 100) - 1)]
+
+
+def _format_record(record: Dict[str, Any]) -> str:
+    stages = " -> ".join(
+        f"{stage['stage']} +{stage['delta_ms']:.0f}ms" for stage in record["stages"]
+    )
+    text = f"Turn {record['id']} ({record['kind']}, {record['outcome']}): {stages}"
+    if record["time_to_first_audio_ms"] is not None:
+        rolling = record["rolling"]
+        text += f"; first audio after {record['time_to_first_audio_ms'] / 1000:.2f}s"
+        text += f" (p50 {rolling['p50']:.2f}s, p95 {rolling['p95']:.2f}s over {rolling['window']} turns)"
+    return text
+
+
+tracer = LatencyTracer(LATENCY_TRACE_PATH, LATENCY_TRACE_WINDOW)
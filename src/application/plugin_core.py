@@ -9,16 +9,22 @@ from src.application.event_bus import EventBus
 from src.application.interface.module_interface import ModuleInterface
 from src.application.session_management import SessionManagement
 from src.application.setup_management import SetupManagement
+from src.config import (AUDIO_OUTPUT_DEVICE, AUDIO_OUTPUT_LATENCY,
+                        AUDIO_OUTPUT_SAMPLE_RATE, SPECULATION_BUDGET_PER_HOUR,
+                        SPECULATION_ENABLED, SPECULATION_TTL)
 from src.domain.event.telemetry.telemetry_subscription_manager import \
     TelemetrySubscriptionManager
 from src.domain.service.audio_input_service import AudioInputService
 from src.domain.service.dialogue_manager_service import DialogueManager
+from src.domain.service.speculative_response_service import \
+    SpeculativeResponseService
 from src.domain.service.speech_output_service import SpeechOutputService
 from src.domain.service.telemetry_client_service import TelemetryClientService
 from src.factories.ai_provider_factory import AIProviderFactory
 from src.factories.dynamic_session_provider_factory import \
     DynamicSessionProviderFactory
 from src.factories.speech_listener_factory import SpeechListenerFactory
+from src.infrastructure.input_output.audio_player import AudioPlayer
 from src.infrastructure.input_output.keyboard_manager import KeyboardManager
 from src.shared.helpers.constants import AIProviderType
 
@@ -63,6 +69,16 @@ class PluginCore:
             session_manager=self.session_manager,
             text_to_text_provider=self.text_to_text_provider,
         )
+        self.speculative_response_service = None
+        if SPECULATION_ENABLED:
+            self.speculative_response_service = SpeculativeResponseService(
+                event_bus=self.event_bus,
+                dialogue_manager=self.dialogue_manager,
+                text_to_audio_provider=self.text_to_audio_provider,
+                ttl=SPECULATION_TTL,
+                budget_per_hour=SPECULATION_BUDGET_PER_HOUR,
+            )
+            self.dialogue_manager.speculation = self.speculative_response_service
 
         self.speech_listener = SpeechListenerFactory.create_speech_listener(
             listener_type=listener_type, event_bus=self.event_bus
@@ -75,12 +91,17 @@ class PluginCore:
         self.speech_output_service = SpeechOutputService(
             event_bus=self.event_bus,
             text_to_audio_provider=self.text_to_audio_provider,
-            audio_output_path="./",
+            audio_player=AudioPlayer(
+                device=AUDIO_OUTPUT_DEVICE,
+                samplerate=AUDIO_OUTPUT_SAMPLE_RATE,
+                latency=AUDIO_OUTPUT_LATENCY,
+            ),
         )
 
         self.telemetry_subscription_manager = TelemetrySubscriptionManager()
         self.telemetry_client = TelemetryClientService(
-            telemetry_subscription_manager=self.telemetry_subscription_manager
+            telemetry_subscription_manager=self.telemetry_subscription_manager,
+            event_bus=self.event_bus,
         )
 
         self.register_services()
@@ -94,6 +115,7 @@ class PluginCore:
         and begins the event listening and processing loop.
         """
         logging.info("Starting all core services.")
+        await self.event_bus.start()
         await self.telemetry_client.start()
 
         logging.info("Starting the main event loop. Press Ctrl+C to stop.")
@@ -110,6 +132,9 @@ class PluginCore:
         """
         logging.info("Stopping all services and cleaning up resources.")
         self.running = False
+        # flushes and closes the telemetry recording, if any
+        self.telemetry_client.close()
+        self.event_bus.shutdown(drain=False, timeout=5)
 
     def register_services(self):
         """
@@ -120,6 +145,8 @@ class PluginCore:
         self.audio_service.register()
         self.dialogue_manager.register()
         self.speech_output_service.register()
+        if self.speculative_response_service:
+            self.speculative_response_service.register()
         self.dynamic_session_provider.register()
 
     def register_telemetry_handlers(self):
@@ -152,7 +179,10 @@ class PluginCore:
 
                 # Instantiate and register the handler
                 handler_instance = handler_class(
-                    self.event_bus, self.session, self.telemetry_subscription_manager
+                    self.event_bus,
+                    self.session,
+                    self.telemetry_subscription_manager,
+                    speculation=self.speculative_response_service,
                 )
                 handler_instance.register()
 
@@ -3,6 +3,38 @@ REPLICATE_API_KEY = "r8_xxxx"
 NLP_CLOUD_API_KEY = "xxx"
 MOCK_AI_RESPONSES = False
 MOCK_TELEMETRY_DATA = True
+TELEMETRY_SHARED_MEMORY_NAME = "Local\\SCSTelemetry"  # segment written by the SDK plugin or the Linux stand-in
+TELEMETRY_DECODER = "struct"  # "struct" decodes whole frames, "numpy" maps a zero-copy record view
+TELEMETRY_POLL_RATE_HZ = 20  # normal polling rate while driving
+TELEMETRY_IDLE_RATE_HZ = 1  # polling rate while paused or parked
+TELEMETRY_MAX_RATE_HZ = 60  # polling rate while speed or braking changes quickly
+TELEMETRY_RECORD_PATH = None  # e.g. "./data/telemetry/drive.etslog" to record telemetry
+TELEMETRY_REPLAY_PATH = None  # replay a recorded log instead of the game or mock data
+TELEMETRY_REPLAY_SPEED = 1.0  # 1.0 real time, 4.0 four times faster, 0 as fast as possible
+EVENT_BUS_MODE = "threads"  # "threads" runs handlers on worker threads, "async" on the asyncio loop
+EVENT_BUS_CONCURRENCY = {"TELEMETRY": 1, "AUDIO": 1, "TEXT": 1}  # worker threads per event category, 1 keeps events in order
+EVENT_BUS_MAX_DEPTH = {"TELEMETRY": 20, "TEXT": 20}  # queued events per category before dropping
+EVENT_BUS_DROP_POLICY = "drop_lowest"  # "drop_lowest", "drop_oldest" or "drop_newest" when a queue is full
+EVENT_PRIORITIES = {"GAME_PAUSED": 10, "GAME_RESUMED": 10}  # higher is handled first within a category, default 0
+EVENT_COALESCE = {"TELEMETRY_RECEIVED": "type", "DIALOGUE_RESPONSE_REQUEST": "source"}  # latest-only per event type or per emitting source
+EVENT_NEVER_DROP = ["DIALOGUE_RESPONSE_SEGMENT"]  # outside EVENT_BUS_MAX_DEPTH and never dropped, a lost sentence would stall speech
+EVENT_BUS_METRICS_INTERVAL = 60  # seconds between EventBus metrics dumps, 0 disables them
+EVENT_BUS_METRICS_PATH = None  # e.g. "./data/metrics/event_bus.jsonl", None logs the metrics instead
+LATENCY_TRACE_PATH = None  # e.g. "./data/metrics/latency.jsonl" to export per-turn latency traces
+LATENCY_TRACE_WINDOW = 50  # turns in the rolling time-to-first-audio percentiles
+DIALOGUE_STREAMING = True  # speak responses sentence by sentence while they are still generated
+DIALOGUE_SEGMENT_MIN_CHARS = 20  # shorter sentences are joined with the next one before speaking
+AUDIO_OUTPUT_DEVICE = None  # sounddevice output device name or index, None for the default, "null" for no sound card
+AUDIO_OUTPUT_SAMPLE_RATE = 24000  # speech is decoded and played at this rate
+AUDIO_OUTPUT_LATENCY = 0.1  # seconds of device buffering (pre-roll) on the output stream
+TTS_CACHE_DIR = "./data/cache/tts"  # synthesized speech cache, None disables it
+TTS_CACHE_MAX_BYTES = 200 * 1024 * 1024  # disk budget of the speech cache, least recently used entries go first
+TTS_CACHE_HOT_BYTES = 16 * 1024 * 1024  # recently used speech also kept in memory
+SPECULATION_ENABLED = True  # prepare likely co-driver lines (e.g. the next city) ahead of time
+SPECULATION_TTL = 600  # seconds a prepared line stays usable
+SPECULATION_BUDGET_PER_HOUR = 30  # prepared lines per hour, each costs a text and a speech request
+SPEECH_MAX_UTTERANCE_SECONDS = 30  # longest user utterance captured before it is transcribed
+CITY_CATALOGUE_CACHE_DIR = "./data/cache/cities"  # binary cache of src/cities.json, rebuilt when it changes
 
 DEFAULT_MIC_INPUT_NAME = "MacBook Pro Microphone"
 DEFAULT_SESSION_ID = "new"
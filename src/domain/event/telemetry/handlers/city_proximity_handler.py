@@ -1,8 +1,9 @@
 import logging
-import math
 
 from src.domain.event.telemetry.handlers.telemetry_event_handlers import \
     TelemetryEventHandlers
+from src.domain.event.telemetry.telemetry_subscription_manager import \
+    SubscriptionOptions
 from src.domain.model.telemetry_data import TelemetryData
 from src.shared.helpers.constants import EventType
 
@@ -13,7 +14,11 @@ class CityProximityHandler(TelemetryEventHandlers):
     """
 
     subscriptions = ["truck.speed"]
+    # proximity moves slowly, checking it once a second is plenty
+    subscription_options = {"truck.speed": SubscriptionOptions(min_interval=1.0)}
     proximity_threshold = 5000  # meters within which a city is considered 'near'
+    anticipation_distance = 15000  # meters within which the approach message is prepared ahead
+    anticipated_cities = 2
 
     def handle(self, telemetry_data: TelemetryData):
         """
@@ -33,15 +38,7 @@ class CityProximityHandler(TelemetryEventHandlers):
             )
             return False
 
-        truck_position = (
-            telemetry_data.truck.coordinate_x,
-            telemetry_data.truck.coordinate_y,
-        )
-        logging.info(f"[CityProximityHandler] Current truck position: {truck_position}")
-
-        nearest_city = self.find_nearest_city(
-            telemetry_data.navigation.nearest_cities, truck_position
-        )
+        nearest_city = self.find_nearest_city(telemetry_data.navigation.nearest_cities)
 
         if nearest_city and nearest_city["distance"] <= self.proximity_threshold:
             self.notify_approaching_city(nearest_city, nearest_city["distance"])
@@ -49,41 +46,45 @@ class CityProximityHandler(TelemetryEventHandlers):
         logging.info("[CityProximityHandler] No city within proximity threshold.")
         return False
 
-    def find_nearest_city(self, cities, truck_position):
+    def anticipate(self, telemetry_data: TelemetryData):
         """
-        Find the nearest city to the truck's current position.
+        The approach messages of the nearest cities that are not near yet but soon may be.
         """
-        nearest_city = None
-        min_distance = float("inf")
-        for city in cities:
-            distance = self.calculate_distance(truck_position, (city["X"], city["Y"]))
-            if distance < min_distance:
-                min_distance = distance
-                nearest_city = city
-                nearest_city["distance"] = distance
-        logging.info(
-            f"[CityProximityHandler] Nearest city: {nearest_city['Name']} at distance: {min_distance}"
+        if not telemetry_data.navigation or not telemetry_data.navigation.nearest_cities:
+            return []
+        upcoming = sorted(
+            (
+                city
+                for city in telemetry_data.navigation.nearest_cities
+                if self.proximity_threshold < city["distance"] <= self.anticipation_distance
+            ),
+            key=lambda city: city["distance"],
         )
-        return nearest_city
+        return [self.approaching_message(city) for city in upcoming[: self.anticipated_cities]]
 
-    @staticmethod
-    def calculate_distance(pos1, pos2):
+    def find_nearest_city(self, cities):
         """
-        Calculate the Euclidean distance between two points.
+        Pick the nearest city, using the distances precomputed by the location service.
         """
-        distance = math.sqrt((pos2[0] - pos1[0]) ** 2 + (pos2[1] - pos1[1]) ** 2)
-        logging.debug(f"[CityProximityHandler] Calculated distance: {distance}")
-        return distance
+        nearest_city = min(cities, key=lambda city: city["distance"], default=None)
+        if nearest_city:
+            logging.info(
+                f"[CityProximityHandler] Nearest city: {nearest_city['Name']} at distance: {nearest_city['distance']}"
+            )
+        return nearest_city
 
     def notify_approaching_city(self, city, distance):
         """
         Notify that the truck is approaching a city.
         """
-        message = f"Generate a CONVERSATIONAL message that we are approaching {city['Name']}"
         self.emit_event(
             event_type=EventType.DIALOGUE_RESPONSE_REQUEST,
-            message=message,
+            message=self.approaching_message(city),
         )
         logging.info(
             f"[CityProximityHandler] Approaching {city['Name']} at {distance:.2f} meters."
         )
+
+    @staticmethod
+    def approaching_message(city) -> str:
+        return f"Generate a CONVERSATIONAL message that we are approaching {city['Name']}"
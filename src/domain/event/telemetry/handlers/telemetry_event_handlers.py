@@ -1,12 +1,12 @@
 import logging
 import random
 import time
-from typing import Any, List
+from typing import Any, Dict, List, Optional
 
 from src.application.event_bus import EventBus
 from src.application.model.session_model import Session
-from src.domain.event.telemetry.telemetry_subscription_manager import \
-    TelemetrySubscriptionManager
+from src.domain.event.telemetry.telemetry_subscription_manager import (
+    SubscriptionOptions, TelemetrySubscriptionManager)
 from src.domain.model.telemetry_data import TelemetryData
 from src.shared.helpers.constants import EventCategory, EventType
 
@@ -20,7 +20,11 @@ class TelemetryEventHandlers:
     cooldown: int = 0
     chance: float = 1
     subscriptions: List[str] = []
+    # optional deadband / interval / threshold filters, keyed by subscribed pattern
+    subscription_options: Dict[str, SubscriptionOptions] = {}
     minimum_wait_time: int = 0
+    # EventBus priority of emitted events, None uses the event type's default
+    event_priority: int = None
 
     def __init__(
         self,
@@ -28,8 +32,11 @@ class TelemetryEventHandlers:
         session: Session,
         telemetry_subscription_manager: TelemetrySubscriptionManager,
         only_once: bool = False,
+        speculation: Optional[Any] = None,
     ):
         self.event_bus = event_bus
+        # SpeculativeResponseService the prompts from anticipate() are offered to
+        self.speculation = speculation
         self.last_emit_time = None
         self.session = session
         self.only_once = only_once
@@ -37,15 +44,21 @@ class TelemetryEventHandlers:
         self.telemetry_subscription_manager = telemetry_subscription_manager
         self.previous_data = {}
         self.current_data = {}
+        # subscribed fields that changed in the frame being handled
+        self.changed_fields = []
         self.start_time = time.time()  # Record the start time
 
         self.subscribe_to_fields()
 
-    def handle_telemetry_data(self, telemetry_data: TelemetryData):
+    def handle_telemetry_data(
+        self, telemetry_data: TelemetryData, changed_fields: List[str] = None
+    ):
         """
         Entry point for handling telemetry data. It checks if execution should proceed
-        based on the global blocking state and minimum wait time.
+        based on the global blocking state and minimum wait time. ``changed_fields``
+        lists the subscribed fields that changed and is kept in ``self.changed_fields``.
         """
+        self.changed_fields = changed_fields or []
         logging.debug(
             f"[Module][{self.__class__.__name__}] Handling telemetry data"
         )
@@ -53,6 +66,11 @@ class TelemetryEventHandlers:
         if self.has_triggered_once and self.only_once:
             return
 
+        if self.speculation is not None:
+            prompts = self.anticipate(telemetry_data)
+            if prompts:
+                self.speculation.offer(prompts)
+
         if self.is_execution_blocked():
             logging.debug(
                 f"[Module][{self.__class__.__name__}] Execution blocked, skipping handler."
@@ -84,6 +102,14 @@ class TelemetryEventHandlers:
         """
         raise NotImplementedError("This method should be implemented by subclasses")
 
+    def anticipate(self, telemetry_data: TelemetryData) -> List[str]:
+        """
+        Prompts this handler is likely to emit soon, most likely first, so their
+        responses can be prepared ahead of time. Handlers that can predict their
+        messages override this; the messages must match what ``handle`` emits.
+        """
+        return []
+
     def emit_event(
         self,
         event_type: EventType,
@@ -93,7 +119,13 @@ class TelemetryEventHandlers:
         Attempts to emit an event if the conditions (cooldown and chance) are met, considers prompt_type for specific handling.
         """
         self.last_emit_time = time.time()
-        self.event_bus.emit(event_type, message, EventCategory.TELEMETRY)
+        self.event_bus.emit(
+            event_type,
+            message,
+            EventCategory.TELEMETRY,
+            priority=self.event_priority,
+            source=self.__class__.__name__,
+        )
         logging.info(f"[Module][{self.__class__.__name__}] Emitting: {message}")
 
     def is_execution_blocked(self):
@@ -141,7 +173,10 @@ class TelemetryEventHandlers:
 
     def subscribe_to_fields(self):
         """Subscribe to a list of telemetry fields."""
-        self.telemetry_subscription_manager.subscribe(self.subscriptions, self)
+        for pattern in self.subscriptions:
+            self.telemetry_subscription_manager.subscribe(
+                pattern, self, self.subscription_options.get(pattern)
+            )
 
     def register(self):
         """
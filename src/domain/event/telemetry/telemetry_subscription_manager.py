@@ -1,58 +1,403 @@
+import dataclasses
 import fnmatch
 import logging
+import re
+import time
+import typing
 from collections import defaultdict
+from dataclasses import dataclass
+from numbers import Real
+from operator import attrgetter
+from typing import Optional
+
+import numpy as np
+
+from src.domain.model.telemetry_data import TelemetryData
+
+GLOB_CHARACTERS = re.compile(r"[*?\[]")
+
+
+def _dataclass_type(annotation):
+    """Return the dataclass behind an annotation like ``Optional[TruckData]``."""
+    if typing.get_origin(annotation) is typing.Union:
+        candidates = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+        annotation = candidates[0] if len(candidates) == 1 else None
+    return annotation if dataclasses.is_dataclass(annotation) else None
+
+
+def schema_field_paths(model=TelemetryData, prefix=""):
+    """
+    List the dotted paths of every leaf field of a dataclass schema, descending
+    into nested dataclasses. Lists (e.g. trailers) are leaves.
+    """
+    paths = []
+    for name, annotation in typing.get_type_hints(model).items():
+        path = f"{prefix}{name}"
+        nested = _dataclass_type(annotation)
+        if nested is not None:
+            paths.extend(schema_field_paths(nested, prefix=f"{path}."))
+        else:
+            paths.append(path)
+    return paths
+
+
+TELEMETRY_FIELD_PATHS = schema_field_paths()
+
+
+def _get_path(data, path):
+    for attr in path.split("."):
+        data = getattr(data, attr, None)
+        if data is None:
+            return None
+    return data
+
+
+def _differs(value, previous):
+    if isinstance(value, np.ndarray) or isinstance(previous, np.ndarray):
+        return not np.array_equal(value, previous)
+    if isinstance(value, (list, tuple)) and isinstance(previous, (list, tuple)):
+        return len(value) != len(previous) or any(
+            _differs(item, old) for item, old in zip(value, previous)
+        )
+    if dataclasses.is_dataclass(value) and type(value) is type(previous):
+        # e.g. trailers, whose fields can hold arrays
+        return any(
+            _differs(getattr(value, field.name), getattr(previous, field.name))
+            for field in dataclasses.fields(value)
+        )
+    try:
+        return bool(value != previous)
+    except ValueError:
+        # array-like values without a single truth value, assume they changed
+        return True
+
+
+def _keep(value):
+    """Value to remember as previous; numpy arrays may be views of a reused buffer."""
+    if isinstance(value, np.ndarray):
+        return value.copy()
+    if isinstance(value, list):
+        return [_keep(item) for item in value]
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.replace(
+            value,
+            **{field.name: _keep(getattr(value, field.name)) for field in dataclasses.fields(value)},
+        )
+    return value
+
+
+@dataclass(frozen=True)
+class SubscriptionOptions:
+    """
+    Filters applied to a pattern subscription before its handler is woken.
+
+    ``deadband_abs`` / ``deadband_rel`` ignore changes smaller than the larger
+    of the absolute band and the band relative to the last reported value, so
+    slow drifts still fire once they add up. ``min_interval`` limits how often
+    a field can wake the handler, in seconds; a change held back by it is
+    delivered once the interval has passed, even if the value has not changed
+    again since. ``threshold`` makes the
+    subscription edge-triggered: it only fires when the value crosses the
+    threshold, in the given ``edge`` direction ("rising", "falling" or "both");
+    a crossing held back by the interval or deadband fires on a later change
+    that passes them. Deadbands and thresholds only apply to numeric values.
+    """
+
+    deadband_abs: float = 0.0
+    deadband_rel: float = 0.0
+    min_interval: float = 0.0
+    threshold: Optional[float] = None
+    edge: str = "both"
+
+    def __post_init__(self):
+        if self.edge not in ("rising", "falling", "both"):
+            raise ValueError(f"Unknown edge '{self.edge}'")
+
+
+class SubscriptionFilter:
+    """Per-field state of one filtered (pattern, handler) subscription."""
+
+    def __init__(self, options: SubscriptionOptions):
+        self.options = options
+        # field path -> [last reported value, last report time, above threshold]
+        self.state = {}
+        # field path -> time a change held back by min_interval is due
+        self.pending = {}
+
+    def passes(self, path, value, now):
+        options = self.options
+        self.pending.pop(path, None)
+        state = self.state.get(path)
+        if state is None:
+            state = self.state[path] = [None, None, None]
+        numeric = isinstance(value, Real) and not isinstance(value, bool)
+
+        crossed = None
+        if options.threshold is not None and numeric:
+            above = value >= options.threshold
+            previous_side = state[2]
+            if previous_side is None or above == previous_side:
+                state[2] = above
+                return False
+            if (options.edge == "rising" and not above) or (options.edge == "falling" and above):
+                state[2] = above
+                return False
+            # the side only moves once the crossing is reported, so a crossing
+            # held back by the deadband or interval below fires on a later frame
+            crossed = above
+
+        last_value, last_time, _ = state
+        if numeric and isinstance(last_value, Real):
+            band = max(options.deadband_abs, options.deadband_rel * abs(last_value))
+            if abs(value - last_value) < band:
+                return False
+
+        if last_time is not None and now - last_time < options.min_interval:
+            # delivered on a later frame once the interval has passed
+            self.pending[path] = last_time + options.min_interval
+            return False
+
+        if crossed is not None:
+            state[2] = crossed
+        state[0] = value
+        state[1] = now
+        return True
+
+
+class FieldAccessorTable:
+    """
+    Flat accessor table over the subscribed TelemetryData paths.
+
+    Built once per subscription change: a single ``attrgetter`` reads every
+    subscribed path in one call and the previous frame is kept in a
+    preallocated list in the same order, so diffing a frame builds no path
+    strings or intermediate dicts.
+    """
+
+    def __init__(self, paths, previous=None):
+        previous = previous or {}
+        self.paths = tuple(paths)
+        self.indices = {path: index for index, path in enumerate(self.paths)}
+        # unseen fields start as None, so a field first seen as None is unchanged
+        self.previous = [previous.get(path) for path in self.paths]
+        if len(self.paths) > 1:
+            self.getter = attrgetter(*self.paths)
+        elif self.paths:
+            getter = attrgetter(self.paths[0])
+            self.getter = lambda data: (getter(data),)
+        else:
+            self.getter = lambda data: ()
+
+    def read(self, telemetry_data):
+        try:
+            return self.getter(telemetry_data)
+        except AttributeError:
+            # a group is missing from this frame, read path by path instead
+            return tuple(_get_path(telemetry_data, path) for path in self.paths)
+
+    def find_changed(self, telemetry_data):
+        """Return the paths whose value changed since the last frame and remember the new values."""
+        values = self.read(telemetry_data)
+        previous = self.previous
+        changed = []
+        for index, value in enumerate(values):
+            old = previous[index]
+            if value is not old and _differs(value, old):
+                previous[index] = _keep(value)
+                changed.append(self.paths[index])
+        return changed
+
+    def value(self, path):
+        """Last known value of a path."""
+        return self.previous[self.indices[path]]
+
+    def as_dict(self):
+        return dict(zip(self.paths, self.previous))
+
+
+class PatternIndex:
+    """
+    Matches field paths against subscription patterns without trying every pattern.
+
+    Patterns are sorted once into an exact-path set, a character trie of
+    ``prefix*`` globs (e.g. ``truck.*``) and a list of precompiled regexes for
+    anything else, all with ``fnmatch`` semantics. The patterns matching a
+    path are memoized, since the same field paths come back every frame.
+    """
+
+    # key of a trie node holding the patterns that end there
+    TERMINAL = None
+
+    def __init__(self, patterns=()):
+        self.exact = set()
+        self.prefix_trie = {}
+        self.fallback = []
+        self.cache = {}
+        for pattern in patterns:
+            self.add(pattern)
+
+    def add(self, pattern):
+        self.cache.clear()
+        if not GLOB_CHARACTERS.search(pattern):
+            self.exact.add(pattern)
+            return
+        prefix = pattern[:-1]
+        if pattern.endswith("*") and not GLOB_CHARACTERS.search(prefix):
+            node = self.prefix_trie
+            for character in prefix:
+                node = node.setdefault(character, {})
+            node.setdefault(self.TERMINAL, []).append(pattern)
+            return
+        self.fallback.append((pattern, re.compile(fnmatch.translate(pattern))))
+
+    def match(self, path):
+        """Return the patterns matching ``path``."""
+        patterns = self.cache.get(path)
+        if patterns is None:
+            patterns = self.cache[path] = self._match(path)
+        return patterns
+
+    def _match(self, path):
+        patterns = [path] if path in self.exact else []
+        node = self.prefix_trie
+        patterns.extend(node.get(self.TERMINAL, ()))
+        for character in path:
+            node = node.get(character)
+            if node is None:
+                break
+            patterns.extend(node.get(self.TERMINAL, ()))
+        patterns.extend(
+            pattern for pattern, regex in self.fallback if regex.match(path)
+        )
+        return tuple(patterns)
 
 
 class TelemetrySubscriptionManager:
     def __init__(self):
         # This will store subscriptions with handlers interested in specific patterns
         self.subscriptions = defaultdict(list)
-        # Store the last known values for comparison
-        self.last_known_values = {}
+        # Compiled from the subscribed patterns, rebuilt when they change
+        self.pattern_index = PatternIndex()
+        # Filters of subscriptions made with options, keyed by (pattern, handler)
+        self.filters = {}
+        # (handler, filter) pairs interested in each field path, memoized per path
+        self.field_handlers = {}
+        # Subscribed field paths with their last known values for comparison
+        self.accessors = FieldAccessorTable(())
+        # Bumped on every (un)subscribe so consumers can tell when patterns changed
+        self.revision = 0
 
-    def subscribe(self, patterns, handler):
-        """Subscribe a handler to changes in specific telemetry fields or patterns."""
+    def subscribe(self, patterns, handler, options: SubscriptionOptions = None):
+        """
+        Subscribe a handler to changes in specific telemetry fields or patterns,
+        optionally filtered by deadband, minimum interval or threshold options.
+        """
         if isinstance(patterns, str):
             patterns = [patterns]
         for pattern in patterns:
-            self.subscriptions[pattern].append(handler)
+            if handler not in self.subscriptions[pattern]:
+                self.subscriptions[pattern].append(handler)
+            if options is None:
+                self.filters.pop((pattern, handler), None)
+            else:
+                self.filters[(pattern, handler)] = SubscriptionFilter(options)
+        self._rebuild_index()
 
     def unsubscribe(self, patterns, handler):
         """Unsubscribe a handler from specific telemetry fields or patterns."""
         if isinstance(patterns, str):
             patterns = [patterns]
         for pattern in patterns:
+            self.filters.pop((pattern, handler), None)
             if handler in self.subscriptions[pattern]:
                 self.subscriptions[pattern].remove(handler)
                 if not self.subscriptions[pattern]:
                     del self.subscriptions[pattern]
+        self._rebuild_index()
+
+    def _rebuild_index(self):
+        self.pattern_index = PatternIndex(self.subscriptions)
+        self.field_handlers = {}
+        self.accessors = FieldAccessorTable(
+            [path for path in TELEMETRY_FIELD_PATHS if self.pattern_index.match(path)],
+            previous=self.accessors.as_dict(),
+        )
+        self.revision += 1
+
+    @property
+    def last_known_values(self):
+        """Last known value of every subscribed field."""
+        return self.accessors.as_dict()
+
+    def get_patterns(self):
+        """Return every pattern that currently has at least one handler."""
+        return list(self.subscriptions)
+
+    def get_handlers(self, field):
+        """
+        Return ``(handler, filter)`` pairs for the subscriptions matching a field
+        path. The filter is None for unfiltered subscriptions, which wake the
+        handler on any change; an unfiltered pattern makes the handler's other
+        filters irrelevant for that field.
+        """
+        handlers = self.field_handlers.get(field)
+        if handlers is None:
+            matches = {}
+            for pattern in self.pattern_index.match(field):
+                for handler in self.subscriptions.get(pattern, ()):
+                    subscription_filter = self.filters.get((pattern, handler))
+                    filters = matches.setdefault(handler, [])
+                    if subscription_filter is None:
+                        filters.insert(0, None)
+                    else:
+                        filters.append(subscription_filter)
+            handlers = self.field_handlers[field] = tuple(
+                (handler, None if filters[0] is None else tuple(filters))
+                for handler, filters in matches.items()
+            )
+        return handlers
 
     def notify_handlers(self, telemetry_data):
-        """Notify handlers if their subscribed fields have changed."""
+        """
+        Notify handlers if their subscribed fields have changed and pass their
+        subscription filters. Each handler is called at most once per frame,
+        with the changed fields it subscribed to.
+        """
         changed_fields = self._find_changed_fields(telemetry_data)
+        notifications = {}
+        now = None
         for field in changed_fields:
-            for pattern, handlers in self.subscriptions.items():
-                if fnmatch.fnmatch(field, pattern):
-                    for handler in handlers:
-                        handler.handle_telemetry_data(telemetry_data)
+            for handler, filters in self.get_handlers(field):
+                if filters is not None:
+                    if now is None:
+                        now = time.monotonic()
+                    value = self.accessors.value(field)
+                    # every filter sees the value so threshold sides stay current
+                    if not [f for f in filters if f.passes(field, value, now)]:
+                        continue
+                notifications.setdefault(handler, []).append(field)
+        self._notify_pending(changed_fields, notifications, now)
+        for handler, fields in notifications.items():
+            handler.handle_telemetry_data(telemetry_data, changed_fields=fields)
+
+    def _notify_pending(self, changed_fields, notifications, now):
+        """
+        Add the changes held back by a ``min_interval`` whose interval has passed
+        to ``notifications``; fields changed in this frame were checked already.
+        """
+        filters = [item for item in self.filters.items() if item[1].pending]
+        if not filters:
+            return
+        now = time.monotonic() if now is None else now
+        for (_, handler), subscription_filter in filters:
+            for field, due in list(subscription_filter.pending.items()):
+                if now < due or field in changed_fields:
+                    continue
+                if subscription_filter.passes(field, self.accessors.value(field), now):
+                    fields = notifications.setdefault(handler, [])
+                    if field not in fields:
+                        fields.append(field)
 
     def _find_changed_fields(self, telemetry_data):
-        """Detect changes in telemetry data and update last known values."""
-        current_values = self._extract_values(telemetry_data)
-        changed_fields = []
-        for field, value in current_values.items():
-            if self.last_known_values.get(field) != value:
-                self.last_known_values[field] = value
-                changed_fields.append(field)
-        return changed_fields
-
-    def _extract_values(self, telemetry_data, prefix=''):
-        """Extract values recursively from telemetry data."""
-        values = {}
-        for attr, val in vars(telemetry_data).items():
-            full_path = f"{prefix}.{attr}".strip('.')
-            if hasattr(val, '__dict__') or isinstance(val, dict):
-                values.update(self._extract_values(val, prefix=full_path))
-            else:
-                values[full_path] = val
-        return values
+        """Detect changes in the subscribed telemetry fields and update last known values."""
+        return self.accessors.find_changed(telemetry_data)
@@ -0,0 +1,17 @@
+import itertools
+from dataclasses import dataclass
+
+# Ids of co-driver responses, unique for the process
+_response_ids = itertools.count(1)
+
+
+def next_response_id() -> int:
+    return next(_response_ids)
+
+
+@dataclass(frozen=True)
+class DialogueSegment:
+    text: str  # One sentence of the co-driver's response, empty when it only closes the response
+    index: int  # Position of the sentence within the response
+    last: bool  # True for the final sentence of the response
+    response_id: int  # The response the sentence belongs to, see next_response_id
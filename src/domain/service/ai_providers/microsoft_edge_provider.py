@@ -1,3 +1,5 @@
+import asyncio
+
 import edge_tts
 
 from src.interfaces.ai_provider_interface import TextToAudioProvider
@@ -5,12 +7,14 @@ from src.interfaces.ai_provider_interface import TextToAudioProvider
 
 class MicrosoftEdgeProvider(TextToAudioProvider):
     def text_to_audio(self, text: str) -> bytes:
-        try:
-            communicate = edge_tts.Communicate(text, self.params["voice"])
-            communicate.save_sync("output.wav")
-
-            file = open("output.wav", "rb")
+        """Synthesize speech in memory; Edge returns MP3 audio."""
+        communicate = edge_tts.Communicate(text, self.params["voice"])
+        return asyncio.run(self._collect_audio(communicate))
 
-            return file.read()
-        except Exception as e:
-            raise e
+    @staticmethod
+    async def _collect_audio(communicate: edge_tts.Communicate) -> bytes:
+        chunks = []
+        async for chunk in communicate.stream():
+            if chunk["type"] == "audio":
+                chunks.append(chunk["data"])
+        return b"".join(chunks)
@@ -1,5 +1,5 @@
 import logging
-from typing import Dict
+from typing import Dict, Iterator
 
 from src.application.session_management import SessionManagement
 from src.domain.service.openai_service import OpenAIService
@@ -50,6 +50,32 @@ class OpenAIProvider(TextToTextProvider, ImageToTextProvider):
             logging.error(f"Failed to generate text-to-text with OpenAI: {str(e)}")
             raise AIProcessingError(f"OpenAI text-to-text processing failed: {str(e)}")
 
+    def text_to_text_stream(
+        self,
+        input_text: str,
+        system_text: str,
+        session: SessionManagement,
+    ) -> Iterator[str]:
+        """
+        Streams the generated text as it arrives from the specified OpenAI model.
+        """
+        history = session.interaction_history
+        last_user_messages = history[-self.history_size:]
+
+        user_messages = [
+            {"role": message["role"], "content": message["content"]}
+            for message in last_user_messages
+        ]
+
+        yield from self.client.text_to_text_stream(
+            input_text=input_text,
+            system_text=system_text,
+            user_messages=user_messages,
+            model=self.model_id,
+            max_tokens=4096,
+            temperature=self.params.get("temperature", 0.8),
+        )
+
     def image_to_text(self, image_path: str) -> str:
         """
         Converts an image to text.
@@ -1,9 +1,10 @@
-from typing import Dict, Optional
+from typing import Dict, Iterator, Optional
 
 import requests
 
 from src.application.session_management import SessionManagement
-from src.domain.service.replicate_service import make_replicate_prediction
+from src.domain.service.replicate_service import (
+    make_replicate_prediction, stream_replicate_prediction)
 from src.interfaces.ai_provider_interface import (TextToAudioProvider,
                                                   TextToTextProvider)
 
@@ -13,7 +14,28 @@ class ReplicateProvider(TextToTextProvider, TextToAudioProvider):
         self, input_text: str, system_text: str, session: SessionManagement
     ) -> Optional[Dict]:
         """Convert text to text using a specific voice and language."""
-        parsed_params = self.params
+        return make_replicate_prediction(
+            model_version=self.model_id,
+            input_data=self._text_input(input_text, system_text, session),
+            is_stream=self.is_stream,
+        )
+
+    def text_to_text_stream(
+        self, input_text: str, system_text: str, session: SessionManagement
+    ) -> Iterator[str]:
+        """Stream the generated text when the model is configured with ``is_stream``."""
+        if not self.is_stream:
+            yield from super().text_to_text_stream(input_text, system_text, session)
+            return
+        yield from stream_replicate_prediction(
+            model_version=self.model_id,
+            input_data=self._text_input(input_text, system_text, session),
+        )
+
+    def _text_input(
+        self, input_text: str, system_text: str, session: SessionManagement
+    ) -> Dict:
+        parsed_params = dict(self.params)
         for key, value in parsed_params.items():
             if value == "{{text}}":
                 parsed_params[key] = input_text
@@ -31,15 +53,11 @@ class ReplicateProvider(TextToTextProvider, TextToAudioProvider):
 
         parsed_params["conversation_history"] = conversation_history
 
-        return make_replicate_prediction(
-            model_version=self.model_id,
-            input_data=parsed_params,
-            is_stream=self.is_stream,
-        )
+        return parsed_params
 
     def text_to_audio(self, text: str) -> bytes:
         """Convert text to audio using a specific voice and language."""
-        parsed_params = self.params
+        parsed_params = dict(self.params)
         for key, value in parsed_params.items():
             if value == "{{text}}":
                 parsed_params[key] = text
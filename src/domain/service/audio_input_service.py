@@ -5,12 +5,13 @@ from pynput.keyboard import Key
 from src.application.event_bus import EventBus
 from src.infrastructure.input_output.keyboard_manager import KeyboardManager
 from src.interfaces.speech_listener_interface import SpeechListenerInterface
-from src.shared.helpers.constants import EventType
+from src.shared.helpers.constants import EventCategory, EventType
 
 
 class AudioInputService:
     """
     Controls speech listening activation via a hotkey, using a centralized keyboard manager.
+    Pressing the hotkey while the co-driver is speaking interrupts it (barge-in).
     """
 
     def __init__(
@@ -29,6 +30,25 @@ class AudioInputService:
         self.hotkey: str = hotkey
         self.listening: bool = False
         self.ignore_input: bool = False
+        self.co_driver_speaking: bool = False
+
+    def on_co_driver_speech_start(self, _data=None):
+        self.co_driver_speaking = True
+        self.pause_listening()
+
+    def on_co_driver_speech_end(self, _data=None):
+        self.co_driver_speaking = False
+        self.resume_listening()
+
+    def on_user_speech_end(self, _data=None):
+        """
+        The listener ended the utterance on its own, after silence; the user no
+        longer holds the floor. Telemetry handlers stay blocked until the
+        co-driver has answered.
+        """
+        self.listening = False
+        self.event_bus.set_state(EventType.USER_SPEECH_START, False)
+        logging.debug("[AudioInputService] User stopped speaking.")
 
     def pause_listening(self, _data=None):
         self.ignore_input = True
@@ -61,8 +81,9 @@ class AudioInputService:
         Starts listening for the hotkey.
         """
         self.keyboard_manager.register_callback(self.on_press)
-        self.event_bus.subscribe(EventType.CO_DRIVER_SPEECH_START, self.pause_listening)
-        self.event_bus.subscribe(EventType.CO_DRIVER_SPEECH_END, self.resume_listening)
+        self.event_bus.subscribe(EventType.CO_DRIVER_SPEECH_START, self.on_co_driver_speech_start)
+        self.event_bus.subscribe(EventType.CO_DRIVER_SPEECH_END, self.on_co_driver_speech_end)
+        self.event_bus.subscribe(EventType.USER_SPEECH_END, self.on_user_speech_end)
 
         self.event_bus.subscribe(EventType.AUDIO_INPUT_PAUSE, self.pause_listening)
         self.event_bus.subscribe(EventType.AUDIO_INPUT_RESUME, self.resume_listening)
@@ -77,17 +98,24 @@ class AudioInputService:
         """
         self.keyboard_manager.unregister_callback(self.on_press)
         self.event_bus.unsubscribe(
-            EventType.CO_DRIVER_SPEECH_START, self.pause_listening
+            EventType.CO_DRIVER_SPEECH_START, self.on_co_driver_speech_start
         )
         self.event_bus.unsubscribe(
-            EventType.CO_DRIVER_SPEECH_END, self.resume_listening
+            EventType.CO_DRIVER_SPEECH_END, self.on_co_driver_speech_end
         )
+        self.event_bus.unsubscribe(EventType.USER_SPEECH_END, self.on_user_speech_end)
         logging.info("[AudioInputService] Hotkey unregistered")
 
     def toggle_listening(self):
         """
         Toggles the speech listening state.
         """
+        if self.ignore_input and self.co_driver_speaking and not self.listening:
+            # barge-in: USER_SPEECH_START below cuts the co-driver off
+            logging.info("[AudioInputService] Interrupting the co-driver.")
+            self.co_driver_speaking = False
+            self.ignore_input = False
+
         if self.ignore_input:
             self.listening = False
             self.event_bus.set_state(EventType.USER_SPEECH_START, False)
@@ -107,6 +135,7 @@ class AudioInputService:
         else:
             self.listening = True
             self.event_bus.set_state(EventType.USER_SPEECH_START, True)
+            self.event_bus.emit(EventType.USER_SPEECH_START, None, EventCategory.AUDIO)
             self.event_bus.block_telemetry_handlers()
             logging.info("[AudioInputService] Blocking telemetry handlers")
             self.speech_listener.start_listening()
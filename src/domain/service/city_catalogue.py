@@ -0,0 +1,172 @@
+"""
+Compact binary cache of the city catalogue in ``src/cities.json``.
+
+The cache directory holds the coordinates and country ids as ``.npy`` arrays
+that are memory-mapped on load, the name and country columns as one small JSON
+file, and the localized names in a separate file that is only read when a
+localized name is asked for. ``meta.json`` records the SHA-256 of the source
+file, so an edited ``cities.json`` rebuilds the cache on the next load. Build it
+ahead of time with:
+
+    python -m src.domain.service.city_catalogue
+"""
+import hashlib
+import json
+import logging
+import os
+import sys
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from src.config import CITY_CATALOGUE_CACHE_DIR
+
+CITY_CATALOGUE_SOURCE = os.path.join("./src", "cities.json")
+CACHE_VERSION = 1
+
+META_FILE = "meta.json"
+COORDINATES_FILE = "coordinates.npy"
+COUNTRY_IDS_FILE = "country_ids.npy"
+COLUMNS_FILE = "columns.json"
+LOCALIZED_FILE = "localized_names.json"
+
+
+class CityEntry(dict):
+    """
+    A city as a plain dict with the same keys as ``cities.json``.
+
+    ``LocalizedNames`` is not stored in the entry; indexing it loads the
+    localized names from the catalogue on first use.
+    """
+
+    def __init__(self, catalogue: "CityCatalogue", index: int, **fields):
+        super().__init__(**fields)
+        self.catalogue = catalogue
+        self.index = index
+
+    def __missing__(self, key):
+        if key != "LocalizedNames":
+            raise KeyError(key)
+        value = self["LocalizedNames"] = self.catalogue.localized_names(self.index)
+        return value
+
+
+class CityCatalogue:
+    """Read-only, column-oriented view over the cached city catalogue."""
+
+    def __init__(self, cache_dir: str, coordinates: np.ndarray, country_ids: np.ndarray, columns: Dict):
+        self.cache_dir = cache_dir
+        self.coordinates = coordinates
+        self.country_ids = country_ids
+        self.names: List[str] = [sys.intern(name) for name in columns["names"]]
+        self.countries: List[str] = [sys.intern(country) for country in columns["countries"]]
+        self._localized: Optional[List[Dict[str, str]]] = None
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def city(self, index: int, **extra) -> CityEntry:
+        """Build the entry of one city, with any extra keys such as ``distance``."""
+        x, y = self.coordinates[index].tolist()
+        return CityEntry(
+            self,
+            index,
+            Name=self.names[index],
+            Country=self.countries[index],
+            X=x,
+            Y=y,
+            CountryId=int(self.country_ids[index]),
+            **extra,
+        )
+
+    def localized_names(self, index: int) -> Dict[str, str]:
+        """Return the localized names of a city, loading them on first use."""
+        if self._localized is None:
+            with open(os.path.join(self.cache_dir, LOCALIZED_FILE), "r", encoding="utf-8") as file:
+                self._localized = json.load(file)
+        return self._localized[index]
+
+    @classmethod
+    def load(cls, source_path: str = CITY_CATALOGUE_SOURCE, cache_dir: str = CITY_CATALOGUE_CACHE_DIR) -> "CityCatalogue":
+        """Memory-map the cache, rebuilding it first if it is missing or stale."""
+        if not cls.is_fresh(source_path, cache_dir):
+            cls.build(source_path, cache_dir)
+        with open(os.path.join(cache_dir, COLUMNS_FILE), "r", encoding="utf-8") as file:
+            columns = json.load(file)
+        return cls(
+            cache_dir,
+            np.load(os.path.join(cache_dir, COORDINATES_FILE), mmap_mode="r"),
+            np.load(os.path.join(cache_dir, COUNTRY_IDS_FILE), mmap_mode="r"),
+            columns,
+        )
+
+    @staticmethod
+    def is_fresh(source_path: str, cache_dir: str) -> bool:
+        """True when the cache exists and was built from the current source file."""
+        try:
+            with open(os.path.join(cache_dir, META_FILE), "r") as file:
+                meta = json.load(file)
+        except (OSError, ValueError):
+            return False
+        return (
+            meta.get("version") == CACHE_VERSION
+            and meta.get("source_sha256") == _file_sha256(source_path)
+        )
+
+    @staticmethod
+    def build(source_path: str = CITY_CATALOGUE_SOURCE, cache_dir: str = CITY_CATALOGUE_CACHE_DIR):
+        """Convert the JSON catalogue into the cache files."""
+        with open(source_path, "rb") as file:
+            raw = file.read()
+        cities = json.loads(raw)
+        os.makedirs(cache_dir, exist_ok=True)
+
+        # meta.json goes last and is removed first, so an interrupted build
+        # never leaves a cache that looks fresh
+        meta_path = os.path.join(cache_dir, META_FILE)
+        if os.path.exists(meta_path):
+            os.remove(meta_path)
+
+        coordinates = np.array(
+            [(city["X"], city["Y"]) for city in cities], dtype=np.float64
+        ).reshape(-1, 2)
+        country_ids = np.array([city.get("CountryId", -1) for city in cities], dtype=np.int32)
+        np.save(os.path.join(cache_dir, COORDINATES_FILE), coordinates)
+        np.save(os.path.join(cache_dir, COUNTRY_IDS_FILE), country_ids)
+        _write_json(
+            os.path.join(cache_dir, COLUMNS_FILE),
+            {
+                "names": [city["Name"] for city in cities],
+                "countries": [city.get("Country", "") for city in cities],
+            },
+        )
+        _write_json(
+            os.path.join(cache_dir, LOCALIZED_FILE),
+            [city.get("LocalizedNames", {}) for city in cities],
+        )
+        _write_json(
+            meta_path,
+            {
+                "version": CACHE_VERSION,
+                "source_sha256": hashlib.sha256(raw).hexdigest(),
+                "count": len(cities),
+            },
+        )
+        logging.info(
+            "[CityCatalogue] Built cache of %s cities in %s", len(cities), cache_dir
+        )
+
+
+def _file_sha256(path: str) -> str:
+    with open(path, "rb") as file:
+        return hashlib.sha256(file.read()).hexdigest()
+
+
+def _write_json(path: str, value):
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(value, file, ensure_ascii=False, separators=(",", ":"))
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    CityCatalogue.build()
@@ -1,10 +1,16 @@
 import logging
+from typing import Iterable, Optional
 
 import spacy
 
 from src.application.event_bus import EventBus
+from src.application.latency_tracer import current_trace, tracer
 from src.application.session_management import Session, SessionManagement
-from src.config import MOCK_AI_RESPONSES, SYSTEM_PROMPT
+from src.config import (DIALOGUE_SEGMENT_MIN_CHARS, DIALOGUE_STREAMING,
+                        MOCK_AI_RESPONSES, SYSTEM_PROMPT)
+from src.domain.model.dialogue_segment import (DialogueSegment,
+                                               next_response_id)
+from src.domain.service.sentence_splitter import SentenceSplitter
 from src.interfaces.ai_provider_interface import TextToTextProvider
 from src.shared.helpers.constants import EventCategory, EventType
 
@@ -31,6 +37,8 @@ class DialogueManager:
         self.text_to_text_provider = text_to_text_provider
         self.event_bus = event_bus
         self.session_manager = session_manager
+        # SpeculativeResponseService with responses prepared ahead of time, if any
+        self.speculation = None
 
     def handle_event(self, event_type: EventType, data: str):
         """
@@ -39,7 +47,7 @@ class DialogueManager:
         if event_type == EventType.TRANSCRIPTION_COMPLETE:
             self.handle_transcription(data)
         elif event_type == EventType.DIALOGUE_RESPONSE_REQUEST:
-            self.generate_response(data)
+            self.handle_response_request(data)
 
     def handle_transcription(self, transcription: str):
         """
@@ -60,19 +68,34 @@ class DialogueManager:
 
         self.generate_response(transcription)
 
-    def generate_response(self, prompt: str) -> str:
+    def handle_response_request(self, prompt: str):
+        """
+        Responds to a prompt requested by a telemetry handler, which may have been
+        prepared ahead of time.
+        """
+        self.generate_response(prompt, use_speculation=True)
+
+    def generate_response(self, prompt: str, use_speculation: bool = False) -> str:
         """
         Generates a response based on the current prompt and the context from the session's interaction history.
+        With ``use_speculation``, a response prepared ahead of time for the same prompt is used if there is one.
         """
+        if current_trace.get() is None:
+            # not a user turn, trace the event-triggered response on its own
+            tracer.start("event", "response_request")
+        tracer.mark("dialogue_start")
 
         session = self.session_manager.get_current_session()
 
         if not session:
             logging.error("[DialogueManager] No active session found.")
+            tracer.finish("dialogue_start", outcome="no_session")
             return "I'm sorry, I seem to have lost our thread. Can you remind me what we were talking about?"
 
-        context = self.prepare_context(session)
-        system_text = SYSTEM_PROMPT + " " + context
+        system_text = SYSTEM_PROMPT + " " + self.prepare_context(session)
+        speculated = None
+        if use_speculation and self.speculation is not None:
+            speculated = self.speculation.take(prompt)
 
         logging.info("[DialogueManager] Sending crafted prompt")
         logging.debug("[DialogueManager] Sending prompt: %s", prompt)
@@ -80,20 +103,105 @@ class DialogueManager:
 
         response = "This is a mock response"
 
-        if MOCK_AI_RESPONSES is False:
+        tracer.mark("llm_request")
+        if speculated is not None:
+            tracer.mark("speculation_hit")
+        if DIALOGUE_STREAMING:
+            response = self.stream_response(
+                prompt, system_text, session, None if speculated is None else [speculated]
+            )
+        elif speculated is not None:
+            response = speculated
+        elif MOCK_AI_RESPONSES is False:
             response = self.text_to_text_provider.text_to_text(
                 prompt, system_text, session
             )
+        tracer.mark("llm_response")
 
         self.session_manager.add_interaction({"role": "user", "content": prompt})
         self.session_manager.add_interaction({"role": "assistant", "content": response})
 
-        self.event_bus.emit(
-            EventType.DIALOGUE_RESPONSE_COMPLETE, response, EventCategory.TEXT
-        )
+        if not DIALOGUE_STREAMING:
+            self.event_bus.emit(
+                EventType.DIALOGUE_RESPONSE_COMPLETE, response, EventCategory.TEXT
+            )
 
         logging.info("[DialogueManager] Generated response for session: %s", response)
 
+    def compose_response(self, prompt: str) -> Optional[str]:
+        """
+        Generates the response to a prompt without recording it in the session or
+        emitting anything, for responses prepared ahead of time.
+        """
+        session = self.session_manager.get_current_session()
+        if not session:
+            return None
+        if MOCK_AI_RESPONSES:
+            return "This is a mock response"
+        system_text = SYSTEM_PROMPT + " " + self.prepare_context(session)
+        response = self.text_to_text_provider.text_to_text(prompt, system_text, session)
+        if not isinstance(response, str):
+            # e.g. the raw prediction output of some providers, not usable as a prepared line
+            logging.warning(
+                "[DialogueManager] Cannot prepare a %s response ahead of time", type(response).__name__
+            )
+            return None
+        return response
+
+    def stream_response(
+        self,
+        prompt: str,
+        system_text: str,
+        session: Session,
+        chunks: Optional[Iterable[str]] = None,
+    ) -> str:
+        """
+        Streams the response from the text-to-text provider and emits each sentence as a
+        DIALOGUE_RESPONSE_SEGMENT as soon as it is complete, so speech can start while
+        the rest is still generating. Returns the full response. ``chunks`` replaces the
+        provider's stream, e.g. with a response prepared ahead of time. A provider error
+        ends the response after what was already received, or with a spoken apology if
+        nothing was.
+        """
+        if chunks is None and MOCK_AI_RESPONSES:
+            chunks = iter(["This is a mock response"])
+        elif chunks is None:
+            chunks = self.text_to_text_provider.text_to_text_stream(prompt, system_text, session)
+
+        response_id = next_response_id()
+        splitter = SentenceSplitter(DIALOGUE_SEGMENT_MIN_CHARS)
+        parts = []
+        index = 0
+        try:
+            for chunk in chunks:
+                if not parts:
+                    tracer.mark("llm_first_token")
+                parts.append(chunk)
+                for sentence in splitter.feed(chunk):
+                    self._emit_segment(response_id, sentence, index, last=False)
+                    index += 1
+        except Exception as e:
+            # the response is still closed below, so speech and listening resume
+            logging.error(f"[DialogueManager] Failed to stream response: {e}")
+
+        rest = splitter.flush()
+        if not rest and index == 0:
+            rest = ["I'm sorry, I couldn't process your request."]
+            parts = rest
+        # an empty last segment only marks the end of the response
+        self._emit_segment(response_id, rest[0] if rest else "", index, last=True)
+        return "".join(parts)
+
+    def _emit_segment(self, response_id: int, text: str, index: int, last: bool):
+        if index == 0 and text:
+            tracer.mark("first_sentence")
+        # listed in EVENT_NEVER_DROP, every segment reaches speech in order
+        self.event_bus.emit(
+            EventType.DIALOGUE_RESPONSE_SEGMENT,
+            DialogueSegment(text=text, index=index, last=last, response_id=response_id),
+            EventCategory.TEXT,
+        )
+
     def prepare_context(self, session: Session):
         """
         Prepares contextual information based on the user's profile data for the AI model.
@@ -119,7 +227,7 @@ class DialogueManager:
             EventType.TRANSCRIPTION_COMPLETE, self.handle_transcription
         )
         self.event_bus.subscribe(
-            EventType.DIALOGUE_RESPONSE_REQUEST, self.generate_response
+            EventType.DIALOGUE_RESPONSE_REQUEST, self.handle_response_request
         )
 
     def unregister(self):
@@ -130,5 +238,5 @@ class DialogueManager:
             EventType.TRANSCRIPTION_COMPLETE, self.handle_transcription
         )
         self.event_bus.unsubscribe(
-            EventType.DIALOGUE_RESPONSE_REQUEST, self.generate_response
+            EventType.DIALOGUE_RESPONSE_REQUEST, self.handle_response_request
         )
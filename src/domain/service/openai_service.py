@@ -1,7 +1,7 @@
 # openai_service.py
 import json
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 from openai import OpenAI
 
@@ -44,6 +44,37 @@ class OpenAIService:
             logging.error(f"Failed to generate text-to-text with OpenAI: {str(e)}")
             raise AIProcessingError(f"OpenAI text-to-text processing failed: {str(e)}")
 
+    @staticmethod
+    def text_to_text_stream(
+        input_text: str,
+        system_text: str,
+        user_messages: List[dict],
+        model: str = "gpt-3.5-turbo",
+        max_tokens: int = 4096,
+        temperature: float = 0.8,
+    ) -> Iterator[str]:
+        try:
+            combined_messages = [
+                {"role": "system", "content": system_text},
+                *user_messages,
+                {"role": "user", "content": input_text},
+            ]
+
+            stream = client.chat.completions.create(
+                model=model,
+                messages=combined_messages,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                stream=True,
+            )
+
+            for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        except Exception as e:
+            logging.error(f"Failed to stream text-to-text with OpenAI: {str(e)}")
+            raise AIProcessingError(f"OpenAI text-to-text streaming failed: {str(e)}")
+
     @staticmethod
     def text_to_audio(
         text: str,
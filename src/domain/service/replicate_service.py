@@ -1,6 +1,6 @@
 import logging
 import os
-from typing import Dict, Optional
+from typing import Dict, Iterator, Optional
 
 import replicate
 
@@ -26,3 +26,12 @@ def make_replicate_prediction(
     except Exception as e:
         logging.error(f"Failed to make prediction with Replicate: {str(e)}")
         return None
+
+
+def stream_replicate_prediction(model_version: str, input_data: Dict) -> Iterator[str]:
+    """Yield the output events of a streaming model as they arrive."""
+    try:
+        for event in replicate.run(model_version, input=input_data):
+            yield str(event)
+    except Exception as e:
+        logging.error(f"Failed to stream prediction with Replicate: {str(e)}")
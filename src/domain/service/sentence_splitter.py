@@ -0,0 +1,68 @@
+import re
+from typing import List
+
+# end of a sentence: terminal punctuation, optional closing quotes or brackets,
+# then whitespace; or a line break
+SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?…])[\"'”’)\]]*\s+|\n+")
+
+# abbreviations whose trailing period does not end a sentence
+ABBREVIATIONS = {"mr", "mrs", "ms", "dr", "st", "vs", "etc", "e.g", "i.e", "approx", "km", "mph"}
+
+
+class SentenceSplitter:
+    """
+    Splits a streamed text into sentences as soon as each one is complete.
+
+    Chunks of any size are fed in as they arrive; ``feed`` returns the
+    sentences completed so far and keeps the unfinished tail. Sentences
+    shorter than ``min_chars`` are held back and joined with the next one, so
+    speech is not chopped into single words. ``flush`` returns what is left
+    once the stream has ended.
+    """
+
+    def __init__(self, min_chars: int = 20):
+        self.min_chars = min_chars
+        self.buffer = ""
+        self.pending = ""
+
+    def feed(self, chunk: str) -> List[str]:
+        self.buffer += chunk
+        sentences = []
+        start = 0
+        for match in SENTENCE_BOUNDARY.finditer(self.buffer):
+            candidate = self.buffer[start:match.end()]
+            if _ends_with_abbreviation(candidate):
+                continue
+            start = match.end()
+            sentence = self._hold_short(candidate)
+            if sentence:
+                sentences.append(sentence)
+        self.buffer = self.buffer[start:]
+        return sentences
+
+    def flush(self) -> List[str]:
+        rest = (self.pending + self.buffer).strip()
+        self.pending = ""
+        self.buffer = ""
+        return [rest] if rest else []
+
+    def _hold_short(self, candidate: str) -> str:
+        sentence = (self.pending + candidate).strip()
+        if len(sentence) < self.min_chars:
+            self.pending = sentence + " " if sentence else ""
+            return ""
+        self.pending = ""
+        return sentence
+
+
+def split_sentences(text: str, min_chars: int = 20) -> List[str]:
+    """Split a complete text the same way SentenceSplitter splits it when streamed."""
+    splitter = SentenceSplitter(min_chars)
+    return splitter.feed(text) + splitter.flush()
+
+
+def _ends_with_abbreviation(text: str) -> bool:
+    words = text.rstrip().rstrip("\"'”’)]").split()
+    if not words or not words[-1].endswith("."):
+        return False
+    return words[-1][:-1].lower() in ABBREVIATIONS
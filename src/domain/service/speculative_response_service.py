@@ -0,0 +1,167 @@
+import logging
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Deque, Dict, List, Optional
+
+from src.application.event_bus import EventBus
+from src.config import (DIALOGUE_SEGMENT_MIN_CHARS, DIALOGUE_STREAMING,
+                        MOCK_AI_RESPONSES)
+from src.domain.service.sentence_splitter import split_sentences
+from src.domain.service.text_to_audio_cache import CachedTextToAudioProvider
+from src.interfaces.ai_provider_interface import TextToAudioProvider
+
+
+class SpeculativeResponse:
+    def __init__(self, text: str):
+        self.text = text
+        self.created_at = time.monotonic()
+
+
+class SpeculativeResponseService:
+    """
+    Prepares likely co-driver lines before they are asked for.
+
+    Telemetry handlers offer the prompts they expect to emit soon, such as the
+    approach of the next city. While the co-driver is idle, a background
+    thread generates the response text for the most recent offers and
+    synthesizes its sentences into the text-to-audio cache, so when the
+    handler fires the DialogueManager takes the prepared text and speech
+    starts from cached audio. Prepared responses expire after ``ttl``
+    seconds and at most ``budget_per_hour`` are prepared per hour, which
+    bounds the cost of guesses that never come true. Hits and misses only
+    count prompts that were offered, so the hit rate measures the guesses.
+    """
+
+    def __init__(
+        self,
+        event_bus: EventBus,
+        dialogue_manager,
+        text_to_audio_provider: TextToAudioProvider,
+        ttl: float = 600,
+        budget_per_hour: int = 30,
+        max_pending: int = 4,
+        max_offered: int = 64,
+    ):
+        self.event_bus = event_bus
+        self.dialogue_manager = dialogue_manager
+        self.text_to_audio_provider = text_to_audio_provider
+        self.ttl = ttl
+        self.budget_per_hour = budget_per_hour
+        self.lock = threading.Lock()
+        self.wakeup = threading.Event()
+        self.ready: "OrderedDict[str, SpeculativeResponse]" = OrderedDict()
+        self.pending: Deque[str] = deque(maxlen=max_pending)
+        # recently offered prompts, a request for any other prompt is not a miss
+        self.offered: "OrderedDict[str, None]" = OrderedDict()
+        self.max_offered = max_offered
+        self.spent: Deque[float] = deque()
+        self.worker: Optional[threading.Thread] = None
+        self.running = False
+        self.stats = {"prepared": 0, "hits": 0, "misses": 0, "expired": 0, "failed": 0}
+
+    def register(self):
+        if self.worker is not None:
+            return
+        self.running = True
+        self.worker = threading.Thread(target=self._run, name="SpeculativeResponses", daemon=True)
+        self.worker.start()
+
+    def unregister(self):
+        self.running = False
+        self.wakeup.set()
+        if self.worker is not None:
+            self.worker.join(timeout=5)
+            self.worker = None
+
+    def offer(self, prompts: List[str]):
+        """Queue prompts that are likely to be requested soon, most likely first."""
+        with self.lock:
+            self._expire()
+            for prompt in reversed(prompts):
+                self.offered[prompt] = None
+                self.offered.move_to_end(prompt)
+                if prompt in self.ready or prompt in self.pending:
+                    continue
+                # the newest offers are the most relevant, the oldest fall off
+                self.pending.appendleft(prompt)
+            while len(self.offered) > self.max_offered:
+                self.offered.popitem(last=False)
+        self.wakeup.set()
+
+    def take(self, prompt: str) -> Optional[str]:
+        """Return and forget the prepared response to ``prompt``, if still fresh."""
+        with self.lock:
+            self._expire()
+            response = self.ready.pop(prompt, None)
+            offered = self.offered.pop(prompt, False) is None
+            if response is None:
+                if offered:
+                    self.stats["misses"] += 1
+                return None
+            self.stats["hits"] += 1
+        logging.info(
+            "[SpeculativeResponseService] Using prepared response, %.0fs old",
+            time.monotonic() - response.created_at,
+        )
+        return response.text
+
+    def get_stats(self) -> Dict:
+        with self.lock:
+            return dict(self.stats, ready=len(self.ready), pending=len(self.pending))
+
+    def _expire(self):
+        now = time.monotonic()
+        for prompt in [p for p, response in self.ready.items() if now - response.created_at > self.ttl]:
+            del self.ready[prompt]
+            self.stats["expired"] += 1
+
+    def _has_budget(self) -> bool:
+        now = time.monotonic()
+        while self.spent and now - self.spent[0] > 3600:
+            self.spent.popleft()
+        return len(self.spent) < self.budget_per_hour
+
+    def _run(self):
+        while self.running:
+            self.wakeup.wait(timeout=1.0)
+            self.wakeup.clear()
+            while self.running:
+                # speculation only uses idle time, never competes with a live response
+                if self.event_bus.telemetry_handlers_blocked:
+                    break
+                with self.lock:
+                    if not self.pending or not self._has_budget():
+                        break
+                    prompt = self.pending.popleft()
+                    self.spent.append(time.monotonic())
+                self._prepare(prompt)
+
+    def _prepare(self, prompt: str):
+        started = time.perf_counter()
+        try:
+            text = self.dialogue_manager.compose_response(prompt)
+            if not text:
+                raise ValueError("no text response")
+            self._warm_audio(text)
+        except Exception as e:
+            logging.error(f"[SpeculativeResponseService] Failed to prepare response: {e}")
+            with self.lock:
+                self.stats["failed"] += 1
+            return
+        with self.lock:
+            self.ready[prompt] = SpeculativeResponse(text)
+            self.stats["prepared"] += 1
+        logging.info(
+            "[SpeculativeResponseService] Prepared response in %.1fs: %s",
+            time.perf_counter() - started,
+            prompt,
+        )
+
+    def _warm_audio(self, text: str):
+        """Synthesize the response the way SpeechOutputService will, so it hits the cache."""
+        if MOCK_AI_RESPONSES or not isinstance(self.text_to_audio_provider, CachedTextToAudioProvider):
+            return
+        segments = split_sentences(text, DIALOGUE_SEGMENT_MIN_CHARS) if DIALOGUE_STREAMING else [text]
+        for segment in segments:
+            self.text_to_audio_provider.text_to_audio(segment)
@@ -0,0 +1,42 @@
+import numpy as np
+
+
+class CaptureBuffer:
+    """
+    Preallocated float32 buffer for one utterance of microphone capture.
+
+    Audio callbacks append each block with a single slice copy, so the
+    real-time thread neither allocates nor creates Python objects per sample.
+    The buffer holds at most ``capacity`` samples; ``append`` returns False
+    once it is full so the caller can end the utterance. ``view`` exposes the
+    captured samples as a contiguous array without copying them.
+    """
+
+    def __init__(self, capacity: int):
+        self.samples = np.zeros(capacity, dtype=np.float32)
+        self.length = 0
+
+    def __len__(self) -> int:
+        return self.length
+
+    @property
+    def capacity(self) -> int:
+        return len(self.samples)
+
+    @property
+    def full(self) -> bool:
+        return self.length >= len(self.samples)
+
+    def append(self, block: np.ndarray) -> bool:
+        """Copy a block of samples in; returns False if it did not fit whole."""
+        count = min(len(block), len(self.samples) - self.length)
+        self.samples[self.length:self.length + count] = block[:count]
+        self.length += count
+        return count == len(block)
+
+    def view(self) -> np.ndarray:
+        """The captured samples; valid until the next ``clear``."""
+        return self.samples[: self.length]
+
+    def clear(self):
+        self.length = 0
@@ -0,0 +1,19 @@
+from math import gcd
+
+import numpy as np
+from scipy.signal import resample_poly
+
+# Whisper models take 16 kHz mono float32 audio
+WHISPER_SAMPLE_RATE = 16000
+
+
+def prepare_whisper_audio(samples, samplerate: int) -> np.ndarray:
+    """
+    Convert captured mono samples to the array Whisper transcribes directly:
+    float32, contiguous and resampled to 16 kHz with a polyphase filter.
+    """
+    audio = np.asarray(samples, dtype=np.float32)
+    if samplerate != WHISPER_SAMPLE_RATE:
+        divisor = gcd(samplerate, WHISPER_SAMPLE_RATE)
+        audio = resample_poly(audio, WHISPER_SAMPLE_RATE // divisor, samplerate // divisor)
+    return np.ascontiguousarray(audio, dtype=np.float32)
@@ -4,10 +4,15 @@ from typing import Any
 import numpy as np
 import sounddevice as sd
 import torch
-from scipy.io.wavfile import write
 from whisper import load_model
 
 from src.application.event_bus import EventBus
+from src.application.latency_tracer import tracer
+from src.config import SPEECH_MAX_UTTERANCE_SECONDS
+from src.domain.service.speech_listener_providers.capture_buffer import \
+    CaptureBuffer
+from src.domain.service.speech_listener_providers.whisper_audio import \
+    prepare_whisper_audio
 from src.interfaces.speech_listener_interface import SpeechListenerInterface
 from src.shared.helpers.constants import EventCategory, EventType
 
@@ -23,19 +28,17 @@ class WhisperSpeechListenerProvider(SpeechListenerInterface):
         event_bus: EventBus,
         input_device_index: int,
         model_name: str = "base",
-        temp_directory: str = "/tmp",
     ) -> None:
         self.event_bus = event_bus
         self.input_device_index = input_device_index
         self.model = load_model(
             model_name, device="cuda" if torch.cuda.is_available() else "cpu"
         )
-        self.temp_directory = temp_directory
         self.fs = 44100
         self.silent_threshold = 1.3
         self.grace_period = 2
         self.buffer = []
-        self.recording = []
+        self.recording = CaptureBuffer(int(self.fs * SPEECH_MAX_UTTERANCE_SECONDS))
         self.silence_duration = 0.0
         self.speech_detected = False
         self.recording_finished = False
@@ -56,7 +59,7 @@ class WhisperSpeechListenerProvider(SpeechListenerInterface):
             )
             self.stop_listening()
 
-        self.recording = []
+        self.recording.clear()
         self.silence_duration = 0.0
         self.speech_detected = False
         self.stream = sd.InputStream(
@@ -109,7 +112,12 @@ class WhisperSpeechListenerProvider(SpeechListenerInterface):
 
             self.silence_duration = 0
             self.speech_detected = True
-            self.recording.extend(indata[:, 0])
+            if not self.recording.append(indata[:, 0]):
+                logging.warning(
+                    "[WhisperSpeechListenerProvider] Maximum utterance length of %ss reached",
+                    SPEECH_MAX_UTTERANCE_SECONDS,
+                )
+                self._finish_recording()
         else:
             if self.speech_detected:
                 self.silence_duration += frames / self.fs
@@ -118,44 +126,53 @@ class WhisperSpeechListenerProvider(SpeechListenerInterface):
                         "[WhisperSpeechListenerProvider] Still in grace period, recording extended. Current length: %s",
                         len(self.recording),
                     )
-                    self.recording.extend(indata[:, 0])
+                    if not self.recording.append(indata[:, 0]):
+                        self._finish_recording()
                 else:
                     logging.debug(
                         "[WhisperSpeechListenerProvider] Recording finished, silence duration: %s",
                         self.silence_duration,
                     )
+                    self._finish_recording()
 
-                    self.event_bus.emit(
-                        EventType.USER_SPEECH_END, None, category=EventCategory.AUDIO
-                    )
-                    self.event_bus.emit(
-                        EventType.AUDIO_INPUT_PAUSE, None, category=EventCategory.AUDIO
-                    )
-                    self.event_bus.emit(
-                        EventType.REQUEST_IN_PROGRESS, None, category=EventCategory.GENERIC
-                    )
+    def _finish_recording(self):
+        """
+        Ends the utterance: signals the end of the user's speech, transcribes it and stops the stream.
+        """
+        tracer.start("conversation", "speech_end")
+        self.event_bus.emit(
+            EventType.USER_SPEECH_END, None, category=EventCategory.AUDIO
+        )
+        self.event_bus.emit(
+            EventType.AUDIO_INPUT_PAUSE, None, category=EventCategory.AUDIO
+        )
+        self.event_bus.emit(
+            EventType.REQUEST_IN_PROGRESS, None, category=EventCategory.GENERIC
+        )
 
-                    self.recording_finished = True
-                    self.silence_duration = 0
-                    self.speech_detected = False
-                    self._process_audio()
-                    self.stop_listening()
-                    logging.debug(
-                        "[WhisperSpeechListenerProvider] Recording finished and stream stopped"
-                    )
+        self.recording_finished = True
+        self.silence_duration = 0
+        self.speech_detected = False
+        self._process_audio()
+        self.stop_listening()
+        logging.debug(
+            "[WhisperSpeechListenerProvider] Recording finished and stream stopped"
+        )
 
     def _process_audio(self):
         """
         Processes the recorded audio data by transcribing it and handling the response.
+        The recording is handed to Whisper in memory, already resampled to 16 kHz.
         """
         logging.debug("[WhisperSpeechListenerProvider] Processing recorded audio data")
-        if self.recording:
-            output_wav = f"{self.temp_directory}/temp_recording.wav"
-            write(output_wav, self.fs, np.array(self.recording, dtype=np.float32))
+        if len(self.recording):
+            audio = prepare_whisper_audio(self.recording.view(), self.fs)
             logging.info("[WhisperSpeechListenerProvider] Transcribing...")
-            result = self.model.transcribe(output_wav)
+            tracer.mark("transcription_start")
+            result = self.model.transcribe(audio)
             transcription = result.get("text", "")
             if transcription:
+                tracer.mark("transcription_complete")
                 logging.info(
                     "[WhisperSpeechListenerProvider] Transcription successful: %s",
                     transcription,
@@ -170,6 +187,8 @@ class WhisperSpeechListenerProvider(SpeechListenerInterface):
                 logging.error(
                     "[WhisperSpeechListenerProvider] No transcription returned."
                 )
-            self.recording = []  # Clear recording after processing
+                tracer.finish("transcription_complete", outcome="no_transcription")
+            self.recording.clear()  # Clear recording after processing
         else:
             logging.error("[WhisperSpeechListenerProvider] No recording data found.")
+            tracer.finish("transcription_start", outcome="no_recording")
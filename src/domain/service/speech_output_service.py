@@ -1,25 +1,46 @@
 import logging
-import os
-import subprocess
+import queue
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Set, Tuple
 
 from src.application.event_bus import EventBus
+from src.application.latency_tracer import Trace, current_trace, tracer
 from src.config import MOCK_AI_RESPONSES
+from src.domain.model.dialogue_segment import (DialogueSegment,
+                                               next_response_id)
+from src.infrastructure.input_output.audio_player import AudioPlayer
 from src.interfaces.ai_provider_interface import TextToAudioProvider
 from src.shared.helpers.constants import EventType
 
+MOCK_AUDIO_PATH = "./mock_output.wav"
+
 
 class SpeechOutputService:
     """
     Handles speech output by converting text responses to audio and managing the playback.
     The service interacts with an event bus to listen for complete dialogue responses
     and controls audio output to ensure user interactions are handled in sequence.
+
+    Streamed responses arrive sentence by sentence. A synthesis thread converts each
+    sentence to audio and queues the decoded samples on the AudioPlayer, which plays
+    them back to back while the next sentences are synthesized, so the co-driver starts
+    talking after the first sentence instead of the whole response. Audio never touches
+    the disk, and CO_DRIVER_SPEECH_END is emitted when the last sentence has played.
+    Responses streamed at the same time are played one after the other, in the order
+    their first sentence arrived; the sentences of a response waiting for its turn are
+    held back until the response before it has been queued in full.
+
+    When the user starts speaking (USER_SPEECH_START) the co-driver is cut off: queued
+    sentences and playback are dropped, the rest of the interrupted response is ignored
+    as it arrives, and the response ends as if it had finished playing.
     """
 
     def __init__(
         self,
         event_bus: EventBus,
         text_to_audio_provider: TextToAudioProvider,
-        audio_output_path: str,
+        audio_player: AudioPlayer,
     ):
         """
         Initializes the SpeechOutputService with necessary components for audio management.
@@ -27,11 +48,25 @@ class SpeechOutputService:
         Args:
         event_bus (EventBus): The system's event bus for subscribing to and emitting events.
         text_to_audio_provider (TextToAudioProvider): Provider for converting text to audio.
-        audio_output_path (str): Path where audio files are stored temporarily.
+        audio_player (AudioPlayer): Output stream the speech is played on.
         """
         self.event_bus: EventBus = event_bus
         self.text_to_audio_provider: TextToAudioProvider = text_to_audio_provider
-        self.audio_output_path: str = audio_output_path
+        self.audio_player: AudioPlayer = audio_player
+        self.synthesis_queue: queue.Queue = queue.Queue()
+        self.worker: Optional[threading.Thread] = None
+        self.lock = threading.Lock()
+        # bumped by every interrupt, work queued before it is stale
+        self.generation = 0
+        # response id -> (next index to queue, segments waiting for it), in playing order;
+        # the first one is being queued, the others wait for their turn
+        self.pending: "OrderedDict[int, Tuple[int, Dict[int, tuple]]]" = OrderedDict()
+        # interrupted responses whose remaining segments are dropped as they arrive
+        self.discarded: Set[int] = set()
+        # responses queued or playing whose end has not been signalled yet
+        self.open_responses = 0
+        self.response_audible = False
+        self.response_trace: Optional[Trace] = None
 
     def register(self) -> None:
         """
@@ -40,6 +75,16 @@ class SpeechOutputService:
         self.event_bus.subscribe(
             EventType.DIALOGUE_RESPONSE_COMPLETE, self.handle_dialogue_response
         )
+        self.event_bus.subscribe(
+            EventType.DIALOGUE_RESPONSE_SEGMENT, self.handle_dialogue_segment
+        )
+        self.event_bus.subscribe(EventType.USER_SPEECH_START, self.interrupt)
+        self.audio_player.start()
+        if self.worker is None:
+            self.worker = threading.Thread(
+                target=self._synthesis_loop, name="SpeechOutput-synthesis", daemon=True
+            )
+            self.worker.start()
 
     def unregister(self) -> None:
         """
@@ -48,6 +93,15 @@ class SpeechOutputService:
         self.event_bus.unsubscribe(
             EventType.DIALOGUE_RESPONSE_COMPLETE, self.handle_dialogue_response
         )
+        self.event_bus.unsubscribe(
+            EventType.DIALOGUE_RESPONSE_SEGMENT, self.handle_dialogue_segment
+        )
+        self.event_bus.unsubscribe(EventType.USER_SPEECH_START, self.interrupt)
+        if self.worker is not None:
+            self.synthesis_queue.put(None)
+            self.worker.join(timeout=5)
+            self.worker = None
+        self.audio_player.close()
 
     def handle_dialogue_response(self, dialogue_response: str) -> None:
         """
@@ -58,61 +112,163 @@ class SpeechOutputService:
         dialogue_response (str): The text response from dialogue processing to be spoken.
         """
         logging.debug("[SpeechOutputService] Handling dialogue response")
-        try:
+        self.handle_dialogue_segment(
+            DialogueSegment(text=dialogue_response, index=0, last=True, response_id=next_response_id())
+        )
 
-            if MOCK_AI_RESPONSES:
-                audio_file_path: str = './mock_output.wav'
-            else:
-                audio_data: bytes = self.text_to_audio_provider.text_to_audio(dialogue_response)
-                audio_file_path: str = self._save_audio_data(audio_data)
+    def handle_dialogue_segment(self, segment: DialogueSegment) -> None:
+        """
+        Queues one sentence of a streamed response for synthesis; it is played once the
+        sentences before it have been played.
 
-            self.event_bus.emit(EventType.CO_DRIVER_SPEECH_START, None)
-            self._play_audio_file(audio_file_path)
-            self.event_bus.emit(EventType.CO_DRIVER_SPEECH_END, None)
-            self.event_bus.emit(EventType.AUDIO_INPUT_RESUME, None)
-            self.event_bus.emit(EventType.REQUEST_COMPLETE, None)
+        Args:
+        segment (DialogueSegment): The sentence, its position and whether it is the last one.
+        """
+        trace = current_trace.get()
+        response_id = segment.response_id
+        with self.lock:
+            if response_id in self.discarded:
+                if segment.last:
+                    self.discarded.discard(response_id)
+                logging.debug("[SpeechOutputService] Dropped segment %s of an interrupted response", segment.index)
+                return
+            if response_id not in self.pending:
+                self.pending[response_id] = (0, {})
+                self.open_responses += 1
+            self.pending[response_id][1][segment.index] = (segment, trace)
+            self._queue_pending()
+        logging.debug("[SpeechOutputService] Received segment %s of response %s", segment.index, response_id)
 
-            logging.debug("[SpeechOutputService] Unblocking telemetry handlers")
-            self.event_bus.unblock_telemetry_handlers()
+    def _queue_pending(self) -> None:
+        """
+        Queues the segments of the response whose turn it is, in order, moving on to the
+        next response once the last segment is queued. Called with the lock held.
+        """
+        while self.pending:
+            response_id, (index, segments) = next(iter(self.pending.items()))
+            finished = False
+            while index in segments and not finished:
+                segment, trace = segments.pop(index)
+                self.response_trace = trace
+                self.synthesis_queue.put((segment, trace, self.generation))
+                index += 1
+                finished = segment.last
+            if not finished:
+                self.pending[response_id] = (index, segments)
+                return
+            del self.pending[response_id]
 
+    def interrupt(self, _data=None) -> None:
+        """
+        Cuts the co-driver off: drops the sentences waiting for synthesis, stops playback
+        and ends the response.
+        """
+        with self.lock:
+            if not self.open_responses:
+                return
+            self.generation += 1
+            # responses still streaming drop the rest of their segments
+            self.discarded.update(
+                response_id
+                for response_id, (_, segments) in self.pending.items()
+                if not any(segment.last for segment, _ in segments.values())
+            )
+            self.pending.clear()
+            while True:
+                try:
+                    self.synthesis_queue.get_nowait()
+                except queue.Empty:
+                    break
+            dropped = self.audio_player.interrupt()
+            self.open_responses = 0
+            self.response_audible = False
+            trace = self.response_trace
+        logging.info("[SpeechOutputService] Speech interrupted, dropped %s segments", dropped)
+        # the callbacks of the dropped segments are stale, the response ends here once
+        self._in_trace(trace, self._end_response)(False, True, True)
 
-        except Exception as e:
-            logging.error("[SpeechOutputService] Error in handling transcription: %s", str(e))
+    def _synthesis_loop(self) -> None:
+        while True:
+            item = self.synthesis_queue.get()
+            if item is None:
+                return
+            segment, trace, generation = item
+            current_trace.set(trace)
+            samples = None
+            if segment.text:
+                try:
+                    if segment.index == 0:
+                        tracer.mark("tts_request")
+                    samples = self.audio_player.decode(self._synthesize(segment.text))
+                    if segment.index == 0:
+                        tracer.mark("tts_complete")
+                except Exception as e:
+                    logging.error("[SpeechOutputService] Error synthesizing segment %s: %s", segment.index, str(e))
 
-    def _save_audio_data(self, audio_data: bytes) -> str:
+            with self.lock:
+                if generation != self.generation:
+                    continue  # interrupted while it was synthesized
+                on_start = None
+                if samples is not None and not self.response_audible:
+                    self.response_audible = True
+                    on_start = self._in_trace(trace, lambda: self._start_speech(generation))
+                on_finished = None
+                if segment.last:
+                    audible = self.response_audible
+                    self.response_audible = False
+                    on_finished = self._in_trace(
+                        trace, lambda completed: self._finish_speech(completed, audible, generation)
+                    )
+                if samples is not None or on_finished is not None:
+                    self.audio_player.play(
+                        samples if samples is not None else [], on_start=on_start, on_finished=on_finished
+                    )
+
+    def _synthesize(self, text: str) -> bytes:
+        """
+        Converts text to audio and returns the encoded audio file.
         """
-        Saves the generated audio data to a file.
+        if MOCK_AI_RESPONSES:
+            with open(MOCK_AUDIO_PATH, "rb") as audio_file:
+                return audio_file.read()
+        return self.text_to_audio_provider.text_to_audio(text)
 
-        Args:
-        audio_data (bytes): Binary audio data to be saved.
+    @staticmethod
+    def _in_trace(trace: Optional[Trace], callback: Callable) -> Callable:
+        """Wraps a playback callback to run under the trace of its response."""
+        def run(*args):
+            current_trace.set(trace)
+            callback(*args)
+        return run
 
-        Returns:
-        str: The path to the saved audio file.
-        """
-        audio_file_path = os.path.join(self.audio_output_path, "response_audio.wav")
-        with open(audio_file_path, "wb") as audio_file:
-            audio_file.write(audio_data)
-        return audio_file_path
+    def _start_speech(self, generation: int) -> None:
+        if generation != self.generation:
+            return
+        self.event_bus.emit(EventType.CO_DRIVER_SPEECH_START, None)
+        tracer.mark("audio_start")
 
-    def _play_audio_file(self, file_path: str) -> None:
-        """
-        Plays the specified audio file using the system's default audio player.
+    def _finish_speech(self, completed: bool, audible: bool, generation: int) -> None:
+        with self.lock:
+            if generation != self.generation:
+                return  # interrupted, interrupt() has ended the response
+            self.open_responses -= 1
+        self._end_response(completed, audible)
 
-        Args:
-        file_path (str): The path to the audio file to be played.
-        """
-        cmd = ["afplay", file_path]
-        logging.debug("[SpeechOutputService] Executing command to play audio: %s", " ".join(cmd))
-        subprocess.call(cmd)
-        self._cleanup_temp_files(file_path)
+    def _end_response(self, completed: bool, audible: bool, barge_in: bool = False) -> None:
+        outcome = "ok" if audible else "no_audio"
+        tracer.finish("audio_end", outcome=outcome if completed else "interrupted")
+        self._end_speech(barge_in)
 
-    def _cleanup_temp_files(self, file_path: str) -> None:
+    def _end_speech(self, barge_in: bool = False) -> None:
         """
-        Removes the temporary audio file after playing it.
-
-        Args:
-        file_path (str): The path to the audio file to be removed.
+        Signals the end of the co-driver's speech and hands the floor back to the user.
+        After a barge-in the user holds the floor, so telemetry handlers stay blocked
+        until they are done.
         """
-        if os.path.exists(file_path):
-            os.remove(file_path)
-            logging.debug("[SpeechOutputService] Cleaned up temporary audio file: %s", file_path)
+        self.event_bus.emit(EventType.CO_DRIVER_SPEECH_END, None)
+        self.event_bus.emit(EventType.AUDIO_INPUT_RESUME, None)
+        self.event_bus.emit(EventType.REQUEST_COMPLETE, None)
+
+        if not barge_in:
+            logging.debug("[SpeechOutputService] Unblocking telemetry handlers")
+            self.event_bus.unblock_telemetry_handlers()
@@ -1,18 +1,31 @@
 import asyncio
 import logging
+import os
 import time
 from abc import ABC, abstractmethod
-from multiprocessing import shared_memory
+from multiprocessing import resource_tracker, shared_memory
 
 from src.application.event_bus import EventBus
-from src.config import MOCK_TELEMETRY_DATA
+from src.config import (MOCK_TELEMETRY_DATA, TELEMETRY_DECODER,
+                        TELEMETRY_IDLE_RATE_HZ, TELEMETRY_MAX_RATE_HZ,
+                        TELEMETRY_POLL_RATE_HZ, TELEMETRY_RECORD_PATH,
+                        TELEMETRY_REPLAY_PATH, TELEMETRY_REPLAY_SPEED,
+                        TELEMETRY_SHARED_MEMORY_NAME)
 from src.domain.event.telemetry.telemetry_subscription_manager import \
     TelemetrySubscriptionManager
 from src.domain.model.telemetry_data import MockTelemetry, TelemetryData
+from src.domain.service.telemetry_frame_decoder import TelemetryFrameDecoder
 from src.domain.service.telemetry_location_service import \
     TelemetryLocationService
+from src.domain.service.telemetry_recorder import (TelemetryRecorder,
+                                                   TelemetryReplaySource)
+from src.domain.service.telemetry_scheduler import TelemetryScheduler
+from src.domain.service.telemetry_snapshot_reader import \
+    TelemetrySnapshotReader
 from src.domain.service.telemetry_versions import version_1_10, version_1_12
-from src.shared.helpers.constants import EventType
+from src.domain.service.telemetry_versions.numpy_layout import \
+    TelemetryRecordView
+from src.shared.helpers.constants import EventCategory, EventType
 
 
 class ITelemetryClient(ABC):
@@ -30,36 +43,143 @@ class ITelemetryClient(ABC):
 
 
 class TelemetryClientService(ITelemetryClient):
-    def __init__(self, telemetry_subscription_manager: TelemetrySubscriptionManager):
+    def __init__(
+        self,
+        telemetry_subscription_manager: TelemetrySubscriptionManager,
+        event_bus: EventBus = None,
+    ):
         self.telemetry_subscription_manager = telemetry_subscription_manager
+        self.event_bus = event_bus
         self.mock_telemetry = MockTelemetry()
         self.location_service = TelemetryLocationService()
+        self.scheduler = TelemetryScheduler(
+            TELEMETRY_POLL_RATE_HZ, TELEMETRY_IDLE_RATE_HZ, TELEMETRY_MAX_RATE_HZ
+        )
         self.shared_memory = None
+        self.replay_source = None
+        self.recorder = None
         self.telemetry_version = None
+        self.snapshot_reader = None
+        self.frame_decoder = None
+        self.subscription_revision = None
         self.previous_data = None
+        self.last_frame_time = None
+        self.paused = False
+        self.paused_since = None
         self.running = False
         self.init()
 
     def init(self):
         """Initialize telemetry data source based on configuration."""
-        if MOCK_TELEMETRY_DATA:
+        if TELEMETRY_REPLAY_PATH:
+            logging.info(
+                "[TelemetryClientService] Replaying telemetry from %s at speed %s.",
+                TELEMETRY_REPLAY_PATH,
+                TELEMETRY_REPLAY_SPEED,
+            )
+            self.replay_source = TelemetryReplaySource(
+                TELEMETRY_REPLAY_PATH, TELEMETRY_REPLAY_SPEED
+            )
+            if self.replay_source.is_raw:
+                self.init_frame_source(self.replay_source.buffer)
+            else:
+                self.telemetry_version = self.mock_telemetry_version
+        elif MOCK_TELEMETRY_DATA:
             logging.info("Initializing mock telemetry data.")
             self.telemetry_version = self.mock_telemetry_version
         else:
             try:
-                self.shared_memory = shared_memory.SharedMemory(
-                    name="Local\\SCSTelemetry", create=False
+                self.shared_memory = self.attach_shared_memory(
+                    TELEMETRY_SHARED_MEMORY_NAME
                 )
-                for version in [version_1_10, version_1_12]:
-                    if version.is_same_version(self.shared_memory.buf):
-                        self.telemetry_version = version
-                        break
-                if not self.telemetry_version:
-                    raise ValueError("Unsupported telemetry SDK version")
+                self.init_frame_source(self.shared_memory.buf)
             except FileNotFoundError:
                 logging.error("Shared memory segment not found.")
                 raise ConnectionError("Shared memory segment not found.")
 
+        if TELEMETRY_RECORD_PATH:
+            self.recorder = TelemetryRecorder(TELEMETRY_RECORD_PATH)
+
+    @staticmethod
+    def attach_shared_memory(name: str) -> shared_memory.SharedMemory:
+        """Attach to the telemetry segment owned by the game plugin (or a stand-in)."""
+        segment = shared_memory.SharedMemory(name=name, create=False)
+        if os.name == "posix":
+            # the resource tracker would unlink the producer's segment when we exit
+            resource_tracker.unregister(segment._name, "shared_memory")
+        return segment
+
+    def init_frame_source(self, buffer):
+        """Detect the SDK version of a raw frame buffer and set up decoding from it."""
+        for version in [version_1_10, version_1_12]:
+            if version.is_same_version(buffer):
+                self.telemetry_version = version
+                break
+        if not self.telemetry_version:
+            raise ValueError("Unsupported telemetry SDK version")
+        self.snapshot_reader = TelemetrySnapshotReader(
+            buffer, self.telemetry_version.compiled_telemetry
+        )
+        self.frame_decoder = TelemetryFrameDecoder(
+            self.telemetry_version.compiled_telemetry
+        )
+
+    @property
+    def is_raw_source(self) -> bool:
+        """True when telemetry is decoded from raw SDK frames (live or replayed)."""
+        return self.snapshot_reader is not None
+
+    def configure_decoder(self):
+        """
+        Limit up-front decoding to the fields the subscribed handlers and the
+        location service need, everything else is decoded when accessed.
+        """
+        revision = self.telemetry_subscription_manager.revision
+        if revision == self.subscription_revision:
+            return
+        patterns = (
+            self.telemetry_subscription_manager.get_patterns()
+            + self.location_service.required_fields
+            + self.scheduler.required_fields
+        )
+        self.frame_decoder.configure(patterns)
+        self.subscription_revision = revision
+        logging.debug(
+            "[TelemetryClientService] Decoding fields up front: %s",
+            self.frame_decoder.selected_keys,
+        )
+
+    def has_new_frame(self) -> bool:
+        """
+        Check the frame header before decoding anything. Returns False while the
+        game is paused or has not produced a frame since the last check.
+        """
+        if self.replay_source and not self.replay_source.advance():
+            return False
+        if not self.is_raw_source:
+            return True
+        paused, frame_time = self.snapshot_reader.read_header()
+        self.update_pause_state(paused)
+        if paused or frame_time == self.last_frame_time:
+            return False
+        self.last_frame_time = frame_time
+        return True
+
+    def update_pause_state(self, paused: bool):
+        """Emit GAME_PAUSED / GAME_RESUMED (with the paused duration) on transitions."""
+        if paused == self.paused:
+            return
+        self.paused = paused
+        if paused:
+            self.paused_since = time.monotonic()
+            event_type, data = EventType.GAME_PAUSED, None
+        else:
+            event_type = EventType.GAME_RESUMED
+            data = time.monotonic() - self.paused_since if self.paused_since else 0.0
+        logging.info("[TelemetryClientService] %s", event_type.name)
+        if self.event_bus:
+            self.event_bus.emit(event_type, data, EventCategory.TELEMETRY)
+
     def emit_data(self, data):
         """Emit telemetry data."""
         self.telemetry_subscription_manager.notify_handlers(data)
@@ -70,10 +190,29 @@ class TelemetryClientService(ITelemetryClient):
 
         if not self.telemetry_version:
             raise ValueError("Telemetry version is not set.")
-        if MOCK_TELEMETRY_DATA:
+        if self.replay_source and not self.replay_source.is_raw:
+            data = self.replay_source.data
+        elif not self.is_raw_source:
             data = self.mock_telemetry.get_telemetry_data()
+            if self.recorder:
+                self.recorder.record_data(data)
         else:
-            data = self.telemetry_version.parse_data(self.shared_memory.buf)
+            # decode from a private, consistent copy rather than the live mapping
+            snapshot = self.snapshot_reader.read()
+            if snapshot is None:
+                logging.debug("[TelemetryClientService] No consistent telemetry frame yet.")
+                return None
+            if self.recorder:
+                self.recorder.record_frame(snapshot)
+            self.configure_decoder()
+            if TELEMETRY_DECODER == "numpy":
+                data = self.frame_decoder.decode_view(
+                    TelemetryRecordView.from_buffer(
+                        snapshot, self.telemetry_version.struct_telemetry
+                    )
+                )
+            else:
+                data = self.frame_decoder.decode(snapshot)
 
         nearest_cities = self.location_service.find_nearest_cities(data)
         data.navigation.nearest_cities = nearest_cities
@@ -89,10 +228,20 @@ class TelemetryClientService(ITelemetryClient):
     def close(self):
         """Clean up the telemetry data source."""
         self.running = False
+        logging.info(
+            "[TelemetryClientService] Scheduler stats: %s", self.scheduler.get_stats()
+        )
+        self.snapshot_reader = None
+        if self.recorder:
+            self.recorder.close()
+            self.recorder = None
+        self.replay_source = None
         if self.shared_memory:
             self.shared_memory.close()
             self.shared_memory = None
         self.telemetry_version = None
+        self.frame_decoder = None
+        self.subscription_revision = None
 
     @staticmethod
     def mock_telemetry_version():
@@ -103,18 +252,36 @@ class TelemetryClientService(ITelemetryClient):
         """
         Continuously fetches telemetry data at regular intervals.
         """
+        self.running = True
         try:
-            while True:
-                current_data = self.get_data()
-                telemetry_data = TelemetryData(
-                    truck=current_data.truck,
-                    game=current_data.game,
-                    navigation=current_data.navigation,
-                    job=current_data.job
-                )
-                self.emit_data(telemetry_data)
+            # close() stops the loop before the next frame is read
+            while self.running and not (self.replay_source and self.replay_source.finished):
+                # paused or unchanged frames skip decoding, city lookup and diffing
+                if self.has_new_frame():
+                    # decoding works on a private snapshot, so it can leave the event loop thread
+                    current_data = await asyncio.to_thread(self.get_data)
+                    if current_data is not None:
+                        telemetry_data = TelemetryData(
+                            truck=current_data.truck,
+                            game=current_data.game,
+                            navigation=current_data.navigation,
+                            job=current_data.job
+                        )
+                        self.emit_data(telemetry_data)
+                        self.scheduler.adapt(current_data)
+                elif self.paused:
+                    self.scheduler.adapt(None, paused=True)
 
-                await asyncio.sleep(1)  # Delay to pace the fetching
+                if self.replay_source and self.replay_source.speed == 0:
+                    # replaying as fast as possible, only yield to other tasks
+                    await asyncio.sleep(0)
+                else:
+                    await self.scheduler.wait()
+            if self.replay_source:
+                logging.info(
+                    "[TelemetryClientService] Replay finished after %s records.",
+                    self.replay_source.frames,
+                )
         except asyncio.CancelledError:
             logging.info(
                 "[TelemetryClientService] Telemetry fetching loop has been cancelled."
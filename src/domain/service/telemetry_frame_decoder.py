@@ -0,0 +1,162 @@
+import fnmatch
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional
+
+from src.domain.model.telemetry_data import (GameData, JobData, NavigationData,
+                                             TelemetryData, TrailerData,
+                                             TruckData)
+from src.domain.service.telemetry_versions.field_mapping import (
+    TELEMETRY_GROUPS, TRAILER_FIELDS, TRAILER_KEY, TRAILER_PATH)
+from src.domain.service.telemetry_versions.numpy_layout import \
+    TelemetryRecordView
+from src.domain.service.telemetry_versions.unpack import (BufferType,
+                                                          CompiledStruct)
+
+
+class LazyField:
+    """
+    Non-data descriptor that decodes a model field from its frame on first access.
+
+    Values decoded up front are stored in the instance ``__dict__`` and shadow
+    the descriptor, so only fields nobody asked for take this path.
+    """
+
+    def __init__(self, attr: str, key: str, convert: Optional[Callable] = None):
+        self.attr = attr
+        self.key = key
+        self.convert = convert
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        value = instance.__dict__["_frame"].get(self.key)
+        if self.convert is not None:
+            value = self.convert(value)
+        instance.__dict__[self.attr] = value
+        return value
+
+
+def _lazy_model(model: type, fields: Dict[str, str], **extra: LazyField) -> type:
+    attributes = {attr: LazyField(attr, key) for attr, key in fields.items()}
+    attributes.update(extra)
+    return type(f"Lazy{model.__name__}", (model,), attributes)
+
+
+def _new_lazy(model: type, frame: Mapping) -> Any:
+    # __init__ is skipped on purpose, it would fill every field with None
+    instance = model.__new__(model)
+    instance.__dict__["_frame"] = frame
+    return instance
+
+
+LazyTrailerData = _lazy_model(TrailerData, TRAILER_FIELDS)
+
+
+def _build_trailers(value: Any) -> Optional[List[TrailerData]]:
+    if value is None:
+        return None
+    if isinstance(value, TelemetryRecordView):
+        value = [value.at(index) for index in range(len(value.record))]
+    return [_new_lazy(LazyTrailerData, trailer) for trailer in value]
+
+
+LAZY_GROUPS = {
+    "truck": _lazy_model(TruckData, TELEMETRY_GROUPS["truck"]),
+    "game": _lazy_model(GameData, TELEMETRY_GROUPS["game"]),
+    "navigation": _lazy_model(NavigationData, TELEMETRY_GROUPS["navigation"]),
+    "job": _lazy_model(JobData, TELEMETRY_GROUPS["job"]),
+}
+LazyTelemetryData = _lazy_model(
+    TelemetryData,
+    {},
+    trailer=LazyField(TRAILER_PATH, TRAILER_KEY, convert=_build_trailers),
+)
+
+# every TelemetryData path that can be decoded from an SDK frame
+TELEMETRY_PATHS = [
+    f"{group}.{attr}" for group, fields in TELEMETRY_GROUPS.items() for attr in fields
+] + [TRAILER_PATH]
+
+
+class FrameFieldReader:
+    """
+    Mapping-style access to single top-level fields of a raw frame.
+
+    Used as the lazy fallback for the struct decoder: each ``get`` decodes one
+    field straight from the buffer.
+    """
+
+    def __init__(self, compiled: CompiledStruct, buffer: BufferType):
+        self.compiled = compiled
+        self.buffer = buffer
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self.compiled.unpack_field(self.buffer, key)
+        except KeyError:
+            return default
+
+
+class TelemetryFrameDecoder:
+    """
+    Decodes SDK frames into TelemetryData, eagerly for the fields matched by the
+    configured subscription patterns and lazily, on attribute access, for the rest.
+
+    Lazy fields can be read long after the frame was decoded, on handler
+    threads or as the previous frame of a diff, so each TelemetryData keeps
+    its own immutable copy of the frame rather than the caller's buffer.
+    """
+
+    def __init__(self, compiled: CompiledStruct):
+        self.compiled = compiled
+        self.selected = compiled.select(())
+        self.selected_keys: List[str] = []
+        self.eager_fields: Dict[str, List[str]] = {group: [] for group in TELEMETRY_GROUPS}
+        self.eager_trailer = False
+
+    def configure(self, patterns: Iterable[str]) -> None:
+        """
+        Select the SDK fields to decode up front from TelemetryData path patterns,
+        using the same ``fnmatch`` semantics as the subscription manager.
+        """
+        patterns = list(patterns)
+        keys = set()
+        self.eager_fields = {group: [] for group in TELEMETRY_GROUPS}
+        self.eager_trailer = False
+        for path in TELEMETRY_PATHS:
+            if not any(fnmatch.fnmatch(path, pattern) for pattern in patterns):
+                continue
+            if path == TRAILER_PATH:
+                self.eager_trailer = True
+                keys.add(TRAILER_KEY)
+                continue
+            group, _, attr = path.partition(".")
+            self.eager_fields[group].append(attr)
+            keys.add(TELEMETRY_GROUPS[group][attr])
+        self.selected_keys = sorted(keys)
+        self.selected = self.compiled.select(keys)
+
+    def decode(self, buffer: BufferType) -> TelemetryData:
+        """Decode the selected zones of a raw frame with a single unpack call."""
+        # one copy per frame, free when the buffer already is bytes
+        frame = bytes(buffer)
+        values = self.selected.unpack_from(frame)
+        return self._build(values, FrameFieldReader(self.compiled, frame))
+
+    def decode_view(self, view: TelemetryRecordView) -> TelemetryData:
+        """Read the selected fields from a record view."""
+        if not isinstance(view.record.base, bytes):
+            # the view maps a buffer that will be overwritten, take a copy to own
+            view = TelemetryRecordView(view.record.copy())
+        values = {key: view.get(key) for key in self.selected_keys}
+        return self._build(values, view)
+
+    def _build(self, values: Mapping[str, Any], frame: Mapping) -> TelemetryData:
+        telemetry_data = _new_lazy(LazyTelemetryData, frame)
+        for group, fields in TELEMETRY_GROUPS.items():
+            model = _new_lazy(LAZY_GROUPS[group], frame)
+            for attr in self.eager_fields[group]:
+                model.__dict__[attr] = values.get(fields[attr])
+            telemetry_data.__dict__[group] = model
+        if self.eager_trailer:
+            telemetry_data.__dict__[TRAILER_PATH] = _build_trailers(values.get(TRAILER_KEY))
+        return telemetry_data
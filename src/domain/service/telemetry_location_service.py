@@ -1,45 +1,122 @@
-import json
 import math
-import os
-from typing import Dict, List
+from typing import Dict, List, Optional
+
+import numpy as np
+from scipy.spatial import cKDTree
 
 from src.domain.model.telemetry_data import TelemetryData
+from src.domain.service.city_catalogue import CityCatalogue
+
+
+class NearestCityTracker:
+    """
+    Keeps the k nearest cities of a moving truck without querying every frame.
+
+    A query fetches k + 1 neighbours and keeps the gap between the k-th and
+    the (k + 1)-th distance as a safety margin. After the truck moves by
+    ``delta`` from the query point, every distance has changed by at most
+    ``delta``, so the cached set is still the k nearest while
+    ``2 * delta < d[k + 1] - d[k]``. Within that margin only the k cached
+    distances are recomputed and re-sorted; beyond it the tree is queried again.
+    """
+
+    def __init__(self, tree: cKDTree, coordinates: np.ndarray, k: int):
+        self.tree = tree
+        self.coordinates = coordinates
+        self.k = min(k, len(coordinates))
+        self.anchor: Optional[tuple] = None
+        # (index, x, y) of the cached cities; plain floats are faster than
+        # numpy for a handful of points
+        self.cached: List[tuple] = []
+        self.margin = 0.0
+        self.queries = 0
+        self.hits = 0
+
+    def nearest(self, position) -> List[tuple]:
+        """Return ``(distance, city_index)`` pairs for the k nearest cities, nearest first."""
+        if self.k == 0:
+            return []
+        x, y = position
+        if self.anchor is not None:
+            moved = math.hypot(x - self.anchor[0], y - self.anchor[1])
+            if 2 * moved < self.margin:
+                self.hits += 1
+                return sorted(
+                    (math.hypot(city_x - x, city_y - y), index)
+                    for index, city_x, city_y in self.cached
+                )
+        return self.requery((x, y))
+
+    def requery(self, position: tuple) -> List[tuple]:
+        self.queries += 1
+        count = min(self.k + 1, len(self.coordinates))
+        distances, indices = self.tree.query(position, k=count)
+        distances = np.atleast_1d(distances)
+        indices = np.atleast_1d(indices)
+        self.anchor = position
+        self.cached = [
+            (index, *self.coordinates[index].tolist())
+            for index in indices[: self.k].tolist()
+        ]
+        # with no (k + 1)-th city the set can never change
+        self.margin = distances[self.k] - distances[self.k - 1] if count > self.k else math.inf
+        return list(zip(distances[: self.k].tolist(), indices[: self.k].tolist()))
 
 
 class TelemetryLocationService:
+    # telemetry fields read by find_nearest_cities, always decoded up front
+    required_fields = ["truck.coordinate_x", "truck.coordinate_y"]
+
     def __init__(self):
-        self.cities_data = []
+        self.catalogue = None
+        self.city_tree = None
+        self.city_coordinates = None
+        self.tracker = None
 
         self.load_cities_data()
 
-    def load_cities_data(self) -> List[Dict]:
-        file_path = os.path.join("./src", "cities.json")
-        with open(file_path, "r") as file:
-            cities = json.load(file)
-            self.cities_data = cities
+    def load_cities_data(self):
+        """Load the memory-mapped city catalogue, rebuilding its cache if stale."""
+        self.catalogue = CityCatalogue.load()
+        self.build_index()
+
+    def build_index(self):
+        """
+        Build a KD-tree over the city X/Y coordinates so nearest-city queries
+        take logarithmic time instead of sorting every city each tick.
+        """
+        self.city_coordinates = self.catalogue.coordinates
+        self.city_tree = (
+            cKDTree(self.city_coordinates) if len(self.city_coordinates) else None
+        )
+        self.tracker = None
 
     def find_nearest_cities(
         self, telemetry_data: TelemetryData, limit: int = 5
     ) -> List[Dict]:
         """
         Find the nearest cities based on the current location from telemetry data.
+
+        Returns copies of the city entries, nearest first, each with a
+        ``distance`` key holding the distance to the truck. Consecutive calls
+        share a NearestCityTracker, so small moves skip the tree query.
         """
         player_position = (
             telemetry_data.truck.coordinate_x,
             telemetry_data.truck.coordinate_y,
         )
 
-        if not player_position:
+        if None in player_position or self.city_tree is None or limit <= 0:
             return []
 
-        nearest_cities = sorted(
-            self.cities_data,
-            key=lambda city: self.calculate_distance(
-                player_position, city["X"], city["Y"]
-            ),
-        )[:limit]
-
-        return nearest_cities
+        if self.tracker is None or self.tracker.k != min(limit, len(self.catalogue)):
+            self.tracker = NearestCityTracker(
+                self.city_tree, self.city_coordinates, limit
+            )
+        return [
+            self.catalogue.city(index, distance=distance)
+            for distance, index in self.tracker.nearest(player_position)
+        ]
 
     @staticmethod
     def calculate_distance(player_position, city_x, city_y) -> float:
@@ -0,0 +1,304 @@
+import dataclasses
+import json
+import logging
+import os
+import time
+import zlib
+from struct import Struct
+from typing import Any, BinaryIO, Dict, Iterator, Optional, Tuple
+
+import numpy as np
+
+from src.domain.model.telemetry_data import (GameData, JobData, NavigationData,
+                                             TelemetryData, TrailerData,
+                                             TruckData)
+from src.domain.service.telemetry_versions.unpack import BufferType
+
+# file header: magic and log format version
+LOG_MAGIC = b"ETSTLOG"
+LOG_HEADER = Struct("=7sB")
+# version 1 pickled data records, they are no longer loaded
+LOG_VERSION = 2
+
+# record header: seconds since the recording started, record kind, payload length
+RECORD_HEADER = Struct("=dBI")
+
+# a full zlib-compressed frame
+RECORD_KEYFRAME = 0
+# a zlib-compressed XOR of the frame with the previous one
+RECORD_DELTA = 1
+# a TelemetryData as JSON, used when recording mock telemetry
+RECORD_DATA = 2
+
+# frames between two keyframes, bounds the work needed to seek into a log
+KEYFRAME_INTERVAL = 300
+
+
+def _xor(frame: bytes, previous: bytes) -> bytes:
+    return np.bitwise_xor(
+        np.frombuffer(frame, dtype=np.uint8), np.frombuffer(previous, dtype=np.uint8)
+    ).tobytes()
+
+
+def _json_default(value: Any) -> Any:
+    # numpy values, e.g. distances in the nearest cities
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    raise TypeError("{} is not JSON serializable".format(type(value).__name__))
+
+
+def telemetry_to_json(telemetry_data: TelemetryData) -> bytes:
+    """Serialize a TelemetryData to JSON, field by field."""
+    return json.dumps(
+        dataclasses.asdict(telemetry_data), separators=(",", ":"), default=_json_default
+    ).encode("utf-8")
+
+
+def _from_dict(model: type, values: Optional[Dict]) -> Any:
+    if values is None:
+        return None
+    names = {field.name for field in dataclasses.fields(model)}
+    return model(**{name: value for name, value in values.items() if name in names})
+
+
+def telemetry_from_json(payload: bytes) -> TelemetryData:
+    """Rebuild a TelemetryData serialized by telemetry_to_json."""
+    values = json.loads(payload)
+    trailers = values.get("trailer")
+    return TelemetryData(
+        truck=_from_dict(TruckData, values.get("truck")),
+        game=_from_dict(GameData, values.get("game")),
+        navigation=_from_dict(NavigationData, values.get("navigation")),
+        job=_from_dict(JobData, values.get("job")),
+        trailer=None if trailers is None else [_from_dict(TrailerData, trailer) for trailer in trailers],
+    )
+
+
+class TelemetryRecorder:
+    """
+    Tees telemetry into a compact, timestamped, append-only binary log.
+
+    Raw shared memory frames are stored as zlib-compressed XOR deltas against
+    the previous frame, with a full keyframe every ``KEYFRAME_INTERVAL`` frames
+    and at the start of every recording session. Most of the block does not
+    change between frames, so deltas compress to a few hundred bytes. Decoded
+    TelemetryData (mock mode) is stored as JSON instead, so replaying a
+    shared log never runs code from it.
+    """
+
+    def __init__(self, path: str, keyframe_interval: int = KEYFRAME_INTERVAL):
+        self.path = path
+        self.keyframe_interval = keyframe_interval
+        self.file: Optional[BinaryIO] = None
+        self.previous_frame: Optional[bytes] = None
+        self.frames_since_keyframe = 0
+        self.start_time = time.monotonic()
+        self.records = 0
+        self.bytes_written = 0
+        self.open()
+
+    def open(self):
+        """Open the log for appending, writing the file header for a new log."""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.file = open(self.path, "ab")
+        if self.file.tell() == 0:
+            self.file.write(LOG_HEADER.pack(LOG_MAGIC, LOG_VERSION))
+        else:
+            with open(self.path, "rb") as existing:
+                _read_log_header(existing)
+        logging.info("[TelemetryRecorder] Recording telemetry to %s", self.path)
+
+    def record_frame(self, frame: BufferType, timestamp: Optional[float] = None):
+        """Append a raw shared memory frame."""
+        frame = bytes(frame)
+        if (
+            self.previous_frame is None
+            or len(frame) != len(self.previous_frame)
+            or self.frames_since_keyframe >= self.keyframe_interval
+        ):
+            kind, payload = RECORD_KEYFRAME, frame
+            self.frames_since_keyframe = 0
+        else:
+            kind, payload = RECORD_DELTA, _xor(frame, self.previous_frame)
+            self.frames_since_keyframe += 1
+        self.previous_frame = frame
+        self._write(kind, zlib.compress(payload, 1), timestamp)
+
+    def record_data(self, telemetry_data: TelemetryData, timestamp: Optional[float] = None):
+        """Append a decoded TelemetryData."""
+        payload = telemetry_to_json(telemetry_data)
+        self._write(RECORD_DATA, zlib.compress(payload, 1), timestamp)
+
+    def _write(self, kind: int, payload: bytes, timestamp: Optional[float]):
+        if self.file is None:
+            return
+        if timestamp is None:
+            timestamp = time.monotonic() - self.start_time
+        self.file.write(RECORD_HEADER.pack(timestamp, kind, len(payload)))
+        self.file.write(payload)
+        self.records += 1
+        self.bytes_written += RECORD_HEADER.size + len(payload)
+
+    def close(self):
+        """Flush and close the log."""
+        if self.file is None:
+            return
+        self.file.close()
+        self.file = None
+        logging.info(
+            "[TelemetryRecorder] Recorded %s records (%s bytes) to %s",
+            self.records,
+            self.bytes_written,
+            self.path,
+        )
+
+
+def _read_log_header(file: BinaryIO):
+    header = file.read(LOG_HEADER.size)
+    if len(header) != LOG_HEADER.size:
+        raise ValueError("Telemetry log is truncated")
+    magic, version = LOG_HEADER.unpack(header)
+    if magic != LOG_MAGIC:
+        raise ValueError("Not a telemetry log")
+    if version != LOG_VERSION:
+        raise ValueError("Unsupported telemetry log version {}".format(version))
+
+
+def read_telemetry_log(path: str) -> Iterator[Tuple[float, int, object]]:
+    """
+    Yield ``(timestamp, kind, value)`` for every record of a log.
+
+    Frame records are yielded as full frames (deltas already applied) and data
+    records as TelemetryData. Timestamps restart with every recording session
+    appended to the log, so they are shifted to keep increasing. A truncated
+    last record, e.g. after a crash, ends the iteration.
+    """
+    with open(path, "rb") as file:
+        _read_log_header(file)
+        previous_frame = None
+        offset = 0.0
+        last_timestamp = 0.0
+        while True:
+            header = file.read(RECORD_HEADER.size)
+            if len(header) < RECORD_HEADER.size:
+                return
+            timestamp, kind, length = RECORD_HEADER.unpack(header)
+            payload = file.read(length)
+            if len(payload) < length:
+                logging.warning("[TelemetryRecorder] Truncated record at end of %s", path)
+                return
+            if timestamp + offset < last_timestamp:
+                offset = last_timestamp - timestamp
+            timestamp += offset
+            last_timestamp = timestamp
+
+            payload = zlib.decompress(payload)
+            if kind == RECORD_KEYFRAME:
+                previous_frame = payload
+                yield timestamp, kind, payload
+            elif kind == RECORD_DELTA:
+                if previous_frame is None:
+                    raise ValueError("Telemetry log delta record without a keyframe")
+                previous_frame = _xor(payload, previous_frame)
+                yield timestamp, kind, previous_frame
+            elif kind == RECORD_DATA:
+                yield timestamp, kind, telemetry_from_json(payload)
+            else:
+                raise ValueError("Unknown telemetry log record kind {}".format(kind))
+
+
+class TelemetryReplaySource:
+    """
+    Replays a telemetry log in place of the live shared memory.
+
+    Raw frames are copied into ``buffer``, which stands in for the shared
+    memory block, so the snapshot reader, decoder and everything after it run
+    exactly as they would against the game. ``speed`` scales the recorded
+    timing (2.0 plays twice as fast); a speed of 0 replays every frame as
+    fast as the consumer polls.
+    """
+
+    def __init__(self, path: str, speed: float = 1.0):
+        if speed < 0:
+            raise ValueError("Replay speed cannot be negative")
+        self.path = path
+        self.speed = speed
+        self.records = read_telemetry_log(path)
+        self.pending = None
+        self.buffer: Optional[bytearray] = None
+        self.data: Optional[TelemetryData] = None
+        self.kind: Optional[int] = None
+        self.start_time: Optional[float] = None
+        self.first_timestamp = 0.0
+        self.frames = 0
+        self.finished = False
+        self._next()
+        if self.finished:
+            raise ValueError("Telemetry log {} has no records".format(path))
+        self.kind = RECORD_DATA if self.pending[1] == RECORD_DATA else RECORD_KEYFRAME
+        self.first_timestamp = self.pending[0]
+        # load the first record so the SDK version can be detected before playback;
+        # it stays pending until advance() hands it out, so a one-record log still plays
+        self._apply(self.pending)
+
+    @property
+    def is_raw(self) -> bool:
+        return self.kind != RECORD_DATA
+
+    def _next(self):
+        self.pending = next(self.records, None)
+        if self.pending is None:
+            self.finished = True
+
+    def _apply(self, record):
+        _, kind, value = record
+        if kind == RECORD_DATA:
+            self.data = value
+        else:
+            self._load_frame(value)
+        self.frames += 1
+
+    def _load_frame(self, frame: bytes):
+        if self.buffer is None:
+            self.buffer = bytearray(frame)
+        elif len(frame) != len(self.buffer):
+            # the buffer is mapped by the snapshot reader and cannot be resized
+            raise ValueError("Telemetry log frame size changed during replay")
+        else:
+            self.buffer[:] = frame
+
+    def advance(self) -> bool:
+        """
+        Load the latest record that is due, skipping older ones like a live
+        poll would. Returns False when no new record is due.
+        """
+        if self.start_time is None:
+            # the first record is already loaded
+            self.start_time = time.monotonic()
+            self._next()
+            return True
+        if self.finished:
+            return False
+        if self.speed == 0:
+            self._apply(self.pending)
+            self._next()
+            return True
+
+        position = (time.monotonic() - self.start_time) * self.speed + self.first_timestamp
+        due = None
+        while not self.finished and self.pending[0] <= position:
+            due = self.pending
+            self._next()
+            if due[1] == RECORD_DATA:
+                self._apply(due)
+        if due is None:
+            return False
+        if due[1] != RECORD_DATA:
+            # frames are already complete, only the latest one is copied
+            self.frames += 1
+            self._load_frame(due[2])
+        return True
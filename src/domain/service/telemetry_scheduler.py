@@ -0,0 +1,112 @@
+import asyncio
+import logging
+import time
+from typing import Optional
+
+from src.domain.model.telemetry_data import TelemetryData
+
+
+class TelemetryScheduler:
+    """
+    Paces the telemetry loop against monotonic deadlines.
+
+    Each tick is due one period after the previous deadline rather than one
+    period after the work finished, so processing time does not add to the
+    period and the loop does not drift. When a tick finishes after the next
+    deadline it counts as an overrun, and whole periods that were missed are
+    skipped instead of being run back to back.
+
+    The rate adapts to the driving state: it drops to the idle rate while the
+    game is paused or the truck is parked, and rises to the maximum rate for a
+    short hold time when speed or braking changes quickly.
+    """
+
+    # paths read by adapt(), decoded up front by the client
+    required_fields = ["truck.speed", "truck.user_brake", "truck.park_brake"]
+
+    # rates of change (per second) that switch to the maximum rate
+    SPEED_CHANGE_THRESHOLD = 5.0
+    BRAKE_CHANGE_THRESHOLD = 1.0
+    # speed below which the truck counts as stationary
+    PARKED_SPEED = 0.5
+    # how long the maximum rate is kept after a fast change, in seconds
+    FAST_HOLD_TIME = 2.0
+
+    def __init__(self, rate_hz: float, idle_rate_hz: float = 1.0, max_rate_hz: float = 60.0):
+        if rate_hz <= 0 or idle_rate_hz <= 0 or max_rate_hz <= 0:
+            raise ValueError("Telemetry poll rates must be positive")
+        self.base_rate = rate_hz
+        self.idle_rate = idle_rate_hz
+        self.max_rate = max(max_rate_hz, rate_hz)
+        self.rate = rate_hz
+        self.deadline: Optional[float] = None
+        self.ticks = 0
+        self.overruns = 0
+        self.skipped_ticks = 0
+        self.fast_until = 0.0
+        self.previous_sample = None
+
+    @property
+    def period(self) -> float:
+        return 1.0 / self.rate
+
+    def set_rate(self, rate_hz: float):
+        """Change the polling rate, effective from the next deadline."""
+        if rate_hz == self.rate:
+            return
+        logging.debug(
+            "[TelemetryScheduler] Poll rate %.1f Hz -> %.1f Hz", self.rate, rate_hz
+        )
+        self.rate = rate_hz
+
+    def adapt(self, telemetry_data: Optional[TelemetryData], paused: bool = False):
+        """Pick the polling rate for the next tick from the latest frame."""
+        now = time.monotonic()
+        if paused or telemetry_data is None:
+            self.previous_sample = None
+            self.set_rate(self.idle_rate)
+            return
+
+        truck = telemetry_data.truck
+        speed = truck.speed or 0.0
+        brake = truck.user_brake or 0.0
+        if self.previous_sample is not None:
+            previous_time, previous_speed, previous_brake = self.previous_sample
+            elapsed = now - previous_time
+            if elapsed > 0 and (
+                abs(speed - previous_speed) / elapsed >= self.SPEED_CHANGE_THRESHOLD
+                or abs(brake - previous_brake) / elapsed >= self.BRAKE_CHANGE_THRESHOLD
+            ):
+                self.fast_until = now + self.FAST_HOLD_TIME
+        self.previous_sample = (now, speed, brake)
+
+        if now < self.fast_until:
+            self.set_rate(self.max_rate)
+        elif truck.park_brake and abs(speed) < self.PARKED_SPEED:
+            self.set_rate(self.idle_rate)
+        else:
+            self.set_rate(self.base_rate)
+
+    async def wait(self):
+        """Sleep until the next deadline, skipping any periods already missed."""
+        now = time.monotonic()
+        period = self.period
+        if self.deadline is None:
+            self.deadline = now
+        self.deadline += period
+        if now > self.deadline:
+            self.overruns += 1
+            missed = int((now - self.deadline) // period) + 1
+            self.skipped_ticks += missed
+            self.deadline += missed * period
+        self.ticks += 1
+        await asyncio.sleep(self.deadline - now)
+
+    def get_stats(self) -> dict:
+        """Return tick, overrun and skipped-tick counters with the current rate."""
+        return {
+            "rate_hz": self.rate,
+            "ticks": self.ticks,
+            "overruns": self.overruns,
+            "skipped_ticks": self.skipped_ticks,
+        }
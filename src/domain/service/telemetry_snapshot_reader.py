@@ -0,0 +1,61 @@
+import logging
+from struct import Struct
+from typing import Optional, Tuple
+
+from src.domain.service.telemetry_versions.unpack import (BufferType,
+                                                          CompiledStruct)
+
+
+class TelemetrySnapshotReader:
+    """
+    Copies the shared telemetry block into a private, preallocated buffer and
+    checks each copy is consistent before it is decoded.
+
+    The SDK plugin writes the block while we read it, so a copy can straddle a
+    frame update. Like a seqlock, the header (``paused`` flag and ``time``
+    timestamp) is read before and after the copy and compared with the header
+    in the copy; on a mismatch the copy is torn and retried. A consistent copy
+    is handed out as immutable ``bytes``, so a snapshot handed out earlier, and
+    anything decoded from it, never changes when the next one is taken.
+    """
+
+    def __init__(self, source: BufferType, compiled: CompiledStruct, max_retries: int = 3):
+        offsets = {row.name: row.offset for row in compiled.layout}
+        self.source = source
+        self.size = compiled.size
+        self.view = memoryview(source)[: self.size]
+        self.max_retries = max_retries
+        self.header_offset = offsets["paused"]
+        self.header = Struct(
+            "=?{}xQ".format(offsets["time"] - offsets["paused"] - 1)
+        )
+        self.scratch = bytearray(self.size)
+        self.snapshot: Optional[bytes] = None
+        self.torn_reads = 0
+
+    def read_header(self, buffer: Optional[BufferType] = None) -> Tuple[bool, int]:
+        """Return ``(paused, time)`` from the shared block or the given buffer."""
+        return self.header.unpack_from(
+            self.source if buffer is None else buffer, self.header_offset
+        )
+
+    def read(self) -> Optional[bytes]:
+        """
+        Take a consistent snapshot of the shared block.
+
+        Returns the new snapshot, or the previous one if every retry was torn,
+        or None if no consistent snapshot has been taken yet.
+        """
+        for _ in range(self.max_retries + 1):
+            before = self.read_header()
+            self.scratch[:] = self.view
+            if before == self.read_header() == self.read_header(self.scratch):
+                self.snapshot = bytes(self.scratch)
+                return self.snapshot
+            self.torn_reads += 1
+
+        logging.debug(
+            "[TelemetrySnapshotReader] Torn read after %s retries, keeping previous snapshot.",
+            self.max_retries,
+        )
+        return self.snapshot
@@ -0,0 +1,304 @@
+# Maps the TelemetryData model onto the SCS SDK field names used by the
+# version_1_10 / version_1_12 layouts. Model fields without an SDK counterpart
+# are left out and stay None; fields added in a later SDK version decode as
+# None on older versions.
+
+TRUCK_FIELDS = {
+    "speed": "speed",
+    "brake": "gameBrake",
+    "engine_rpm": "engineRpm",
+    "fuel": "fuel",
+    "fuel_capacity": "fuelCapacity",
+    "wear_engine": "wearEngine",
+    "wear_transmission": "wearTransmission",
+    "wear_cabin": "wearCabin",
+    "wear_chassis": "wearChassis",
+    "wear_wheels": "wearWheels",
+    "lights_dashboard": "lightsDashboard",
+    "blinker_left_active": "blinkerLeftActive",
+    "blinker_right_active": "blinkerRightActive",
+    "wipers": "wipers",
+    "user_steer": "userSteer",
+    "user_throttle": "userThrottle",
+    "user_brake": "userBrake",
+    "user_clutch": "userClutch",
+    "game_steer": "gameSteer",
+    "game_throttle": "gameThrottle",
+    "game_brake": "gameBrake",
+    "game_clutch": "gameClutch",
+    "cruise_control_speed": "cruiseControlSpeed",
+    "air_pressure": "airPressure",
+    "brake_temperature": "brakeTemperature",
+    "fuel_avg_consumption": "fuelAvgConsumption",
+    "fuel_range": "fuelRange",
+    "adblue": "adblue",
+    "oil_pressure": "oilPressure",
+    "oil_temperature": "oilTemperature",
+    "water_temperature": "waterTemperature",
+    "battery_voltage": "batteryVoltage",
+    "truck_odometer": "truckOdometer",
+    "speed_limit": "speedLimit",
+    "refuel_amount": "refuelAmount",
+    "is_cargo_loaded": "isCargoLoaded",
+    "park_brake": "parkBrake",
+    "motor_brake": "motorBrake",
+    "air_pressure_warning": "airPressureWarning",
+    "air_pressure_emergency": "airPressureEmergency",
+    "fuel_warning": "fuelWarning",
+    "adblue_warning": "adblueWarning",
+    "oil_pressure_warning": "oilPressureWarning",
+    "water_temperature_warning": "waterTemperatureWarning",
+    "battery_voltage_warning": "batteryVoltageWarning",
+    "electric_enabled": "electricEnabled",
+    "engine_enabled": "engineEnabled",
+    "lights_parking": "lightsParking",
+    "lights_beam_low": "lightsBeamLow",
+    "lights_beam_high": "lightsBeamHigh",
+    "lights_beacon": "lightsBeacon",
+    "lights_brake": "lightsBrake",
+    "lights_reverse": "lightsReverse",
+    "lights_hazards": "lightsHazards",
+    "cruise_control": "cruiseControl",
+    "shifter_toggle": "shifterToggle",
+    "differential_lock": "differentialLock",
+    "lift_axle": "liftAxle",
+    "lift_axle_indicator": "liftAxleIndicator",
+    "trailer_lift_axle": "trailerLiftAxle",
+    "trailer_lift_axle_indicator": "trailerLiftAxleIndicator",
+    "cabin_position_x": "cabinPositionX",
+    "cabin_position_y": "cabinPositionY",
+    "head_position_x": "headPositionX",
+    "head_position_y": "headPositionY",
+    "head_position_z": "headPositionZ",
+    "truck_hook_position_x": "truckHookPositionX",
+    "truck_hook_position_y": "truckHookPositionY",
+    "truck_hook_position_z": "truckHookPositionZ",
+    "truck_wheel_position_x": "truckWheelPositionX",
+    "truck_wheel_position_y": "truckWheelPositionY",
+    "truck_wheel_position_z": "truckWheelPositionZ",
+    "lv_acceleration_x": "lv_accelerationX",
+    "lv_acceleration_y": "lv_accelerationY",
+    "lv_acceleration_z": "lv_accelerationZ",
+    "av_acceleration_x": "av_accelerationX",
+    "av_acceleration_y": "av_accelerationY",
+    "av_acceleration_z": "av_accelerationZ",
+    "acceleration_x": "accelerationX",
+    "acceleration_y": "accelerationY",
+    "acceleration_z": "accelerationZ",
+    "aa_acceleration_x": "aa_accelerationX",
+    "aa_acceleration_y": "aa_accelerationY",
+    "aa_acceleration_z": "aa_accelerationZ",
+    "cabin_av_x": "cabinAVX",
+    "cabin_av_y": "cabinAVY",
+    "cabin_av_z": "cabinAVZ",
+    "cabin_aa_x": "cabinAAX",
+    "cabin_aa_y": "cabinAAY",
+    "cabin_aa_z": "cabinAAZ",
+    "cabin_offset_x": "cabinOffsetX",
+    "cabin_offset_y": "cabinOffsetY",
+    "cabin_offset_z": "cabinOffsetZ",
+    "cabin_offset_rotation_x": "cabinOffsetrotationX",
+    "cabin_offset_rotation_y": "cabinOffsetrotationY",
+    "cabin_offset_rotation_z": "cabinOffsetrotationZ",
+    "head_offset_x": "headOffsetX",
+    "head_offset_y": "headOffsetY",
+    "head_offset_z": "headOffsetZ",
+    "head_offset_rotation_x": "headOffsetrotationX",
+    "head_offset_rotation_y": "headOffsetrotationY",
+    "head_offset_rotation_z": "headOffsetrotationZ",
+    "coordinate_x": "coordinateX",
+    "coordinate_y": "coordinateY",
+    "coordinate_z": "coordinateZ",
+    "rotation_x": "rotationX",
+    "rotation_y": "rotationY",
+    "rotation_z": "rotationZ",
+    "truck_brand_id": "truckBrandId",
+    "truck_brand": "truckBrand",
+    "truck_id": "truckId",
+    "truck_name": "truckName",
+    "truck_license_plate": "truckLicensePlate",
+    "truck_license_plate_country_id": "truckLicensePlateCountryId",
+    "truck_license_plate_country": "truckLicensePlateCountry",
+    "shifter_type": "shifterType",
+    "truck_wheel_count": "truckWheelCount",
+    "truck_wheel_steerable": "truckWheelSteerable",
+    "truck_wheel_simulated": "truckWheelSimulated",
+    "truck_wheel_powered": "truckWheelPowered",
+    "truck_wheel_liftable": "truckWheelLiftable",
+    "truck_wheel_on_ground": "truckWheelOnGround",
+    "truck_wheel_substance": "truck_wheelSubstance",
+    "truck_wheel_radius": "truckWheelRadius",
+    "truck_wheel_susp_deflection": "truck_wheelSuspDeflection",
+    "truck_wheel_velocity": "truck_wheelVelocity",
+    "truck_wheel_steering": "truck_wheelSteering",
+    "truck_wheel_rotation": "truck_wheelRotation",
+    "truck_wheel_lift": "truck_wheelLift",
+    "truck_wheel_lift_offset": "truck_wheelLiftOffset",
+}
+
+GAME_FIELDS = {
+    "next_rest_stop": "restStop",
+    "game_paused": "paused",
+    "sdk_active": "sdkActive",
+    "simulated_time": "simulatedTime",
+    "render_time": "renderTime",
+    "multiplayer_time_offset": "multiplayerTimeOffset",
+    "telemetry_plugin_revision": "telemetry_plugin_revision",
+    "version_major": "version_major",
+    "version_minor": "version_minor",
+    "game": "game",
+    "telemetry_version_game_major": "telemetry_version_game_major",
+    "telemetry_version_game_minor": "telemetry_version_game_minor",
+    "time_abs": "time_abs",
+    "gears": "gears",
+    "gears_reverse": "gears_reverse",
+    "retarder_step_count": "retarderStepCount",
+    "selector_count": "selectorCount",
+    "time_abs_delivery": "time_abs_delivery",
+    "max_trailer_count": "maxTrailerCount",
+    "unit_count": "unitCount",
+    "planned_distance_km": "plannedDistanceKm",
+    "shifter_slot": "shifterSlot",
+    "retarder_brake": "retarderBrake",
+    "lights_aux_front": "lightsAuxFront",
+    "lights_aux_roof": "lightsAuxRoof",
+    "hshifter_position": "hshifterPosition",
+    "hshifter_bitmask": "hshifterBitmask",
+    "job_delivered_delivery_time": "jobDeliveredDeliveryTime",
+    "job_starting_time": "jobStartingTime",
+    "job_finished_time": "jobFinishedTime",
+    "rest_stop": "restStop",
+    "gear": "gear",
+    "gear_dashboard": "gearDashboard",
+    "hshifter_resulting": "hshifterResulting",
+    "job_delivered_earned_xp": "jobDeliveredEarnedXp",
+    "scale": "scale",
+    "fuel_warning_factor": "fuelWarningFactor",
+    "adblue_capacity": "adblueCapacity",
+    "adblue_warning_factor": "adblueWarningFactor",
+    "air_pressure_emergency": "airPressurEmergency",
+    "engine_rpm_max": "engineRpmMax",
+    "gear_differential": "gearDifferential",
+    "cargo_mass": "cargoMass",
+    "gear_ratios_forward": "gearRatiosForward",
+    "gear_ratios_reverse": "gearRatiosReverse",
+    "unit_mass": "unitMass",
+    "job_delivered_cargo_damage": "jobDeliveredCargoDamage",
+    "job_delivered_distance_km": "jobDeliveredDistanceKm",
+    "cargo_damage": "cargoDamage",
+    "job_income": "jobIncome",
+    "job_cancelled_penalty": "jobCancelledPenalty",
+    "job_delivered_revenue": "jobDeliveredRevenue",
+    "fine_amount": "fineAmount",
+    "tollgate_pay_amount": "tollgatePayAmount",
+    "ferry_pay_amount": "ferryPayAmount",
+    "train_pay_amount": "trainPayAmount",
+    "on_job": "onJob",
+    "job_finished": "jobFinished",
+    "job_cancelled": "jobCancelled",
+    "job_delivered": "jobDelivered",
+    "fined": "fined",
+    "tollgate": "tollgate",
+    "ferry": "ferry",
+    "train": "train",
+    "refuel": "refuel",
+    "refuel_payed": "refuelPayed",
+    "substances": "substances",
+}
+
+NAVIGATION_FIELDS = {
+    "route_distance": "routeDistance",
+    "route_time": "routeTime",
+}
+
+JOB_FIELDS = {
+    "cargo": "cargo",
+    "income": "jobIncome",
+    "is_special": "specialJob",
+    "cargo_id": "cargoId",
+    "city_dst_id": "cityDstId",
+    "city_dst": "cityDst",
+    "comp_dst_id": "compDstId",
+    "comp_dst": "compDst",
+    "city_src_id": "citySrcId",
+    "city_src": "citySrc",
+    "comp_src_id": "compSrcId",
+    "comp_src": "compSrc",
+    "job_market": "jobMarket",
+    "fine_offence": "fineOffence",
+    "ferry_source_name": "ferrySourceName",
+    "ferry_target_name": "ferryTargetName",
+    "ferry_source_id": "ferrySourceId",
+    "ferry_target_id": "ferryTargetId",
+    "train_source_name": "trainSourceName",
+    "train_target_name": "trainTargetName",
+    "train_source_id": "trainSourceId",
+    "train_target_id": "trainTargetId",
+    "job_autopark_used": "jobDeliveredAutoparkUsed",
+    "job_autoload_used": "jobDeliveredAutoloadUsed",
+}
+
+TRAILER_FIELDS = {
+    "wheel_steerable": "wheelSteerable",
+    "wheel_simulated": "wheelSimulated",
+    "wheel_powered": "wheelPowered",
+    "wheel_liftable": "wheelLiftable",
+    "wheel_on_ground": "wheelOnGround",
+    "attached": "attached",
+    "wheel_substance": "wheelSubstance",
+    "wheel_count": "wheelCount",
+    "cargo_damage": "cargoDamage",
+    "wear_chassis": "wearChassis",
+    "wear_wheels": "wearWheels",
+    "wear_body": "wearBody",
+    "wheel_susp_deflection": "wheelSuspDeflection",
+    "wheel_velocity": "wheelVelocity",
+    "wheel_steering": "wheelSteering",
+    "wheel_rotation": "wheelRotation",
+    "wheel_lift": "wheelLift",
+    "wheel_lift_offset": "wheelLiftOffset",
+    "wheel_radius": "wheelRadius",
+    "linear_velocity_x": "linearVelocityX",
+    "linear_velocity_y": "linearVelocityY",
+    "linear_velocity_z": "linearVelocityZ",
+    "angular_velocity_x": "angularVelocityX",
+    "angular_velocity_y": "angularVelocityY",
+    "angular_velocity_z": "angularVelocityZ",
+    "linear_acceleration_x": "linearAccelerationX",
+    "linear_acceleration_y": "linearAccelerationY",
+    "linear_acceleration_z": "linearAccelerationZ",
+    "angular_acceleration_x": "angularAccelerationX",
+    "angular_acceleration_y": "angularAccelerationY",
+    "angular_acceleration_z": "angularAccelerationZ",
+    "hook_position_x": "hookPositionX",
+    "hook_position_y": "hookPositionY",
+    "hook_position_z": "hookPositionZ",
+    "wheel_position_x": "wheelPositionX",
+    "wheel_position_y": "wheelPositionY",
+    "wheel_position_z": "wheelPositionZ",
+    "world_x": "worldX",
+    "world_y": "worldY",
+    "world_z": "worldZ",
+    "id": "id",
+    "cargo_accessory_id": "cargoAcessoryId",
+    "body_type": "bodyType",
+    "brand_id": "brandId",
+    "brand": "brand",
+    "name": "name",
+    "chain_type": "chainType",
+    "license_plate": "licensePlate",
+    "license_plate_country": "licensePlateCountry",
+    "license_plate_country_id": "licensePlateCountryId",
+}
+
+# TelemetryData group attribute -> field map of that group
+TELEMETRY_GROUPS = {
+    "truck": TRUCK_FIELDS,
+    "game": GAME_FIELDS,
+    "navigation": NAVIGATION_FIELDS,
+    "job": JOB_FIELDS,
+}
+
+# TelemetryData.trailer is decoded from the SDK trailer array as a whole
+TRAILER_PATH = "trailer"
+TRAILER_KEY = "trailer"
@@ -0,0 +1,132 @@
+from collections.abc import Mapping
+from functools import lru_cache
+from typing import Any, Iterator
+
+import numpy as np
+
+from .unpack import (ArraySruct, BaseStruct, BasicStruct, BufferType,
+                     BytesStruct, CompiledStruct, DictStruct)
+
+# struct format codes of the telemetry layouts and their numpy counterparts
+NUMPY_FORMATS = {
+    "c": "S1",
+    "b": "i1",
+    "B": "u1",
+    "?": "?",
+    "h": "=i2",
+    "H": "=u2",
+    "i": "=i4",
+    "I": "=u4",
+    "q": "=i8",
+    "Q": "=u8",
+    "f": "=f4",
+    "d": "=f8",
+}
+
+
+@lru_cache(maxsize=None)
+def build_dtype(struct):
+    # type: (BaseStruct) -> np.dtype
+    """
+    Build a numpy dtype with explicit offsets from a struct definition.
+
+    Unnamed padding is left out and covered by the offsets, nested dicts become
+    nested structured dtypes and arrays become subarrays, so ``trailer`` ->
+    ``wheelVelocity`` reads as a ``(10, 16)`` float32 array.
+    """
+    if isinstance(struct, CompiledStruct):
+        return build_dtype(struct.source)
+
+    if isinstance(struct, BasicStruct):
+        fmt = struct.format.lstrip("@=<>!")
+        if fmt not in NUMPY_FORMATS:
+            raise ValueError("Format '{}' has no numpy equivalent".format(struct.format))
+        return np.dtype(NUMPY_FORMATS[fmt])
+
+    if isinstance(struct, BytesStruct):
+        return np.dtype("S{}".format(struct.size))
+
+    if isinstance(struct, ArraySruct):
+        return np.dtype((build_dtype(struct.struct), (struct.count,)))
+
+    if isinstance(struct, DictStruct):
+        # like the dict returned by DictStruct, a repeated name keeps the last field
+        fields = {}
+        offset = 0
+        for field_name, field_type in struct.fields:
+            if field_name is not None and field_name != "":
+                fields.pop(field_name, None)
+                fields[field_name] = (build_dtype(field_type), offset)
+            offset += field_type.size
+        return np.dtype(
+            {
+                "names": list(fields),
+                "formats": [field_dtype for field_dtype, _ in fields.values()],
+                "offsets": [field_offset for _, field_offset in fields.values()],
+                "itemsize": struct.size,
+            }
+        )
+
+    raise TypeError("Cannot build a dtype for {}".format(type(struct).__name__))
+
+
+def _decode_strings(value):
+    # type: (np.ndarray) -> Any
+    if value.ndim == 0:
+        return value.item().partition(b"\x00")[0].decode("utf-8")
+    return [_decode_strings(item) for item in value]
+
+
+class TelemetryRecordView(Mapping):
+    """
+    Zero-copy, read-only mapping over a structured numpy record.
+
+    Reading a scalar field is a single read from the underlying buffer and
+    returns a plain Python value; numeric arrays are returned as numpy views of
+    the buffer and nested structs as further record views. Nothing is decoded
+    until it is accessed.
+    """
+
+    def __init__(self, record):
+        # type: (np.ndarray) -> None
+        self._record = record
+
+    @classmethod
+    def from_buffer(cls, buffer, struct, offset=0):
+        # type: (BufferType, BaseStruct, int) -> TelemetryRecordView
+        """Map ``struct`` over ``buffer`` without copying it."""
+        dtype = build_dtype(struct)
+        record = np.ndarray((), dtype=dtype, buffer=buffer, offset=offset)
+        record.flags.writeable = False
+        return cls(record)
+
+    @property
+    def record(self):
+        # type: () -> np.ndarray
+        return self._record
+
+    def __getitem__(self, name):
+        # type: (str) -> Any
+        if name not in self._record.dtype.fields:
+            raise KeyError(name)
+        value = self._record[name]
+        if value.dtype.names is not None:
+            return TelemetryRecordView(value)
+        if value.dtype.kind == "S":
+            return _decode_strings(value)
+        if value.ndim == 0:
+            return value.item()
+        return value
+
+    def at(self, index):
+        # type: (int) -> TelemetryRecordView
+        """View of one element when the record is an array, e.g. a single trailer."""
+        return TelemetryRecordView(self._record[index, ...])
+
+    def __iter__(self):
+        # type: () -> Iterator[str]
+        return iter(self._record.dtype.names)
+
+    def __len__(self):
+        # type: () -> int
+        return len(self._record.dtype.names)
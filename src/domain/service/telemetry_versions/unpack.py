@@ -1,10 +1,15 @@
 # https://github.com/Dreagonmon/truck_telemetry
+from collections import namedtuple
 from mmap import mmap
 from struct import Struct
-from typing import Any, List, Tuple, Union
+from typing import Any, Iterable, List, Tuple, Union
 
 BufferType = Union[List[int], bytes, bytearray, memoryview, mmap]
 
+# One row of a compiled layout: dotted field path, byte offset and size of the
+# field, and the position of its first value in the flat unpacked tuple.
+FieldLayout = namedtuple("FieldLayout", ["name", "offset", "size", "index"])
+
 
 class BaseStruct:
     @property
@@ -27,6 +32,11 @@ class BasicStruct(BaseStruct):
         # type: () -> int
         return self.__struct.size
 
+    @property
+    def format(self):
+        # type: () -> str
+        return self.__struct.format
+
     def unpack_from(self, buffer, offset=0):
         # type: (BufferType, int) -> Any
         value = self.__struct.unpack_from(buffer, offset)
@@ -46,6 +56,16 @@ class ArraySruct(BaseStruct):
         # type: () -> int
         return self.__struct.size * self.__count
 
+    @property
+    def struct(self):
+        # type: () -> BaseStruct
+        return self.__struct
+
+    @property
+    def count(self):
+        # type: () -> int
+        return self.__count
+
     def unpack_from(self, buffer, offset=0):
         # type: (BufferType, int) -> Any
         value = []
@@ -72,6 +92,11 @@ class DictStruct(BaseStruct):
         # type: () -> int
         return self.__size
 
+    @property
+    def fields(self):
+        # type: () -> Tuple[Tuple[str, BaseStruct], ...]
+        return self.__fields
+
     def unpack_from(self, buffer, offset=0):
         # type: (BufferType, int) -> Any
         d = dict()
@@ -95,6 +120,11 @@ class BytesStruct(BaseStruct):
         # type: () -> int
         return self.__size
 
+    @property
+    def adjust_string(self):
+        # type: () -> bool
+        return self.__adjust
+
     def unpack_from(self, buffer, offset=0):
         # type: (BufferType, int) -> Any
         value = self.__struct.unpack_from(buffer, offset)[0]
@@ -110,6 +140,225 @@ class StringStruct(BytesStruct):
         super().__init__(size, True)
 
 
+class CompiledStruct(BaseStruct):
+    """
+    A struct tree flattened into one precomputed ``Struct``.
+
+    The tree is walked once: every leaf contributes its format code to a single
+    combined format string and unnamed padding becomes ``x`` pad bytes, so a
+    whole frame decodes with one ``unpack_from`` call. The flat value tuple is
+    then regrouped by a generated function into the same nested dicts and lists
+    the tree returns. ``pack_into`` is the inverse and writes such a value
+    back into a buffer.
+    """
+
+    def __init__(self, struct, name="struct"):
+        # type: (BaseStruct, str) -> None
+        layout = []  # type: List[FieldLayout]
+        fmt, _, expression, _ = _compile(struct, "", 0, 0, layout)
+        self.__struct = Struct("=" + fmt)
+        if self.__struct.size != struct.size:
+            raise ValueError(
+                "Compiled size {} does not match struct size {}".format(
+                    self.__struct.size, struct.size
+                )
+            )
+        namespace = {}  # type: dict
+        source = "def regroup(v):\n    return {}\n".format(expression)
+        exec(compile(source, "<compiled {}>".format(name), "exec"), namespace)
+        self.__regroup = namespace["regroup"]
+        source = "def flatten(d):\n    return ({})\n".format(
+            "".join(item + ", " for item in _flatten(struct, "d"))
+        )
+        exec(compile(source, "<compiled {} pack>".format(name), "exec"), namespace)
+        self.__flatten = namespace["flatten"]
+        self.__source = struct
+        self.__layout = layout
+        self.__fields = {}  # type: dict
+
+    @property
+    def size(self):
+        # type: () -> int
+        return self.__struct.size
+
+    @property
+    def format(self):
+        # type: () -> str
+        return self.__struct.format
+
+    @property
+    def source(self):
+        # type: () -> BaseStruct
+        return self.__source
+
+    @property
+    def layout(self):
+        # type: () -> List[FieldLayout]
+        return self.__layout
+
+    def unpack_from(self, buffer, offset=0):
+        # type: (BufferType, int) -> Any
+        return self.__regroup(self.__struct.unpack_from(buffer, offset))
+
+    def pack_into(self, buffer, value, offset=0):
+        # type: (BufferType, Any, int) -> None
+        """
+        Write ``value``, shaped like the result of ``unpack_from``, into ``buffer``.
+
+        Every named field must be present; padding is written as zero bytes.
+        """
+        self.__struct.pack_into(buffer, offset, *self.__flatten(value))
+
+    def select(self, names):
+        # type: (Iterable[str]) -> CompiledStruct
+        """
+        Compile a struct that only decodes the given top-level fields.
+
+        Every other field becomes padding, so skipped zones cost nothing when
+        unpacking. Names that are not part of the layout are ignored.
+        """
+        if not isinstance(self.__source, DictStruct):
+            raise TypeError("Only dict structs support field selection")
+        names = set(names)
+        return CompiledStruct(
+            DictStruct(
+                *[
+                    (field_name if field_name in names else None, field_type)
+                    for field_name, field_type in self.__source.fields
+                ]
+            )
+        )
+
+    def unpack_field(self, buffer, name, offset=0):
+        # type: (BufferType, str, int) -> Any
+        """Decode a single top-level field, raising KeyError if it does not exist."""
+        field = self.__fields.get(name)
+        if field is None:
+            field = self.__fields[name] = self.select([name])
+        return field.unpack_from(buffer, offset)[name]
+
+
+def _compile(struct, path, offset, index, layout):
+    # type: (BaseStruct, str, int, int, List[FieldLayout]) -> Tuple[str, int, str, bool]
+    """
+    Return ``(format, value_count, expression, plain)`` for ``struct``.
+
+    ``expression`` rebuilds the struct's value from the flat tuple ``v`` using
+    absolute indices; ``plain`` is set when it is a bare ``v[index]`` lookup.
+    """
+    if isinstance(struct, CompiledStruct):
+        return _compile(struct.source, path, offset, index, layout)
+
+    if isinstance(struct, BasicStruct):
+        fmt = struct.format
+        standard = Struct("=" + fmt)
+        if standard.size != struct.size:
+            raise ValueError(
+                "Format '{}' depends on native alignment and cannot be compiled".format(fmt)
+            )
+        count = len(standard.unpack(bytes(standard.size)))
+        if count == 0:
+            return fmt, 0, "None", False
+        return fmt, count, "v[{}]".format(index), True
+
+    if isinstance(struct, BytesStruct):
+        fmt = "{}s".format(struct.size)
+        if struct.adjust_string:
+            expression = "v[{}].partition(b'\\x00')[0].decode('utf-8')".format(index)
+            return fmt, 1, expression, False
+        return fmt, 1, "v[{}]".format(index), True
+
+    if isinstance(struct, ArraySruct):
+        item = struct.struct
+        fmts = []
+        expressions = []
+        start = index
+        plain = True
+        for i in range(struct.count):
+            item_fmt, item_count, item_expression, item_plain = _compile(
+                item, "{}.{}".format(path, i), offset + i * item.size, index, layout
+            )
+            if item_count == 0:
+                # empty struct array, skip
+                return "{}x".format(struct.size), 0, "None", False
+            fmts.append(item_fmt)
+            expressions.append(item_expression)
+            plain = plain and item_plain
+            index += item_count
+        if plain:
+            expression = "list(v[{}:{}])".format(start, index)
+        else:
+            expression = "[{}]".format(", ".join(expressions))
+        return "".join(fmts), index - start, expression, False
+
+    if isinstance(struct, DictStruct):
+        fmts = []
+        items = []
+        start = index
+        for field_name, field_type in struct.fields:
+            if field_name is None or field_name == "":
+                # padding is skipped without producing any values
+                fmts.append("{}x".format(field_type.size))
+                offset += field_type.size
+                continue
+            field_path = "{}.{}".format(path, field_name) if path else field_name
+            layout.append(FieldLayout(field_path, offset, field_type.size, index))
+            field_fmt, field_count, field_expression, _ = _compile(
+                field_type, field_path, offset, index, layout
+            )
+            fmts.append(field_fmt)
+            items.append("{!r}: {}".format(field_name, field_expression))
+            offset += field_type.size
+            index += field_count
+        return "".join(fmts), index - start, "{{{}}}".format(", ".join(items)), False
+
+    raise TypeError("Cannot compile struct of type {}".format(type(struct).__name__))
+
+
+def _flatten(struct, expression):
+    # type: (BaseStruct, str) -> List[str]
+    """
+    Return the expressions that read the flat values of ``struct``, in format
+    order, from the nested value ``expression``. The inverse of ``_compile``.
+    """
+    if isinstance(struct, CompiledStruct):
+        return _flatten(struct.source, expression)
+
+    if isinstance(struct, BasicStruct):
+        if len(Struct("=" + struct.format).unpack(bytes(struct.size))) == 0:
+            return []
+        return [expression]
+
+    if isinstance(struct, BytesStruct):
+        if struct.adjust_string:
+            return ["{}.encode('utf-8')".format(expression)]
+        return [expression]
+
+    if isinstance(struct, ArraySruct):
+        item = _flatten(struct.struct, "x")
+        if not item:
+            # empty struct array, nothing to write
+            return []
+        if item == ["x"]:
+            return ["*{}".format(expression)]
+        expressions = []
+        for i in range(struct.count):
+            expressions.extend(_flatten(struct.struct, "{}[{}]".format(expression, i)))
+        return expressions
+
+    if isinstance(struct, DictStruct):
+        expressions = []
+        for field_name, field_type in struct.fields:
+            if field_name is None or field_name == "":
+                continue
+            expressions.extend(
+                _flatten(field_type, "{}[{!r}]".format(expression, field_name))
+            )
+        return expressions
+
+    raise TypeError("Cannot compile struct of type {}".format(type(struct).__name__))
+
+
 struct_char = BasicStruct("c")
 struct_unsigned_char = BasicStruct("B")
 struct_short = BasicStruct("h")
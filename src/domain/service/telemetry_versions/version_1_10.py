@@ -1,8 +1,8 @@
 # https://github.com/RenCloud/scs-sdk-plugin/blob/V.1.10.6/scs-telemetry/inc/scs-telemetry-common.hpp
-from .unpack import (ArraySruct, BasicStruct, BytesStruct, DictStruct,
-                     StringStruct, struct_bool, struct_double, struct_float,
-                     struct_int, struct_long_long, struct_unsigned_int,
-                     struct_unsigned_long_long)
+from .unpack import (ArraySruct, BasicStruct, BytesStruct, CompiledStruct,
+                     DictStruct, StringStruct, struct_bool, struct_double,
+                     struct_float, struct_int, struct_long_long,
+                     struct_unsigned_int, struct_unsigned_long_long)
 
 VERSION_NUMBER = 10
 STRUCT_TELEMETRY_VERSION = BasicStruct("40xI")
@@ -306,6 +306,9 @@ struct_telemetry = DictStruct(
     ("trailer", ArraySruct(struct_trailer, 10))
 )
 
+# Flattened once at import so a frame decodes with a single unpack_from call
+compiled_telemetry = CompiledStruct(struct_telemetry)
+
 def get_version_number():
     return VERSION_NUMBER
 
@@ -313,4 +316,4 @@ def is_same_version(data):
     return STRUCT_TELEMETRY_VERSION.unpack_from(data) == VERSION_NUMBER
 
 def parse_data(data):
-    return struct_telemetry.unpack_from(data)
+    return compiled_telemetry.unpack_from(data)
@@ -0,0 +1,189 @@
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import unicodedata
+from collections import OrderedDict
+from typing import Dict, Optional
+
+from src.interfaces.ai_provider_interface import TextToAudioProvider
+
+CACHE_FILE_SUFFIX = ".audio"
+
+
+def normalize_text(text: str) -> str:
+    """Text as it is keyed: NFKC-normalized, with runs of whitespace collapsed."""
+    return re.sub(r"\s+", " ", unicodedata.normalize("NFKC", text)).strip()
+
+
+class TextToAudioCache:
+    """
+    Content-addressed store of synthesized speech.
+
+    Entries are keyed by a SHA-256 over the provider, model, parameters and
+    normalized text, and hold the encoded audio exactly as the provider
+    returned it. Every entry is a file in ``directory``; the least recently
+    used files are evicted once they take more than ``max_bytes``. The most
+    recently used entries, up to ``hot_bytes``, are also kept in memory.
+    Thread-safe.
+    """
+
+    def __init__(self, directory: str, max_bytes: int, hot_bytes: int):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hot_bytes = hot_bytes
+        self.lock = threading.Lock()
+        self.hot: "OrderedDict[str, bytes]" = OrderedDict()
+        self.hot_size = 0
+        self.entries: "OrderedDict[str, int]" = OrderedDict()
+        self.size = 0
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "evictions": 0}
+        os.makedirs(directory, exist_ok=True)
+        self._load_index()
+
+    @staticmethod
+    def key(provider: str, model_id: Optional[str], params: Dict, text: str) -> str:
+        identity = json.dumps(
+            {
+                "provider": provider,
+                "model_id": model_id,
+                "params": params,
+                "text": normalize_text(text),
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(identity.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self.lock:
+            data = self.hot.get(key)
+            if data is not None:
+                self.hot.move_to_end(key)
+                self.entries.move_to_end(key)
+                self.stats["memory_hits"] += 1
+                return data
+            if key not in self.entries:
+                self.stats["misses"] += 1
+                return None
+            path = self._path(key)
+            try:
+                with open(path, "rb") as file:
+                    data = file.read()
+                # the file's mtime is the recency that survives a restart
+                os.utime(path)
+            except OSError:
+                self.size -= self.entries.pop(key)
+                self.stats["misses"] += 1
+                return None
+            self.entries.move_to_end(key)
+            self._keep_hot(key, data)
+            self.stats["disk_hits"] += 1
+            return data
+
+    def put(self, key: str, data: bytes):
+        with self.lock:
+            path = self._path(key)
+            temporary = f"{path}.{threading.get_ident()}.tmp"
+            try:
+                with open(temporary, "wb") as file:
+                    file.write(data)
+                os.replace(temporary, path)
+            except OSError as e:
+                logging.error(f"[TextToAudioCache] Failed to store audio: {e}")
+                return
+            self.size += len(data) - self.entries.pop(key, 0)
+            self.entries[key] = len(data)
+            self._keep_hot(key, data)
+            self._evict()
+
+    def get_stats(self) -> Dict:
+        with self.lock:
+            hits = self.stats["memory_hits"] + self.stats["disk_hits"]
+            lookups = hits + self.stats["misses"]
+            return dict(
+                self.stats,
+                hit_rate=hits / lookups if lookups else None,
+                entries=len(self.entries),
+                bytes=self.size,
+                hot_entries=len(self.hot),
+                hot_bytes=self.hot_size,
+            )
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + CACHE_FILE_SUFFIX)
+
+    def _load_index(self):
+        found = []
+        for name in os.listdir(self.directory):
+            path = os.path.join(self.directory, name)
+            if name.endswith(".tmp"):
+                os.remove(path)  # left behind by an interrupted write
+            elif name.endswith(CACHE_FILE_SUFFIX):
+                stat = os.stat(path)
+                found.append((stat.st_mtime, name[: -len(CACHE_FILE_SUFFIX)], stat.st_size))
+        for _, key, size in sorted(found):
+            self.entries[key] = size
+            self.size += size
+        self._evict()
+
+    def _keep_hot(self, key: str, data: bytes):
+        if len(data) > self.hot_bytes:
+            return
+        previous = self.hot.pop(key, None)
+        if previous is not None:
+            self.hot_size -= len(previous)
+        self.hot[key] = data
+        self.hot_size += len(data)
+        while self.hot_size > self.hot_bytes:
+            _, evicted = self.hot.popitem(last=False)
+            self.hot_size -= len(evicted)
+
+    def _evict(self):
+        while self.size > self.max_bytes and self.entries:
+            key, size = self.entries.popitem(last=False)
+            self.size -= size
+            self.stats["evictions"] += 1
+            evicted = self.hot.pop(key, None)
+            if evicted is not None:
+                self.hot_size -= len(evicted)
+            try:
+                os.remove(self._path(key))
+            except OSError:
+                pass
+
+
+class CachedTextToAudioProvider(TextToAudioProvider):
+    """
+    Text-to-audio provider that answers repeated phrases from a TextToAudioCache
+    and only calls the wrapped provider on a miss.
+    """
+
+    def __init__(self, provider: TextToAudioProvider, provider_name: str, cache: TextToAudioCache):
+        super().__init__(provider.model_id, provider.params, provider.is_stream, provider.history_size)
+        self.provider = provider
+        self.provider_name = provider_name
+        self.cache = cache
+
+    def text_to_audio(self, text: str) -> bytes:
+        key = self.cache.key(self.provider_name, self.model_id, self.params, text)
+        audio_data = self.cache.get(key)
+        if audio_data is None:
+            audio_data = self.provider.text_to_audio(text)
+            self.cache.put(key, audio_data)
+            outcome = "miss"
+        else:
+            outcome = "hit"
+        stats = self.cache.get_stats()
+        logging.info(
+            "[CachedTextToAudioProvider] %s for %r, hit rate %.0f%% (%s memory, %s disk, %s misses)",
+            outcome,
+            normalize_text(text)[:40],
+            stats["hit_rate"] * 100,
+            stats["memory_hits"],
+            stats["disk_hits"],
+            stats["misses"],
+        )
+        return audio_data
@@ -1,17 +1,31 @@
 from src.application.model.session_model import Session
 from src.application.session_management import SessionManagement
+from src.config import TTS_CACHE_DIR, TTS_CACHE_HOT_BYTES, TTS_CACHE_MAX_BYTES
 from src.domain.service.ai_providers.microsoft_edge_provider import \
     MicrosoftEdgeProvider
 from src.domain.service.ai_providers.nlpcloud_provider import NLPCloudProvider
 from src.domain.service.ai_providers.openai_provider import OpenAIProvider
 from src.domain.service.ai_providers.replicate_provider import \
     ReplicateProvider
+from src.domain.service.text_to_audio_cache import (CachedTextToAudioProvider,
+                                                    TextToAudioCache)
 from src.shared.helpers.constants import AIProviderType
 
 
 class AIProviderFactory:
     @staticmethod
     def get_provider(service_type: AIProviderType, session: Session):
+        provider = AIProviderFactory._create_provider(service_type, session)
+        if service_type == AIProviderType.TEXT_TO_AUDIO and TTS_CACHE_DIR:
+            return CachedTextToAudioProvider(
+                provider,
+                session.co_driver.config.text_to_audio.provider,
+                TextToAudioCache(TTS_CACHE_DIR, TTS_CACHE_MAX_BYTES, TTS_CACHE_HOT_BYTES),
+            )
+        return provider
+
+    @staticmethod
+    def _create_provider(service_type: AIProviderType, session: Session):
         config_map = {
             AIProviderType.TEXT_TO_TEXT: session.co_driver.config.text_to_text,
             AIProviderType.IMAGE_TO_TEXT: session.co_driver.config.image_to_text,
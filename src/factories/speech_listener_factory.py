@@ -16,7 +16,6 @@ class SpeechListenerFactory:
         listener_type: str,
         event_bus: EventBus,
         model_name: str = "base",
-        temp_directory: str = "/tmp",
     ):
 
         devices = sd.query_devices()
@@ -56,7 +55,7 @@ class SpeechListenerFactory:
 
         if listener_type == "whisper":
             return WhisperSpeechListenerProvider(
-                event_bus, input_device_index, model_name, temp_directory
+                event_bus, input_device_index, model_name
             )
         else:
             raise ValueError(f"Unsupported speech listener type: {listener_type}")
@@ -0,0 +1,274 @@
+import io
+import logging
+import queue
+import subprocess
+import threading
+import time
+import wave
+from collections import deque
+from math import gcd
+from typing import Callable, Deque, Optional
+
+import numpy as np
+from scipy.signal import resample_poly
+
+try:
+    import sounddevice as sd
+except (ImportError, OSError):  # no PortAudio on a headless machine
+    sd = None
+
+# device name of the null output, which consumes audio in real time without a sound card
+NULL_DEVICE = "null"
+
+
+def decode_audio(data: bytes, samplerate: int) -> np.ndarray:
+    """
+    Decode an audio file held in memory to mono float32 PCM at ``samplerate``.
+
+    PCM WAV is decoded in-process; anything else, such as the MP3 returned by
+    most text-to-speech services, is piped through ``ffmpeg``.
+    """
+    if data[:4] == b"RIFF" and data[8:12] == b"WAVE":
+        try:
+            return _decode_wav(data, samplerate)
+        except (wave.Error, ValueError):
+            pass  # e.g. float WAV, which the wave module cannot read
+    return _decode_ffmpeg(data, samplerate)
+
+
+def _decode_wav(data: bytes, samplerate: int) -> np.ndarray:
+    with wave.open(io.BytesIO(data)) as wav:
+        width = wav.getsampwidth()
+        channels = wav.getnchannels()
+        source_rate = wav.getframerate()
+        frames = wav.readframes(wav.getnframes())
+    if width == 1:
+        pcm = (np.frombuffer(frames, dtype=np.uint8).astype(np.float32) - 128) / 128
+    elif width == 2:
+        pcm = np.frombuffer(frames, dtype="<i2").astype(np.float32) / 32768
+    elif width == 4:
+        pcm = np.frombuffer(frames, dtype="<i4").astype(np.float32) / 2147483648
+    else:
+        raise ValueError(f"Unsupported WAV sample width {width}")
+    pcm = pcm.reshape(-1, channels).mean(axis=1)
+    if source_rate != samplerate:
+        divisor = gcd(source_rate, samplerate)
+        pcm = resample_poly(pcm, samplerate // divisor, source_rate // divisor)
+    return np.ascontiguousarray(pcm, dtype=np.float32)
+
+
+def _decode_ffmpeg(data: bytes, samplerate: int) -> np.ndarray:
+    command = [
+        "ffmpeg", "-hide_banner", "-loglevel", "error",
+        "-i", "pipe:0",
+        "-f", "f32le", "-ac", "1", "-ar", str(samplerate),
+        "pipe:1",
+    ]
+    try:
+        result = subprocess.run(command, input=data, capture_output=True, check=True)
+    except FileNotFoundError:
+        raise RuntimeError("ffmpeg is required to decode non-WAV audio")
+    except subprocess.CalledProcessError as e:
+        raise RuntimeError(f"ffmpeg failed to decode audio: {e.stderr.decode(errors='replace').strip()}")
+    return np.frombuffer(result.stdout, dtype=np.float32)
+
+
+class _Segment:
+    def __init__(self, pcm: np.ndarray, on_start: Optional[Callable[[], None]], on_finished: Optional[Callable[[bool], None]]):
+        self.pcm = pcm
+        self.position = 0
+        self.on_start = on_start
+        self.on_finished = on_finished
+
+
+class NullOutputStream:
+    """
+    Stand-in for ``sounddevice.OutputStream`` without a sound card.
+
+    Calls the stream callback from a thread at the pace a real device would,
+    so playback timing and callbacks behave the same on headless machines.
+    """
+
+    def __init__(self, samplerate: int, blocksize: int, channels: int, dtype: str, callback: Callable, **_):
+        self.samplerate = samplerate
+        self.blocksize = blocksize
+        self.channels = channels
+        self.dtype = dtype
+        self.callback = callback
+        self.active = False
+        self.thread: Optional[threading.Thread] = None
+
+    def start(self):
+        self.active = True
+        self.thread = threading.Thread(target=self._run, name="AudioPlayer-null", daemon=True)
+        self.thread.start()
+
+    def _run(self):
+        buffer = np.zeros((self.blocksize, self.channels), dtype=self.dtype)
+        period = self.blocksize / self.samplerate
+        deadline = time.monotonic()
+        while self.active:
+            self.callback(buffer, self.blocksize, None, None)
+            deadline += period
+            delay = deadline - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+
+    def stop(self):
+        self.active = False
+        if self.thread is not None and self.thread is not threading.current_thread():
+            self.thread.join()
+
+    def close(self):
+        self.stop()
+
+
+class AudioPlayer:
+    """
+    In-process audio output on one persistent ``sounddevice`` stream.
+
+    Decoded PCM segments are queued and the stream callback copies them into
+    the device buffer back to back, so consecutive segments play without a
+    gap; between utterances the stream keeps running and plays silence. The
+    stream is opened once, with ``latency`` seconds of device buffering as
+    pre-roll, so the first utterance does not wait for the device to open.
+
+    ``on_start`` and ``on_finished`` callbacks of a segment run on a notifier
+    thread, never on the audio thread. ``on_finished`` receives False when the
+    segment was cut short by ``interrupt``. With ``device="null"``, or when no
+    output device is available, audio is consumed in real time by a
+    NullOutputStream instead.
+    """
+
+    def __init__(self, device=None, samplerate: int = 24000, latency: float = 0.1, blocksize: int = 1024):
+        self.device = device
+        self.samplerate = samplerate
+        self.latency = latency
+        self.blocksize = blocksize
+        self.lock = threading.Lock()
+        self.segments: Deque[_Segment] = deque()
+        self.notifications: queue.Queue = queue.Queue()
+        self.stream = None
+        self.notifier: Optional[threading.Thread] = None
+        self.underruns = 0
+
+    def start(self):
+        """Open and start the output stream; playing starts it on demand."""
+        if self.stream is not None:
+            return
+        self.stream = self._open_stream()
+        self.notifier = threading.Thread(target=self._notify, name="AudioPlayer-notifier", daemon=True)
+        self.notifier.start()
+        self.stream.start()
+        logging.info(
+            "[AudioPlayer] Output stream started on %s at %s Hz",
+            self.device if self.device is not None else "the default device",
+            self.samplerate,
+        )
+
+    def _open_stream(self):
+        options = dict(
+            samplerate=self.samplerate,
+            blocksize=self.blocksize,
+            channels=1,
+            dtype="float32",
+            callback=self._callback,
+        )
+        if self.device != NULL_DEVICE:
+            if sd is None:
+                logging.warning("[AudioPlayer] sounddevice is unavailable, using the null output")
+            else:
+                try:
+                    return sd.OutputStream(device=self.device, latency=self.latency, **options)
+                except Exception as e:
+                    logging.warning("[AudioPlayer] No output device (%s), using the null output", e)
+        return NullOutputStream(**options)
+
+    def play(
+        self,
+        pcm: np.ndarray,
+        on_start: Optional[Callable[[], None]] = None,
+        on_finished: Optional[Callable[[bool], None]] = None,
+    ):
+        """
+        Queue mono float32 PCM at the player's sample rate behind what is already
+        queued. An empty segment plays nothing but still calls back in order.
+        """
+        self.start()
+        with self.lock:
+            self.segments.append(_Segment(np.asarray(pcm, dtype=np.float32), on_start, on_finished))
+
+    def decode(self, data: bytes) -> np.ndarray:
+        """Decode an audio file held in memory to PCM for this player."""
+        return decode_audio(data, self.samplerate)
+
+    def interrupt(self) -> int:
+        """Stop playback now and drop everything queued; returns the segments dropped."""
+        with self.lock:
+            dropped = list(self.segments)
+            self.segments.clear()
+        for segment in dropped:
+            self.notifications.put((segment.on_finished, False))
+        return len(dropped)
+
+    @property
+    def busy(self) -> bool:
+        with self.lock:
+            return bool(self.segments)
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until everything queued has played; False on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self.busy:
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
+    def close(self):
+        self.interrupt()
+        if self.stream is not None:
+            self.stream.stop()
+            self.stream.close()
+            self.stream = None
+        if self.notifier is not None:
+            self.notifications.put(None)
+            self.notifier.join()
+            self.notifier = None
+
+    def _callback(self, outdata: np.ndarray, frames: int, time_info, status):
+        # audio thread: copy queued PCM only, callbacks go to the notifier
+        if status:
+            self.underruns += 1
+        out = outdata[:, 0]
+        filled = 0
+        with self.lock:
+            while filled < frames and self.segments:
+                segment = self.segments[0]
+                if segment.position == 0 and segment.on_start is not None:
+                    self.notifications.put((segment.on_start, None))
+                    segment.on_start = None
+                count = min(frames - filled, len(segment.pcm) - segment.position)
+                out[filled:filled + count] = segment.pcm[segment.position:segment.position + count]
+                filled += count
+                segment.position += count
+                if segment.position >= len(segment.pcm):
+                    self.segments.popleft()
+                    self.notifications.put((segment.on_finished, True))
+        out[filled:] = 0
+
+    def _notify(self):
+        while True:
+            item = self.notifications.get()
+            if item is None:
+                return
+            callback, completed = item
+            if callback is None:
+                continue
+            try:
+                if completed is None:
+                    callback()
+                else:
+                    callback(completed)
+            except Exception as e:
+                logging.error("[AudioPlayer] Error in playback callback: %s", e)
@@ -0,0 +1,248 @@
+"""
+Stand-in for the SCS telemetry plugin on machines without the game.
+
+Creates a shared memory segment with the exact 1.10 / 1.12 byte layout and
+writes frames into it at a fixed rate, either from a scripted scenario or from
+a recorded telemetry log, so the client's real snapshot and decode path can be
+exercised and load-tested on Linux:
+
+    python -m src.infrastructure.telemetry_producer --rate 60 --scenario drive
+    python -m src.infrastructure.telemetry_producer --replay ./data/telemetry/drive.etslog
+
+Point the client at the same segment with TELEMETRY_SHARED_MEMORY_NAME and
+MOCK_TELEMETRY_DATA = False.
+"""
+import argparse
+import logging
+import math
+import time
+from multiprocessing import shared_memory
+from typing import Dict, Iterator, List, NamedTuple, Optional
+
+from src.config import TELEMETRY_SHARED_MEMORY_NAME
+from src.domain.service.telemetry_recorder import (RECORD_DATA,
+                                                   read_telemetry_log)
+from src.domain.service.telemetry_versions import version_1_10, version_1_12
+
+VERSIONS = {
+    version_1_10.VERSION_NUMBER: version_1_10,
+    version_1_12.VERSION_NUMBER: version_1_12,
+}
+
+
+class ScenarioPhase(NamedTuple):
+    duration: float  # seconds
+    target_speed: float  # m/s, like the SDK
+    acceleration: float  # m/s², used to reach the target speed
+    user_brake: float = 0.0
+    park_brake: bool = False
+    paused: bool = False
+
+
+# a short drive: pull away, cruise, brake hard, park and pause
+SCENARIOS: Dict[str, List[ScenarioPhase]] = {
+    "drive": [
+        ScenarioPhase(5.0, 0.0, 0.0, park_brake=True),
+        ScenarioPhase(15.0, 22.0, 1.5),
+        ScenarioPhase(20.0, 22.0, 0.5),
+        ScenarioPhase(3.0, 0.0, 8.0, user_brake=1.0),
+        ScenarioPhase(5.0, 0.0, 0.0, park_brake=True),
+        ScenarioPhase(5.0, 0.0, 0.0, park_brake=True, paused=True),
+    ],
+    "idle": [
+        ScenarioPhase(60.0, 0.0, 0.0, park_brake=True),
+    ],
+    "highway": [
+        ScenarioPhase(20.0, 25.0, 1.2),
+        ScenarioPhase(60.0, 25.0, 0.5),
+    ],
+}
+
+
+class ScriptedScenario:
+    """
+    Drives an SDK frame through a list of phases, integrating speed and
+    position every step. Loops over the phases until stopped.
+    """
+
+    def __init__(self, phases: List[ScenarioPhase], heading: float = 0.0):
+        self.phases = phases
+        self.heading = heading
+        self.phase_index = 0
+        self.phase_time = 0.0
+        self.speed = 0.0
+        self.odometer = 0.0
+
+    @property
+    def phase(self) -> ScenarioPhase:
+        return self.phases[self.phase_index]
+
+    def step(self, frame: dict, dt: float):
+        """Advance the scenario by ``dt`` seconds and write the result into ``frame``."""
+        self.phase_time += dt
+        if self.phase_time >= self.phase.duration:
+            self.phase_time = 0.0
+            self.phase_index = (self.phase_index + 1) % len(self.phases)
+
+        phase = self.phase
+        frame["paused"] = phase.paused
+        if phase.paused:
+            return
+
+        delta = phase.target_speed - self.speed
+        limit = phase.acceleration * dt
+        change = max(-limit, min(limit, delta))
+        self.speed += change
+        distance = self.speed * dt
+        self.odometer += distance
+
+        frame["time"] += int(dt * 1_000_000)
+        frame["simulatedTime"] = frame["time"]
+        frame["renderTime"] = frame["time"]
+        frame["speed"] = self.speed
+        frame["accelerationX"] = change / dt if dt else 0.0
+        frame["userBrake"] = phase.user_brake
+        frame["gameBrake"] = phase.user_brake
+        frame["userThrottle"] = 1.0 if delta > 0 else 0.0
+        frame["gameThrottle"] = frame["userThrottle"]
+        frame["parkBrake"] = phase.park_brake
+        frame["engineEnabled"] = True
+        frame["engineRpm"] = 600.0 + self.speed * 50.0
+        frame["truckOdometer"] = self.odometer / 1000.0
+        frame["coordinateX"] += math.sin(self.heading) * distance
+        frame["coordinateZ"] -= math.cos(self.heading) * distance
+        # the location service matches cities on x/y, keep y on the ground plane too
+        frame["coordinateY"] = frame["coordinateZ"]
+
+
+class TelemetryProducer:
+    """Owns the shared memory segment and writes frames into it."""
+
+    def __init__(self, name: str, version_number: int = version_1_12.VERSION_NUMBER):
+        if version_number not in VERSIONS:
+            raise ValueError("Unsupported telemetry SDK version {}".format(version_number))
+        self.name = name
+        self.version = VERSIONS[version_number]
+        self.compiled = self.version.compiled_telemetry
+        self.shared_memory = self.create_segment()
+        self.frames = 0
+        self.overruns = 0
+
+        # start from an empty frame that identifies itself like the plugin does
+        self.frame = self.compiled.unpack_from(bytes(self.compiled.size))
+        self.frame["sdkActive"] = True
+        self.frame["telemetry_plugin_revision"] = version_number
+        self.frame["game"] = 1
+        self.frame["time"] = 1
+
+    def create_segment(self) -> shared_memory.SharedMemory:
+        try:
+            segment = shared_memory.SharedMemory(
+                name=self.name, create=True, size=self.compiled.size
+            )
+        except FileExistsError:
+            # left behind by a producer that did not shut down cleanly
+            logging.warning("[TelemetryProducer] Replacing stale segment %s", self.name)
+            stale = shared_memory.SharedMemory(name=self.name, create=False)
+            stale.close()
+            stale.unlink()
+            segment = shared_memory.SharedMemory(
+                name=self.name, create=True, size=self.compiled.size
+            )
+        logging.info(
+            "[TelemetryProducer] Created segment %s (%s bytes, SDK 1.%s)",
+            self.name,
+            self.compiled.size,
+            self.version.VERSION_NUMBER,
+        )
+        return segment
+
+    def write_frame(self, frame: Optional[bytes] = None):
+        """Write the scenario frame, or a recorded raw frame, into the segment."""
+        if frame is None:
+            self.compiled.pack_into(self.shared_memory.buf, self.frame)
+        else:
+            self.shared_memory.buf[: len(frame)] = frame
+        self.frames += 1
+
+    def run_scenario(self, scenario: ScriptedScenario, rate_hz: float, duration: Optional[float] = None):
+        """Write scenario frames at ``rate_hz`` on monotonic deadlines."""
+        period = 1.0 / rate_hz
+        for _ in self._ticks(period, duration):
+            scenario.step(self.frame, period)
+            self.write_frame()
+
+    def run_replay(self, path: str, speed: float = 1.0, loop: bool = False):
+        """Write the raw frames of a telemetry log with their recorded timing."""
+        while True:
+            start = time.monotonic()
+            first = None
+            for timestamp, kind, value in read_telemetry_log(path):
+                if kind == RECORD_DATA:
+                    raise ValueError("Only logs of raw frames can be replayed into shared memory")
+                if len(value) != self.compiled.size:
+                    raise ValueError("Log frames do not match the SDK 1.{} layout".format(
+                        self.version.VERSION_NUMBER
+                    ))
+                if first is None:
+                    first = timestamp
+                if speed > 0:
+                    delay = start + (timestamp - first) / speed - time.monotonic()
+                    if delay > 0:
+                        time.sleep(delay)
+                self.write_frame(value)
+            if not loop:
+                return
+
+    def _ticks(self, period: float, duration: Optional[float]) -> Iterator[None]:
+        start = deadline = time.monotonic()
+        while duration is None or deadline - start < duration:
+            yield
+            deadline += period
+            delay = deadline - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                self.overruns += 1
+
+    def close(self):
+        """Remove the segment."""
+        self.shared_memory.close()
+        self.shared_memory.unlink()
+        logging.info(
+            "[TelemetryProducer] Wrote %s frames (%s overruns), removed %s",
+            self.frames,
+            self.overruns,
+            self.name,
+        )
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--name", default=TELEMETRY_SHARED_MEMORY_NAME, help="shared memory segment name")
+    parser.add_argument("--sdk-version", type=int, default=version_1_12.VERSION_NUMBER, choices=sorted(VERSIONS))
+    parser.add_argument("--rate", type=float, default=60.0, help="frames per second for scenarios")
+    parser.add_argument("--scenario", default="drive", choices=sorted(SCENARIOS))
+    parser.add_argument("--replay", help="telemetry log recorded with TELEMETRY_RECORD_PATH")
+    parser.add_argument("--speed", type=float, default=1.0, help="replay speed, 0 for as fast as possible")
+    parser.add_argument("--loop", action="store_true", help="restart the replay when the log ends")
+    parser.add_argument("--duration", type=float, help="stop a scenario after this many seconds")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    producer = TelemetryProducer(args.name, args.sdk_version)
+    try:
+        if args.replay:
+            producer.run_replay(args.replay, args.speed, args.loop)
+        else:
+            producer.run_scenario(
+                ScriptedScenario(SCENARIOS[args.scenario]), args.rate, args.duration
+            )
+    except KeyboardInterrupt:
+        pass
+    finally:
+        producer.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Dict
+from typing import Dict, Iterator
 
 from src.application.session_management import SessionManagement
 
@@ -20,6 +20,18 @@ class TextToTextProvider(ABC):
     ) -> str:
         pass
 
+    def text_to_text_stream(
+        self,
+        input_text: str,
+        system_text: str,
+        session: SessionManagement,
+    ) -> Iterator[str]:
+        """
+        Yield the response in chunks as it is generated. Providers without a
+        streaming API yield the complete response at once.
+        """
+        yield self.text_to_text(input_text, system_text, session)
+
 
 class ImageToTextProvider(ABC):
     def __init__(self, model_id: str, params: Dict, is_stream: bool = False, history_size: int = 5):
@@ -41,6 +41,9 @@ class EventType(Enum):
     # Dialogue events
     DIALOGUE_RESPONSE_REQUEST = auto()  # Request for generating a dialogue response
     DIALOGUE_RESPONSE_COMPLETE = auto() # Triggered when a dialogue response is generated
+    DIALOGUE_RESPONSE_SEGMENT = auto()  # Triggered for each sentence of a streamed dialogue response
 
     # Telemetry events
     TELEMETRY_RECEIVED = auto()  # Triggered when new telemetry data is received
+    GAME_PAUSED = auto()  # Triggered when the game is paused
+    GAME_RESUMED = auto()  # Triggered when the game resumes, carries the paused duration in seconds
@@ -0,0 +1,59 @@
+from src.domain.event.telemetry import telemetry_subscription_manager
+from src.domain.event.telemetry.telemetry_subscription_manager import (
+    SubscriptionOptions, TelemetrySubscriptionManager)
+from src.domain.model.telemetry_data import TelemetryData, TruckData
+
+
+class RecordingHandler:
+    def __init__(self):
+        self.calls = []
+
+    def handle_telemetry_data(self, telemetry_data, changed_fields=None):
+        self.calls.append((telemetry_data.truck.speed, changed_fields))
+
+
+def frame(speed):
+    return TelemetryData(truck=TruckData(speed=speed))
+
+
+def test_change_held_back_by_min_interval_is_delivered_once_it_has_passed(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr(telemetry_subscription_manager.time, "monotonic", lambda: clock[0])
+    manager = TelemetrySubscriptionManager()
+    handler = RecordingHandler()
+    manager.subscribe("truck.speed", handler, SubscriptionOptions(min_interval=1.0))
+
+    manager.notify_handlers(frame(50.0))
+    clock[0] = 100.2
+    # the truck stops just after a delivery and stays stopped
+    manager.notify_handlers(frame(0.0))
+    clock[0] = 100.6
+    manager.notify_handlers(frame(0.0))
+    assert handler.calls == [(50.0, ["truck.speed"])]
+
+    clock[0] = 101.1
+    manager.notify_handlers(frame(0.0))
+    assert handler.calls == [(50.0, ["truck.speed"]), (0.0, ["truck.speed"])]
+
+    clock[0] = 102.5
+    manager.notify_handlers(frame(0.0))
+    assert len(handler.calls) == 2
+
+
+def test_held_back_change_that_reverts_is_not_delivered(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr(telemetry_subscription_manager.time, "monotonic", lambda: clock[0])
+    manager = TelemetrySubscriptionManager()
+    handler = RecordingHandler()
+    manager.subscribe(
+        "truck.speed", handler, SubscriptionOptions(min_interval=1.0, deadband_abs=5.0)
+    )
+
+    manager.notify_handlers(frame(50.0))
+    clock[0] = 100.2
+    manager.notify_handlers(frame(60.0))
+    clock[0] = 100.4
+    manager.notify_handlers(frame(51.0))
+    clock[0] = 101.5
+    manager.notify_handlers(frame(51.0))
+    assert handler.calls == [(50.0, ["truck.speed"])]